@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Deque, Dict, Optional
+from config import ADMISSION
+from metrics import admission_seconds, admission_shed_total
+
+log = logging.getLogger(__name__)
+
+PRIORITIES = ('interactive', 'background')  # Ordem de atendimento
+
+class AdmissionRejected(Exception):
+    """Fila cheia ou espera acima do limite"""
+
+class AdmissionController:
+    """Controle de admissão na frente do banco
+    
+    O sqlite3 roda na thread do loop: num pico, cada interação a mais divide o mesmo loop
+    e todas ficam lentas juntas. Aqui só `slots` interações (ou tarefas de fundo) andam ao
+    mesmo tempo; as demais esperam numa fila limitada por prioridade e são descartadas se
+    a fila estiver cheia ou a espera passar de `max_wait` (um "tente de novo" rápido é
+    melhor que uma resposta depois do prazo de 3s do Discord). Vagas liberadas vão
+    primeiro para as interações, e as tarefas de fundo ocupam no máximo `background_slots`.
+    
+    O limite de vagas é adaptativo: cada interação concluída em até `target_latency` (desde
+    a chegada) o aumenta em 1/limite, como o controle de congestionamento do TCP; uma mais
+    lenta o reduz para o que cabe no alvo pela lei de Little, no máximo à metade e no máximo
+    uma vez por `target_latency`. Com o banco lento, menos interações dividem o loop e as
+    admitidas terminam no prazo. Durações acima de `outlier_latency` (uma rota do /admin
+    esquecida na lista de isentas, uma chamada à API travada) não dizem nada sobre o banco
+    e são ignoradas.
+    
+    A espera conta desde a chegada (`age`): com o loop ocupado, a fila de verdade é a de
+    tarefas prontas do asyncio, e uma interação que já chega atrasada sai sem tocar no banco.
+    """
+    
+    def __init__(self, slots: int = ADMISSION['slots'], min_slots: int = ADMISSION['min_slots'],
+                 target_latency: float = ADMISSION['target_latency'],
+                 outlier_latency: float = ADMISSION['outlier_latency'],
+                 background_slots: int = ADMISSION['background_slots'],
+                 queue_limits: Dict[str, int] = ADMISSION['queue_limits'],
+                 max_wait: Dict[str, Optional[float]] = ADMISSION['max_wait'],
+                 enabled: bool = ADMISSION['enabled']):
+        self.slots = slots
+        self.min_slots = min_slots
+        self.target_latency = target_latency
+        self.outlier_latency = outlier_latency
+        self.limit = float(slots)
+        self._last_decrease = 0.0
+        self.background_slots = background_slots
+        self.queue_limits = queue_limits
+        self.max_wait = max_wait
+        self.enabled = enabled
+        self.in_flight = {priority: 0 for priority in PRIORITIES}
+        self._queues: Dict[str, Deque[asyncio.Future]] = {priority: deque() for priority in PRIORITIES}
+    
+    def depth(self, priority: str) -> int:
+        return len(self._queues[priority])
+    
+    def _can_start(self, priority: str) -> bool:
+        if sum(self.in_flight.values()) >= int(self.limit):
+            return False
+        if priority == 'background':
+            return self.in_flight['background'] < self.background_slots and not self._queues['interactive']
+        return True
+    
+    def _wake(self):
+        for priority in PRIORITIES:
+            queue = self._queues[priority]
+            while queue and self._can_start(priority):
+                future = queue.popleft()
+                if not future.done():
+                    self.in_flight[priority] += 1
+                    future.set_result(None)
+    
+    def _shed(self, priority: str, reason: str) -> bool:
+        admission_shed_total.labels(priority, reason).inc()
+        log.debug("Admissão recusada (%s, %s)", priority, reason)
+        return False
+    
+    async def acquire(self, priority: str = 'interactive', age: float = 0.0) -> bool:
+        """Reserva uma vaga; False quando a tarefa foi descartada
+        
+        `age` é quanto a tarefa já esperou antes de chegar aqui (segundos desde a criação).
+        """
+        if not self.enabled:
+            return True
+        max_wait = self.max_wait[priority]
+        if max_wait is not None and age >= max_wait:
+            return self._shed(priority, 'late')
+        queue = self._queues[priority]
+        if not queue and self._can_start(priority):
+            self.in_flight[priority] += 1
+            admission_seconds.labels(priority).observe(0.0)
+            return True
+        if len(queue) >= self.queue_limits[priority]:
+            return self._shed(priority, 'queue_full')
+        
+        future = asyncio.get_running_loop().create_future()
+        queue.append(future)
+        started = time.perf_counter()
+        try:
+            done, _ = await asyncio.wait((future,), timeout=None if max_wait is None else max_wait - age)
+        except asyncio.CancelledError:
+            if future.done():
+                self.release(priority)
+            else:
+                queue.remove(future)
+                future.cancel()
+            raise
+        admission_seconds.labels(priority).observe(time.perf_counter() - started)
+        if not done:
+            queue.remove(future)
+            future.cancel()
+            return self._shed(priority, 'timeout')
+        return True
+    
+    def release(self, priority: str = 'interactive', seconds: Optional[float] = None):
+        """Devolve a vaga; `seconds` (tempo com a vaga) ajusta o limite"""
+        if not self.enabled:
+            return
+        self.in_flight[priority] -= 1
+        if seconds is not None:
+            self._adjust(seconds)
+        self._wake()
+    
+    def _adjust(self, seconds: float):
+        if seconds <= self.target_latency:
+            self.limit = min(self.slots, self.limit + 1 / self.limit)
+            return
+        if seconds > self.outlier_latency:
+            return
+        now = time.monotonic()
+        if now - self._last_decrease >= self.target_latency:
+            self._last_decrease = now
+            # Lei de Little: com a mesma vazão, quantas em andamento cabem no alvo
+            in_flight = sum(self.in_flight.values()) + 1
+            fits = in_flight * self.target_latency / seconds
+            self.limit = max(self.min_slots, self.limit / 2, min(self.limit, fits))
+    
+    @asynccontextmanager
+    async def slot(self, priority: str = 'background'):
+        """async with admission.slot(): ... (levanta AdmissionRejected se descartada)"""
+        if not await self.acquire(priority):
+            raise AdmissionRejected(priority)
+        try:
+            yield
+        finally:
+            self.release(priority)
+
+admission = AdmissionController()
@@ -0,0 +1,279 @@
+"""Micro-benchmarks de cada método público do Database em várias escalas de dados.
+
+Cada escala é um banco gerado por benchmarks.population. Os casos sorteiam usuários pela
+mesma atividade tipo Zipf e medem a chamada inteira (conexão, SQL e montagem do resultado).
+Métodos sem caso aparecem no relatório, então um método novo não passa despercebido.
+
+Os resultados entram no histórico (JSON) e são comparados com o baseline salvo: mediana
+acima de baseline * (1 + limite) é regressão, e o comando sai com código 1.
+
+Uso: python -m benchmarks.db_methods [--escalas 1000,10000,100000] [--metodos get_user,...]
+                                     [--iteracoes N] [--tempo S] [--limite 0.25] [--salvar-baseline]
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import os
+import platform
+import random
+import sqlite3
+import subprocess
+import tempfile
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.population import active_user, generate
+from database import Database
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+HISTORY_FILE = os.path.join(RESULTS_DIR, "db_methods_history.json")
+BASELINE_FILE = os.path.join(RESULTS_DIR, "db_methods_baseline.json")
+GUILDS = 200
+THROWAWAY_GUILD = 1_000_000  # Servidores criados só para o remove_guild
+
+class Context:
+    """Banco de uma escala e os ids que os casos sorteiam"""
+    
+    def __init__(self, db: Database, users: int, pool: int, seed: int):
+        self.db = db
+        self.users = users
+        self.rng = random.Random(seed)
+        self.next_user = users + 1
+        self.timestamp = int(time.time())
+        
+        conn = sqlite3.connect(db.db_path)
+        cursor = conn.cursor()
+        max_id = cursor.execute('SELECT MAX(id) FROM user_players').fetchone()[0] or 0
+        ids = [self.rng.randint(1, max_id) for _ in range(pool * 2)]
+        owned = cursor.execute(f'SELECT user_id, player_id FROM user_players WHERE id IN ({",".join("?" * len(ids))})',
+                               ids).fetchall()
+        self.owned_for_sale = owned[:len(owned) // 2]
+        self.owned = owned[len(owned) // 2:] or owned
+        self.player_ids = [row[0] for row in cursor.execute('SELECT player_id FROM players')]
+        self.matches = cursor.execute('SELECT match_id, challenger_id, challenged_id FROM matches '
+                                      'ORDER BY match_id DESC LIMIT ?', (pool,)).fetchall()
+        
+        # Itens válidos e baratos, para o buy_player percorrer a compra inteira
+        cursor.executemany('''
+            INSERT INTO shop (player_id, price, expires_at) VALUES (?, 1000, datetime('now', '+1 day'))
+        ''', [(self.rng.choice(self.player_ids),) for _ in range(pool)])
+        self.shop_items = [row[0] for row in cursor.execute(
+            'SELECT id FROM shop ORDER BY id DESC LIMIT ?', (pool,))]
+        
+        # Servidores descartáveis com 50 membros cada
+        self.throwaway_guilds = list(range(THROWAWAY_GUILD, THROWAWAY_GUILD + pool))
+        cursor.executemany('INSERT OR IGNORE INTO guild_members (guild_id, user_id) VALUES (?, ?)',
+                           [(guild, self.user()) for guild in self.throwaway_guilds for _ in range(50)])
+        conn.commit()
+        conn.close()
+    
+    def user(self) -> int:
+        return active_user(self.rng, self.users)
+    
+    def guild(self) -> int:
+        return active_user(self.rng, GUILDS)
+    
+    def new_user(self) -> int:
+        self.next_user += 1
+        return self.next_user
+    
+    def owned_player(self):
+        return self.rng.choice(self.owned) if self.owned else (self.user(), self.rng.choice(self.player_ids))
+    
+    def sale(self):
+        return self.owned_for_sale.pop() if self.owned_for_sale else self.owned_player()
+    
+    def match(self):
+        return self.rng.choice(self.matches)
+    
+    def snapshot(self) -> List:
+        self.timestamp += 3600
+        return [(category, self.user(), self.rng.randint(1, self.users), self.rng.random() * 100)
+                for category in ('overall', 'money', 'wins') for _ in range(100)]
+
+async def update_match_result(ctx: Context):
+    match_id, challenger, challenged = ctx.match()
+    return await ctx.db.update_match_result(match_id, ctx.rng.choice((challenger, challenged)),
+                                            ctx.rng.randint(80, 130), ctx.rng.randint(70, 129))
+
+async def create_team(ctx: Context):
+    user_id = ctx.new_user()
+    await ctx.db.create_user(user_id, f"user{user_id}")
+    return await ctx.db.create_team(user_id, f"Time {user_id}")
+
+async def update_player_starter_status(ctx: Context):
+    user_id, player_id = ctx.owned_player()
+    return await ctx.db.update_player_starter_status(user_id, player_id, False)
+
+# Ordem de execução: quem grava o histórico de rankings vem antes de quem o lê
+CASES = {
+    'bootstrap': lambda ctx: ctx.db.bootstrap(),
+    'get_user': lambda ctx: ctx.db.get_user(ctx.user()),
+    'create_user': lambda ctx: ctx.db.create_user(ctx.new_user(), "bench"),
+    'get_language_settings': lambda ctx: ctx.db.get_language_settings(ctx.user(), ctx.guild()),
+    'set_user_language': lambda ctx: ctx.db.set_user_language(ctx.user(), ctx.rng.choice((None, 'pt', 'en'))),
+    'set_server_language': lambda ctx: ctx.db.set_server_language(ctx.guild(), ctx.rng.choice(('pt', 'en'))),
+    'get_team': lambda ctx: ctx.db.get_team(ctx.user()),
+    'create_team': create_team,
+    'get_user_players': lambda ctx: ctx.db.get_user_players(ctx.user()),
+    'get_user_players_page': lambda ctx: ctx.db.get_user_players_page(ctx.user()),
+    'get_roster_summary': lambda ctx: ctx.db.get_roster_summary(ctx.user()),
+    'get_catalog': lambda ctx: ctx.db.get_catalog(),
+    'add_player_to_user': lambda ctx: ctx.db.add_player_to_user(ctx.user(), ctx.rng.choice(ctx.player_ids)),
+    'get_random_player': lambda ctx: ctx.db.get_random_player(),
+    'update_money': lambda ctx: ctx.db.update_money(ctx.user(), 100),
+    'update_player_starter_status': update_player_starter_status,
+    'sell_player': lambda ctx: ctx.db.sell_player(*ctx.sale()),
+    'update_last_free_pack': lambda ctx: ctx.db.update_last_free_pack(ctx.user()),
+    'update_last_daily': lambda ctx: ctx.db.update_last_daily(ctx.user()),
+    'get_shop_items': lambda ctx: ctx.db.get_shop_items(),
+    'get_shop_page': lambda ctx: ctx.db.get_shop_page(),
+    'buy_player': lambda ctx: ctx.db.buy_player(ctx.user(), ctx.shop_items.pop() if ctx.shop_items else 0),
+    'update_match_result': update_match_result,
+    'get_standings': lambda ctx: ctx.db.get_standings(),
+    'rebuild_team_stats': lambda ctx: ctx.db.rebuild_team_stats(),
+    'add_guild_member': lambda ctx: ctx.db.add_guild_member(ctx.guild(), ctx.user()),
+    'get_guild_members': lambda ctx: ctx.db.get_guild_members(ctx.guild()),
+    'remove_guild': lambda ctx: ctx.db.remove_guild(ctx.throwaway_guilds.pop() if ctx.throwaway_guilds else 0),
+    'get_command_fingerprint': lambda ctx: ctx.db.get_command_fingerprint("bench:global"),
+    'set_command_fingerprint': lambda ctx: ctx.db.set_command_fingerprint("bench:global", f"{ctx.rng.random()}"),
+    'record_ranking_snapshot': lambda ctx: ctx.db.record_ranking_snapshot(ctx.snapshot(), ctx.timestamp),
+    'get_ranks_at': lambda ctx: ctx.db.get_ranks_at('overall', ctx.timestamp),
+    'get_rank_history': lambda ctx: ctx.db.get_rank_history(ctx.user(), 'overall', 3600,
+                                                             ctx.timestamp - 7 * 86400, ctx.timestamp)
+}
+
+def public_methods() -> List[str]:
+    return [name for name, func in vars(Database).items()
+            if not name.startswith('_') and inspect.iscoroutinefunction(func)]
+
+def percentile(values: List[float], fraction: float) -> float:
+    return values[min(len(values) - 1, int(fraction * len(values)))]
+
+async def measure(ctx: Context, case, iterations: int, budget: float) -> Dict:
+    """Mediana, p95 e média em µs (para no limite de iterações ou de tempo)"""
+    await case(ctx)  # Aquecimento (cache de páginas do SQLite, imports tardios)
+    timings = []
+    deadline = time.perf_counter() + budget
+    while len(timings) < iterations and (len(timings) < 5 or time.perf_counter() < deadline):
+        start = time.perf_counter()
+        await case(ctx)
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    return {
+        'median_us': round(percentile(timings, 0.5), 1),
+        'p95_us': round(percentile(timings, 0.95), 1),
+        'mean_us': round(sum(timings) / len(timings), 1),
+        'iterations': len(timings)
+    }
+
+async def run_scale(users: int, methods: List[str], args) -> Dict[str, Dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        start = time.perf_counter()
+        generate(db_path, users=users, guilds=GUILDS, seed=args.semente, progress=None)
+        print(f"\n{users:,} usuários (gerado em {time.perf_counter() - start:.1f}s, "
+              f"{os.path.getsize(db_path) / 1024 / 1024:.0f} MB)")
+        
+        db = Database(db_path)
+        ctx = Context(db, users, args.iteracoes, args.semente)
+        results = {}
+        for name in methods:
+            results[name] = await measure(ctx, CASES[name], args.iteracoes, args.tempo)
+            print(f"  {name:<30} {results[name]['median_us']:>10.1f} µs  p95 {results[name]['p95_us']:>10.1f} µs"
+                  f"  ({results[name]['iterations']} chamadas)")
+        return results
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def load_json(path: str, default):
+    try:
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return default
+
+def save_json(path: str, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(data, file, ensure_ascii=False, indent=2)
+
+def compare(run: Dict, baseline: Dict, threshold: float) -> List[str]:
+    """Mostra as medianas que mudaram além do limite e retorna as regressões"""
+    regressions = []
+    print(f"\nComparação com o baseline de {baseline['timestamp']} ({baseline.get('commit') or '?'}), "
+          f"limite +{threshold:.0%}:")
+    for scale, results in run['results'].items():
+        for name, result in results.items():
+            reference = baseline['results'].get(scale, {}).get(name)
+            if not reference:
+                continue
+            change = result['median_us'] / reference['median_us'] - 1
+            flag = "REGRESSÃO" if change > threshold else ("melhora" if change < -threshold else "")
+            if flag:
+                print(f"  {scale:>8} {name:<30} {reference['median_us']:>10.1f} -> {result['median_us']:>10.1f} µs "
+                      f"({change:+.0%}) {flag}")
+            if change > threshold:
+                regressions.append(f"{scale}:{name}")
+    if not regressions:
+        print("  nenhuma regressão")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--escalas", default="1000,10000,100000", help="usuários por banco gerado")
+    parser.add_argument("--metodos", default="", help="só estes métodos (separados por vírgula)")
+    parser.add_argument("--iteracoes", type=int, default=200, help="chamadas por método (máximo)")
+    parser.add_argument("--tempo", type=float, default=2.0, help="segundos por método (máximo)")
+    parser.add_argument("--limite", type=float, default=0.25, help="piora da mediana que conta como regressão")
+    parser.add_argument("--historico", default=HISTORY_FILE)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--salvar-baseline", action="store_true", help="grava esta execução como baseline")
+    parser.add_argument("--semente", type=int, default=42)
+    args = parser.parse_args()
+    
+    available = public_methods()
+    missing = [name for name in available if name not in CASES]
+    if missing:
+        print(f"Métodos do Database sem caso de benchmark: {', '.join(missing)}")
+    methods = [name for name in CASES if name in available]
+    if args.metodos:
+        wanted = [name.strip() for name in args.metodos.split(',')]
+        unknown = [name for name in wanted if name not in CASES]
+        if unknown:
+            raise SystemExit(f"Sem caso de benchmark: {', '.join(unknown)}")
+        methods = [name for name in methods if name in wanted]
+    
+    run = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'sqlite': sqlite3.sqlite_version,
+        'results': {}
+    }
+    for scale in (int(value) for value in args.escalas.split(',')):
+        run['results'][str(scale)] = asyncio.run(run_scale(scale, methods, args))
+    
+    history = load_json(args.historico, [])
+    history.append(run)
+    save_json(args.historico, history)
+    print(f"\nResultado adicionado a {args.historico} ({len(history)} execuções)")
+    
+    baseline = load_json(args.baseline, None)
+    if args.salvar_baseline:
+        save_json(args.baseline, run)
+        print(f"Baseline salvo em {args.baseline}")
+    elif baseline is None:
+        print(f"Sem baseline em {args.baseline} (use --salvar-baseline)")
+    elif compare(run, baseline, args.limite):
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark dos perfis de gateway: memória e CPU para processar os eventos de 1000 servidores.
+
+Simula o que o Discord entrega em cada perfil: membros e presenças no GUILD_CREATE só
+chegam com as intents certas, e MESSAGE_CREATE só com guild_messages. Os eventos passam
+pelo ConnectionState do discord.py, como no bot de verdade (sem rede).
+
+Uso: python -m benchmarks.gateway_profiles [--servidores N] [--membros N] [--mensagens N]
+"""
+import argparse
+import time
+import tracemalloc
+
+import discord
+from discord.state import ConnectionState
+
+from config import GATEWAY_PROFILES
+from gateway_profile import client_options
+
+BOT_ID = 1
+TIMESTAMP = '2025-01-01T00:00:00+00:00'
+LARGE_THRESHOLD = 250  # Acima disso o Discord só manda membros via chunking
+
+def user_payload(user_id: int) -> dict:
+    return {'id': str(user_id), 'username': f"user{user_id}", 'discriminator': '0',
+            'global_name': f"Usuário {user_id}", 'avatar': None}
+
+def member_payload(user_id: int) -> dict:
+    return {'user': user_payload(user_id), 'roles': [], 'joined_at': TIMESTAMP, 'deaf': False, 'mute': False,
+            'flags': 0}
+
+def guild_payload(guild_id: int, members: int, intents: discord.Intents, chunk: bool) -> dict:
+    """GUILD_CREATE como o gateway entregaria para essas intents"""
+    user_ids = range(guild_id * 100_000, guild_id * 100_000 + members)
+    send_members = intents.members and (members <= LARGE_THRESHOLD or chunk)
+    return {
+        'id': str(guild_id),
+        'name': f"Servidor {guild_id}",
+        'owner_id': str(user_ids[0]),
+        'member_count': members + 1,
+        'large': members > LARGE_THRESHOLD,
+        'roles': [{'id': str(guild_id), 'name': '@everyone', 'permissions': '0', 'position': 0, 'color': 0,
+                   'hoist': False, 'managed': False, 'mentionable': False}],
+        'channels': [{'id': str(guild_id * 10 + 1), 'type': 0, 'name': 'geral', 'position': 0,
+                      'permission_overwrites': []}],
+        'emojis': [],
+        'stickers': [],
+        'features': [],
+        'threads': [],
+        'voice_states': [],
+        'stage_instances': [],
+        'guild_scheduled_events': [],
+        'members': [member_payload(BOT_ID)] + ([member_payload(user_id) for user_id in user_ids] if send_members else []),
+        'presences': [{'user': {'id': str(user_id)}, 'status': 'online', 'activities': [],
+                       'client_status': {'desktop': 'online'}} for user_id in user_ids] if intents.presences else []
+    }
+
+def message_payload(guild_id: int, message_id: int, author_id: int, intents: discord.Intents) -> dict:
+    return {
+        'id': str(message_id),
+        'channel_id': str(guild_id * 10 + 1),
+        'guild_id': str(guild_id),
+        'author': user_payload(author_id),
+        'member': {'roles': [], 'joined_at': TIMESTAMP, 'deaf': False, 'mute': False, 'flags': 0},
+        'content': "!loja" if intents.message_content else '',
+        'timestamp': TIMESTAMP,
+        'edited_timestamp': None,
+        'tts': False,
+        'mention_everyone': False,
+        'mentions': [],
+        'mention_roles': [],
+        'attachments': [],
+        'embeds': [],
+        'pinned': False,
+        'type': 0
+    }
+
+def build_events(options: dict, guilds: int, members: int, messages: int):
+    intents = options['intents']
+    guild_events = [guild_payload(guild_id, members, intents, options['chunk_guilds_at_startup'])
+                    for guild_id in range(1, guilds + 1)]
+    message_events = []
+    if intents.guild_messages:
+        for guild_id in range(1, guilds + 1):
+            for index in range(messages):
+                message_events.append(message_payload(guild_id, guild_id * 1000 + index,
+                                                       guild_id * 100_000 + index % max(members, 1), intents))
+    return guild_events, message_events
+
+def new_state(options: dict) -> ConnectionState:
+    state = ConnectionState(dispatch=lambda *args, **kwargs: None, handlers={}, hooks={}, http=None, **options)
+    state.user = discord.ClientUser(state=state, data={**user_payload(BOT_ID), 'bot': True})
+    return state
+
+def replay(options: dict, guild_events, message_events) -> ConnectionState:
+    state = new_state(options)
+    for data in guild_events:
+        state._add_guild_from_data(data)
+    for data in message_events:
+        state.parse_message_create(data)
+    return state
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--servidores", type=int, default=1000)
+    parser.add_argument("--membros", type=int, default=100, help="membros por servidor")
+    parser.add_argument("--mensagens", type=int, default=20, help="mensagens por servidor")
+    args = parser.parse_args()
+    scale = 1000 / args.servidores
+    
+    print(f"{args.servidores} servidores, {args.membros} membros e {args.mensagens} mensagens por servidor")
+    print(f"{'perfil':<10} {'intents':>10} {'membros':>9} {'mensagens':>10} {'MB/1k':>8} {'CPU ms/1k':>10}")
+    for profile in GATEWAY_PROFILES:
+        options = client_options(profile)
+        guild_events, message_events = build_events(options, args.servidores, args.membros, args.mensagens)
+        
+        start = time.process_time()
+        state = replay(options, guild_events, message_events)
+        cpu_ms = (time.process_time() - start) * 1000
+        cached_members = sum(len(guild._members) for guild in state._guilds.values())
+        cached_messages = len(state._messages or ())
+        del state
+        
+        # Memória retida pelo cache (medida à parte: o tracemalloc distorce o tempo)
+        tracemalloc.start()
+        state = replay(options, guild_events, message_events)
+        retained, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del state
+        
+        print(f"{profile:<10} {options['intents'].value:>10} {cached_members:>9} {cached_messages:>10} "
+              f"{retained * scale / 1024 / 1024:>8.1f} {cpu_ms * scale:>10.1f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Micro-benchmark do /ranking: consultas SQL do ranking antigo vs rankings em memória.
+
+Uso: python -m benchmarks.leaderboard [--times N] [--iteracoes N]
+"""
+import argparse
+import asyncio
+import os
+import random
+import sqlite3
+import tempfile
+import time
+
+from database import Database
+from leaderboard import Leaderboards
+
+# As três ordenações que o ranking fazia a cada /ranking e clique nos botões
+RANKING_QUERIES = [
+    '''
+    SELECT t.team_name, u.username,
+           (SELECT AVG(p.overall) FROM user_players up
+            JOIN players p ON up.player_id = p.player_id
+            WHERE up.user_id = u.user_id AND up.is_starter = 1) as avg_overall
+    FROM teams t
+    JOIN users u ON t.user_id = u.user_id
+    WHERE (SELECT COUNT(*) FROM user_players up WHERE up.user_id = u.user_id AND up.is_starter = 1) >= 5
+    ORDER BY avg_overall DESC
+    LIMIT 10
+    ''',
+    '''
+    SELECT t.team_name, u.username, u.money
+    FROM teams t JOIN users u ON t.user_id = u.user_id
+    ORDER BY u.money DESC LIMIT 10
+    ''',
+    '''
+    SELECT t.team_name, u.username, t.wins
+    FROM teams t JOIN users u ON t.user_id = u.user_id
+    ORDER BY t.wins DESC LIMIT 10
+    '''
+]
+
+def populate(db_path: str, teams: int):
+    """Cria times com 5 titulares, dinheiro e vitórias aleatórios"""
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    player_ids = [row[0] for row in cursor.execute('SELECT player_id FROM players')]
+    for user_id in range(1, teams + 1):
+        cursor.execute('INSERT INTO users (user_id, username, money) VALUES (?, ?, ?)',
+                       (user_id, f"user{user_id}", random.randint(0, 200_000)))
+        cursor.execute('INSERT INTO teams (user_id, team_name, wins) VALUES (?, ?, ?)',
+                       (user_id, f"Time {user_id}", random.randint(0, 500)))
+        cursor.executemany('INSERT INTO user_players (user_id, player_id, is_starter) VALUES (?, ?, 1)',
+                           [(user_id, player_id) for player_id in random.sample(player_ids, 5)])
+    conn.commit()
+    conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--times", type=int, default=5000)
+    parser.add_argument("--iteracoes", type=int, default=20)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench.db")
+        db = Database(db_path)
+        asyncio.run(db.bootstrap())
+        populate(db_path, args.times)
+        
+        conn = sqlite3.connect(db_path)
+        start = time.perf_counter()
+        for _ in range(args.iteracoes):
+            for query in RANKING_QUERIES:
+                conn.execute(query).fetchall()
+        sql_ms = (time.perf_counter() - start) / args.iteracoes * 1000
+        conn.close()
+        
+        boards = Leaderboards()
+        start = time.perf_counter()
+        boards.load(asyncio.run(db.get_standings()))
+        load_ms = (time.perf_counter() - start) * 1000
+    
+    lookups = args.iteracoes * 100
+    start = time.perf_counter()
+    for _ in range(lookups):
+        user_id = random.randint(1, args.times)
+        for category in Leaderboards.CATEGORIES:
+            boards.page(category, 0, 10)
+            boards.rank(category, user_id)
+    memory_us = (time.perf_counter() - start) / lookups * 1_000_000
+    
+    start = time.perf_counter()
+    for _ in range(lookups):
+        boards.boards['money'].update(random.randint(1, args.times), random.randint(0, 200_000))
+    update_us = (time.perf_counter() - start) / lookups * 1_000_000
+    
+    print(f"Times: {args.times}")
+    print(f"SQL (3 rankings, top 10):          {sql_ms:10.2f} ms")
+    print(f"Memória (3 rankings + posição):    {memory_us / 1000:10.4f} ms")
+    print(f"Atualização de um time:            {update_us:10.2f} µs")
+    print(f"Carga inicial dos rankings:        {load_ms:10.2f} ms")
+
+if __name__ == "__main__":
+    main()
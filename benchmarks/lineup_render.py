@@ -0,0 +1,61 @@
+"""Benchmark da imagem dos titulares: renderização fria vs cache em disco.
+
+Uso: python -m benchmarks.lineup_render [--escalacoes N] [--workers N]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+from database import Database
+from lineup_renderer import LineupRenderer
+
+async def timed_renders(renderer, lineups):
+    """Renderiza todas as escalações em paralelo e retorna as latências em ms"""
+    async def one(team_name, starters):
+        start = time.perf_counter()
+        await renderer.render(team_name, starters)
+        return (time.perf_counter() - start) * 1000
+    
+    return await asyncio.gather(*(one(name, starters) for name, starters in lineups))
+
+def report(label, latencies):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if len(latencies) > 1 else latencies[0]
+    print(f"{label:<6} p50: {statistics.median(latencies):8.2f} ms | p95: {p95:8.2f} ms | "
+          f"max: {latencies[-1]:8.2f} ms")
+
+async def run(args):
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "bench.db"))
+        await db.bootstrap()
+        catalog = await db.get_catalog()
+        
+        rng = random.Random(42)
+        lineups = [(f"Time {i}", rng.sample(catalog, 5)) for i in range(args.escalacoes)]
+        
+        renderer = LineupRenderer(os.path.join(tmp, "cache"), 64 * 1024 * 1024, args.workers)
+        if not renderer.available:
+            print("Pillow não está instalado; nada para medir.")
+            return
+        try:
+            # Aquece o pool para não medir a criação dos processos
+            await renderer.render("aquecimento", catalog[:5])
+            
+            report("Frio", await timed_renders(renderer, lineups))
+            report("Quente", await timed_renders(renderer, lineups))
+            print(f"Hits: {renderer.hits} | Misses: {renderer.misses}")
+        finally:
+            renderer.shutdown()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--escalacoes", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=2)
+    asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""Teste de carga: HoopCoreBot e os quatro cogs recebendo interações sintéticas (sem rede).
+
+As interações passam pelo mesmo caminho do bot de verdade (interaction_check da árvore,
+on_interaction, callbacks dos comandos e roteamento dos botões), mas as respostas vão para
+objetos falsos que só guardam o que seria enviado. A carga é de malha aberta: as interações
+chegam na taxa pedida mesmo que o bot atrase, e a latência conta a partir do horário previsto.
+Os usuários vêm de benchmarks.population e são sorteados pela mesma atividade tipo Zipf.
+
+Uso: python -m benchmarks.load [--usuarios N] [--servidores N] [--taxa N] [--duracao S]
+                               [--mix loja=30,comprar=10,pack=15,ranking=25,partida=20]
+                               [--latencia-api MS] [--semente N]
+                               [--falhas "*:latency=20,dist=lognormal;buy_player:lock=0.05"] [--travar-banco S]
+                               [--spam N] [--spammers N]
+
+--falhas liga o fault_injection durante a carga (mesmas regras do FAULT_INJECTION) e
+--travar-banco segura a trava exclusiva do arquivo por S segundos no meio da execução,
+para ver como as esperas e os "database is locked" se espalham pelas interações.
+
+--spam soma N interações/s de poucos usuários (--spammers) repetindo /pack, /ranking e
+lances de partida; as linhas spam:* mostram quanto o limite por usuário barrou.
+"""
+import argparse
+import asyncio
+import contextvars
+import logging
+import os
+import random
+import tempfile
+import time
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+import discord
+
+from admission import admission
+from benchmarks.population import active_user, generate
+from database import Database
+from fault_injection import fault_injector, parse_rules
+from leaderboard import GuildLeaderboards, leaderboards
+from loop_watchdog import loop_watchdog
+from main import COGS, HoopCoreBot
+from metrics import admission_shed_total, db_errors_total, db_faults_total, db_seconds
+from utils import LocaleResolver
+
+ACTIONS = ("loja", "comprar", "pack", "ranking", "partida")
+DEFAULT_MIX = "loja=30,comprar=10,pack=15,ranking=25,partida=20"
+RANKING_CATEGORIES = ("overall", "money", "wins")
+SPAM_ACTIONS = ("pack", "ranking", "partida")
+
+# Horário previsto (perf_counter) da interação da task atual: com o loop atrasado, a
+# interação "chegou" no horário previsto, como chegaria pelo gateway
+scheduled_at = contextvars.ContextVar('scheduled_at', default=None)
+
+class FakeUser:
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.name = f"user{user_id}"
+        self.display_name = f"Usuário {user_id}"
+        self.mention = f"<@{user_id}>"
+        self.bot = False
+        self.guild_permissions = discord.Permissions.none()
+
+class FakeGuild:
+    def __init__(self, guild_id: int):
+        self.id = guild_id
+        self.name = f"Servidor {guild_id}"
+
+class FakeResponse:
+    """interaction.response: guarda a última view enviada e simula a ida à API"""
+    
+    def __init__(self, interaction, api_latency: float):
+        self._interaction = interaction
+        self._api_latency = api_latency
+        self._done = False
+    
+    def is_done(self) -> bool:
+        return self._done
+    
+    async def _send(self, **kwargs):
+        if self._done:
+            raise discord.InteractionResponded(self._interaction)
+        self._done = True
+        self._interaction.record(kwargs)
+        if self._api_latency:
+            await asyncio.sleep(self._api_latency)
+    
+    async def defer(self, **kwargs):
+        await self._send()
+    
+    async def send_message(self, content=None, **kwargs):
+        await self._send(**kwargs)
+    
+    async def edit_message(self, **kwargs):
+        await self._send(**kwargs)
+
+class FakeFollowup:
+    def __init__(self, interaction, api_latency: float):
+        self._interaction = interaction
+        self._api_latency = api_latency
+    
+    async def send(self, content=None, **kwargs):
+        self._interaction.record(kwargs)
+        if self._api_latency:
+            await asyncio.sleep(self._api_latency)
+
+class FakeInteraction:
+    """O suficiente de discord.Interaction para os cogs e o roteamento de botões"""
+    
+    _next_id = 1
+    
+    def __init__(self, client, user_id: int, guild_id: int, api_latency: float, command=None,
+                 custom_id: str = None):
+        FakeInteraction._next_id += 1
+        self.id = FakeInteraction._next_id
+        self.client = client
+        self.user = FakeUser(user_id)
+        self.guild = FakeGuild(guild_id)
+        self.guild_id = guild_id
+        scheduled = scheduled_at.get()
+        late = time.perf_counter() - scheduled if scheduled is not None else 0.0
+        self.created_at = discord.utils.utcnow() - timedelta(seconds=max(late, 0.0))
+        self.locale = discord.Locale.brazil_portuguese
+        self.extras = {}
+        self.command = command
+        self.namespace = ()  # Pares (nome, valor), como o Namespace do discord.py
+        self.message = None
+        if custom_id is None:
+            self.type = discord.InteractionType.application_command
+            self.data = {}
+        else:
+            self.type = discord.InteractionType.component
+            self.data = {'custom_id': custom_id, 'component_type': 2}
+        self.response = FakeResponse(self, api_latency)
+        self.followup = FakeFollowup(self, api_latency)
+        self.view = None
+        self.shed = False  # Descartada pelo controle de admissão
+    
+    def record(self, kwargs):
+        if kwargs.get('view') is not None:
+            self.view = kwargs['view']
+
+class ErrorCounter(logging.Handler):
+    """Conta os erros que os handlers registram e engolem"""
+    
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.counts = Counter()
+    
+    def emit(self, record):
+        self.counts[record.getMessage()] += 1
+
+def parse_mix(text: str) -> dict:
+    mix = {}
+    for part in text.split(','):
+        name, _, weight = part.partition('=')
+        if name.strip() not in ACTIONS:
+            raise SystemExit(f"Ação desconhecida no mix: {name} (opções: {', '.join(ACTIONS)})")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+def guild_of(user_id: int, guilds: int) -> int:
+    return 1 + user_id % guilds
+
+async def build_bot(db_path: str) -> HoopCoreBot:
+    """Bot com banco temporário, cogs carregados e bootstrap completo (sem sincronizar comandos)"""
+    bot = HoopCoreBot()
+    bot.db = Database(db_path)
+    bot.locales = LocaleResolver(bot.db)
+    bot.guild_leaderboards = GuildLeaderboards(bot.db, leaderboards)
+    
+    async def skip_sync():
+        pass
+    bot.sync_commands = skip_sync
+    
+    admit = bot.admit
+    async def admit_and_mark(interaction):
+        arrived = await admit(interaction)
+        interaction.shed = arrived is None
+        return arrived
+    bot.admit = admit_and_mark
+    
+    await asyncio.gather(*(bot.load_extension(name) for name in COGS))
+    bot.cogs_loaded.set()
+    bot.bootstrap_task = asyncio.create_task(bot.bootstrap())
+    await bot.bootstrap_task
+    return bot
+
+async def run_command(bot: HoopCoreBot, interaction: FakeInteraction, **params):
+    """Comando slash pelo mesmo caminho da árvore: on_interaction, interaction_check, callback e conclusão"""
+    command = interaction.command
+    interaction.namespace = tuple(params.items())
+    await bot.on_interaction(interaction)
+    if not await bot.tree.interaction_check(interaction):
+        return
+    await command.callback(command.binding, interaction, **params)
+    await bot.on_app_command_completion(interaction, command)
+
+class LoadTest:
+    def __init__(self, bot: HoopCoreBot, args, rng: random.Random):
+        self.bot = bot
+        self.args = args
+        self.rng = rng
+        self.api_latency = args.latencia_api / 1000
+        self.latencies = defaultdict(list)
+        self.errors = Counter()
+        self.shed = Counter()
+        self.limited = Counter()
+        self.matches = {}  # usuário -> custom_ids dos botões da situação atual
+    
+    async def slash(self, name: str, user_id: int, **params):
+        command = self.bot.tree.get_command(name)
+        interaction = FakeInteraction(self.bot, user_id, guild_of(user_id, self.args.servidores),
+                                      self.api_latency, command=command)
+        await run_command(self.bot, interaction, **params)
+        return interaction
+    
+    async def click(self, custom_id: str, user_id: int):
+        interaction = FakeInteraction(self.bot, user_id, guild_of(user_id, self.args.servidores),
+                                      self.api_latency, custom_id=custom_id)
+        await self.bot.on_interaction(interaction)
+        return interaction
+    
+    async def loja(self, user_id: int):
+        return await self.slash("loja", user_id)
+    
+    async def comprar(self, user_id: int):
+        return await self.slash("comprar", user_id, numero=self.rng.randint(1, 6))
+    
+    async def pack(self, user_id: int):
+        return await self.slash("pack", user_id)
+    
+    async def ranking(self, user_id: int):
+        return await self.slash("ranking", user_id, categoria=self.rng.choice(RANKING_CATEGORIES),
+                         escopo=self.rng.choice(("guild", "global")))
+    
+    async def partida(self, user_id: int):
+        """Um clique na partida do usuário (começa uma nova quando não há botões)"""
+        buttons = self.matches.pop(user_id, None)
+        interaction = await self.click(self.rng.choice(buttons) if buttons else "start_match", user_id)
+        if interaction.view is not None:
+            custom_ids = [item.custom_id for item in interaction.view.children
+                          if getattr(item, 'custom_id', None) and item.custom_id.startswith("match_")]
+            if custom_ids:
+                self.matches[user_id] = custom_ids
+        elif buttons and interaction.shed:
+            self.matches[user_id] = buttons  # Descartado: tenta o mesmo lance depois
+        return interaction
+    
+    async def one(self, action: str, scheduled: float, spammer: int = None):
+        """Uma interação; as descartadas (admissão) e barradas (limite por usuário) contam à parte"""
+        label = f"spam:{action}" if spammer else action
+        user_id = spammer or active_user(self.rng, self.args.usuarios)
+        scheduled_at.set(scheduled)
+        try:
+            interaction = await getattr(self, action)(user_id)
+            if interaction.shed:
+                self.shed[label] += 1
+                return
+            if interaction.extras.get("rate_limited"):
+                self.limited[label] += 1
+                return
+        except Exception as error:
+            self.errors[f"{label}: {type(error).__name__}: {error}"] += 1
+        self.latencies[label].append(time.perf_counter() - scheduled)
+    
+    async def run(self, mix: dict) -> float:
+        actions, weights = list(mix), list(mix.values())
+        events = [(index / self.args.taxa, None) for index in range(int(self.args.taxa * self.args.duracao))]
+        if self.args.spam:
+            # Spammers entre os usuários menos ativos (o tráfego normal quase não os sorteia)
+            events += [(index / self.args.spam, self.args.usuarios - self.rng.randrange(self.args.spammers))
+                       for index in range(int(self.args.spam * self.args.duracao))]
+            events.sort(key=lambda event: event[0])
+        tasks = []
+        start = time.perf_counter()
+        for offset, spammer in events:
+            scheduled = start + offset
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            action = self.rng.choice(SPAM_ACTIONS) if spammer else self.rng.choices(actions, weights)[0]
+            tasks.append(asyncio.create_task(self.one(action, scheduled, spammer)))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+def percentile(values, fraction: float) -> float:
+    return values[min(len(values) - 1, int(fraction * len(values)))] if values else 0.0
+
+def db_totals():
+    """(chamadas, segundos) por método do Database e erros acumulados"""
+    calls = {labels[0]: (child.count, child.sum) for labels, child in db_seconds.children().items()}
+    errors = {labels[0]: child.value for labels, child in db_errors_total.children().items()}
+    return calls, errors
+
+def report(test: LoadTest, elapsed: float, before, after, lag: dict, logged: Counter):
+    completed = sum(len(values) for values in test.latencies.values())
+    shed = sum(test.shed.values())
+    limited = sum(test.limited.values())
+    print(f"{completed} interações em {elapsed:.1f}s: {completed / elapsed:.0f}/s "
+          f"(pedido {test.args.taxa + test.args.spam:.0f}/s), {shed} descartadas pelo controle de admissão, "
+          f"{limited} barradas pelo limite por usuário")
+    print()
+    print(f"{'ação':<14} {'ops':>7} {'erros':>6} {'desc.':>6} {'lim.':>6} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for action in sorted(set(test.latencies) | set(test.shed) | set(test.limited)):
+        values = sorted(test.latencies.get(action, []))
+        errors = sum(count for key, count in test.errors.items() if key.startswith(f"{action}:"))
+        print(f"{action:<14} {len(values):>7} {errors:>6} {test.shed[action]:>6} {test.limited[action]:>6} "
+              f"{percentile(values, 0.50) * 1000:>8.1f} {percentile(values, 0.95) * 1000:>8.1f} "
+              f"{percentile(values, 0.99) * 1000:>8.1f} {(values[-1] if values else 0) * 1000:>8.1f}")
+    
+    # O sqlite3 roda na thread do loop: o tempo no banco é tempo em que nada mais anda
+    (calls_before, errors_before), (calls_after, errors_after) = before, after
+    usage = []
+    for method, (count, seconds) in calls_after.items():
+        previous = calls_before.get(method, (0, 0.0))
+        if count > previous[0]:
+            usage.append((method, count - previous[0], seconds - previous[1]))
+    usage.sort(key=lambda row: -row[2])
+    db_time = sum(row[2] for row in usage)
+    db_errors = sum(errors_after.values()) - sum(errors_before.values())
+    print()
+    print(f"Banco: {sum(row[1] for row in usage)} chamadas, {db_time:.2f}s "
+          f"({db_time / elapsed:.0%} do tempo com o loop ocupado no SQLite), {db_errors:.0f} erros")
+    for method, count, seconds in usage[:8]:
+        print(f"  {method:<32} {count:>7} chamadas {seconds * 1000 / count:>8.2f} ms/chamada {seconds:>7.2f}s")
+    
+    faults = Counter()
+    for (method, kind), child in db_faults_total.children().items():
+        faults[kind] += child.value
+    if faults:
+        print("  Falhas injetadas: " + ", ".join(f"{kind} {count:.0f}" for kind, count in faults.most_common()))
+    
+    shed_reasons = Counter()
+    for (priority, reason), child in admission_shed_total.children().items():
+        shed_reasons[reason] += child.value
+    if shed_reasons:
+        print()
+        print(f"Admissão: limite final {admission.limit:.0f} vagas, descartes: "
+              + ", ".join(f"{reason} {count:.0f}" for reason, count in shed_reasons.most_common()))
+    
+    print()
+    print(f"Loop: atraso p50 {lag['p50'] * 1000:.1f} ms, p99 {lag['p99'] * 1000:.1f} ms, "
+          f"max {lag['max'] * 1000:.1f} ms, {lag['blocks']} bloqueios acima de {lag['threshold'] * 1000:.0f} ms")
+    for site in lag['sites']:
+        print(f"  {site['count']:>5}x {site['seconds'] * 1000:>8.0f} ms  {site['site']}")
+    
+    if test.errors or logged:
+        print()
+        print("Erros:")
+        for message, count in (test.errors + logged).most_common(10):
+            print(f"  {count:>5}x {message}")
+
+async def run(args):
+    rng = random.Random(args.semente)
+    mix = parse_mix(args.mix)
+    
+    logged = ErrorCounter()
+    logging.getLogger().addHandler(logged)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "load.db")
+        bot = await build_bot(db_path)
+        generate(db_path, users=args.usuarios, guilds=args.servidores, seed=args.semente, progress=None)
+        leaderboards.load(await bot.db.get_standings())
+        print(f"{args.usuarios} usuários em {args.servidores} servidores, {args.taxa:.0f} interações/s "
+              f"por {args.duracao:.0f}s, latência da API {args.latencia_api:.0f} ms, mix {args.mix}")
+        
+        test = LoadTest(bot, args, rng)
+        fault_injector.configure(args.falhas)
+        if args.travar_banco:
+            async def hold_lock():
+                await asyncio.sleep(args.duracao / 2)
+                await asyncio.to_thread(fault_injector.hold_lock, db_path, args.travar_banco)
+            holder = asyncio.create_task(hold_lock())
+        loop_watchdog.start()
+        before = db_totals()
+        elapsed = await test.run(mix)
+        after = db_totals()
+        loop_watchdog.stop()
+        fault_injector.clear()
+        if args.travar_banco:
+            await holder
+        report(test, elapsed, before, after, loop_watchdog.stats(), logged.counts)
+        await bot.close()
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, default=5000)
+    parser.add_argument("--servidores", type=int, default=50)
+    parser.add_argument("--taxa", type=float, default=200, help="interações por segundo")
+    parser.add_argument("--duracao", type=float, default=10, help="segundos")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help="peso de cada ação")
+    parser.add_argument("--latencia-api", type=float, default=0, help="ms simulados em cada resposta ao Discord")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--falhas", default="", help="regras de injeção de falhas no banco")
+    parser.add_argument("--travar-banco", type=float, default=0, help="segundos de trava exclusiva no meio da carga")
+    parser.add_argument("--spam", type=float, default=0, help="interações/s extras vindas dos spammers")
+    parser.add_argument("--spammers", type=int, default=3, help="usuários que fazem o spam")
+    args = parser.parse_args()
+    try:
+        parse_rules(args.falhas)
+    except ValueError as error:
+        raise SystemExit(f"--falhas: {error}")
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
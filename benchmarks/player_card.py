@@ -0,0 +1,47 @@
+"""Micro-benchmark do card de jogador: montagem direta vs cache de payloads.
+
+Uso: python -m benchmarks.player_card [--iteracoes N]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+from database import Database
+from utils import EmbedBuilder, PlayerCardCache
+from config import LANGUAGES
+
+def measure(func, catalog, iterations: int) -> float:
+    """Retorna o tempo médio (em microssegundos) por card"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for player in catalog:
+            for language in LANGUAGES:
+                func(player, True, language)
+    elapsed = time.perf_counter() - start
+    return elapsed / (iterations * len(catalog) * len(LANGUAGES)) * 1_000_000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--iteracoes", type=int, default=200)
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db = Database(os.path.join(tmp, "bench.db"))
+        asyncio.run(db.bootstrap())
+        catalog = asyncio.run(db.get_catalog())
+    
+    cache = PlayerCardCache()
+    cache.warm(catalog)
+    
+    before = measure(EmbedBuilder.build_player_card, catalog, args.iteracoes)
+    after = measure(lambda p, d, l: cache.get(p, d, l), catalog, args.iteracoes)
+    
+    print(f"Jogadores no catálogo: {len(catalog)} | Cards em cache: {len(cache)}")
+    print(f"Sem cache: {before:8.2f} µs/card")
+    print(f"Com cache: {after:8.2f} µs/card")
+    print(f"Ganho:     {before / after:8.2f}x")
+
+if __name__ == "__main__":
+    main()
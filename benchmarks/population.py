@@ -0,0 +1,249 @@
+"""Gerador de população sintética: enche um SQLite com milhões de linhas realistas.
+
+Distribuições:
+- atividade tipo Zipf: o usuário de id k joga com frequência proporcional a 1/k
+  (poucos usuários muito ativos, cauda longa de quase inativos);
+- elencos com tamanho log-normal (a maioria pequena, alguns colecionadores enormes);
+- cartas sorteadas por raridade com as chances de config.RARITIES;
+- partidas entre usuários sorteados pela atividade, vitórias e derrotas coerentes com elas.
+
+As inserções são em streaming (executemany com geradores) numa transação por tabela,
+com journal e sync desligados e os triggers e índices recriados só no fim.
+
+Uso: python -m benchmarks.population arquivo.db [--usuarios N] [--elenco N] [--partidas-por-usuario N]
+                                                [--loja N] [--servidores N] [--catalogo N] [--semente N]
+Em código: generate(db_path, users=..., ...) retorna as linhas criadas por tabela.
+"""
+import argparse
+import math
+import os
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional
+
+from config import ECONOMY, RARITIES
+from database import Database
+
+POSITIONS = ("PG", "SG", "SF", "PF", "C")
+OVERALL_RANGES = {'comum': (70, 79), 'raro': (80, 86), 'épico': (86, 91), 'lendário': (92, 97)}
+MAX_ROSTER = 500
+TIMESTAMP_POOL = 4096  # Horários pré-formatados (formatar um por linha custa mais que inserir)
+
+def active_user(rng: random.Random, users: int) -> int:
+    """Usuário sorteado pela atividade: P(k) proporcional a 1/k (Zipf com s=1)"""
+    return min(users, int(users ** rng.random()))
+
+def _timestamps(rng: random.Random, days: int) -> list:
+    now = datetime.now()
+    return [(now - timedelta(seconds=rng.uniform(0, days * 86400))).strftime('%Y-%m-%d %H:%M:%S')
+            for _ in range(TIMESTAMP_POOL)]
+
+def _drop_derived(cursor) -> list:
+    """Remove triggers e índices (recriados por init_database) para a carga em massa"""
+    derived = cursor.execute('''
+        SELECT type, name FROM sqlite_master WHERE type IN ('trigger', 'index') AND sql IS NOT NULL
+    ''').fetchall()
+    for kind, name in derived:
+        cursor.execute(f'DROP {kind.upper()} IF EXISTS "{name}"')
+    return derived
+
+def generate(db_path: str, users: int = 100_000, roster: float = 12, team_ratio: float = 0.8,
+             matches_per_user: float = 2, shop: int = 1000, guilds: int = 0, catalog: int = 0,
+             days: int = 180, seed: int = 42,
+             progress: Optional[Callable[[str], None]] = print) -> Dict[str, int]:
+    """Gera a população em db_path (cria o esquema se preciso) e retorna as linhas por tabela
+    
+    `roster` é o tamanho médio dos elencos; `guilds` > 0 também preenche guild_members;
+    `catalog` adiciona jogadores sintéticos ao catálogo real.
+    """
+    rng = random.Random(seed)
+    db = Database(db_path)
+    db._bootstrap()
+    
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    cursor.execute('PRAGMA journal_mode = OFF')
+    cursor.execute('PRAGMA synchronous = OFF')
+    cursor.execute('PRAGMA cache_size = -262144')  # 256 MB
+    cursor.execute('PRAGMA temp_store = MEMORY')
+    _drop_derived(cursor)
+    
+    stamps = _timestamps(rng, days)
+    counts = {}
+    
+    def insert(table: str, sql: str, rows):
+        start = time.perf_counter()
+        cursor.execute('BEGIN')
+        cursor.executemany(sql, rows)
+        conn.commit()
+        counts[table] = counts.get(table, 0) + cursor.rowcount
+        elapsed = time.perf_counter() - start
+        if progress:
+            progress(f"{table:<14} {cursor.rowcount:>11,} linhas em {elapsed:6.1f}s "
+                     f"({cursor.rowcount / max(elapsed, 1e-9):,.0f}/s)")
+    
+    # Catálogo sintético, com raridades nas proporções de RARITIES
+    if catalog:
+        rarities = list(RARITIES)
+        weights = [RARITIES[rarity]['chance'] for rarity in rarities]
+        
+        def catalog_rows():
+            for index in range(catalog):
+                rarity = rng.choices(rarities, weights)[0]
+                overall = rng.randint(*OVERALL_RANGES[rarity])
+                value = int(5_000_000 * RARITIES[rarity]['multiplier'] * rng.uniform(0.8, 1.2))
+                yield (f"Jogador Sintético {index + 1}", overall, f"{rng.uniform(1.80, 2.20):.2f}m",
+                       "Time Sintético", rarity, value, rng.choice(POSITIONS))
+        
+        insert('players', '''
+            INSERT INTO players (name, overall, height, team, rarity, market_value, position)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        ''', catalog_rows())
+    
+    by_rarity = {}
+    for player_id, rarity in cursor.execute('SELECT player_id, rarity FROM players'):
+        by_rarity.setdefault(rarity, []).append(player_id)
+    rarities = [rarity for rarity in RARITIES if rarity in by_rarity]
+    weights = [RARITIES[rarity]['chance'] for rarity in rarities]
+    
+    # Usuários: quem tem time fica marcado para elencos e partidas
+    has_team = bytearray(users + 1)
+    languages = (None,) * 8 + ('pt', 'en', 'es')
+    
+    def user_rows():
+        for user_id in range(1, users + 1):
+            has_team[user_id] = rng.random() < team_ratio
+            money = int(ECONOMY['starting_money'] * rng.lognormvariate(0, 1.2))
+            active = user_id <= users // 10
+            yield (user_id, f"user{user_id}", money, rng.choice(languages), rng.choice(stamps),
+                   rng.choice(stamps) if active else None, rng.choice(stamps) if active else None)
+    
+    insert('users', '''
+        INSERT INTO users (user_id, username, money, language, created_at, last_daily, last_free_pack)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    ''', user_rows())
+    
+    # Elencos log-normais; os 5 primeiros são titulares
+    sigma = 1.0
+    mu = math.log(max(roster, 1)) - sigma * sigma / 2
+    
+    def user_player_rows():
+        for user_id in range(1, users + 1):
+            if not has_team[user_id]:
+                continue
+            size = min(MAX_ROSTER, max(1, int(rng.lognormvariate(mu, sigma))))
+            for index, rarity in enumerate(rng.choices(rarities, weights, k=size)):
+                yield (user_id, rng.choice(by_rarity[rarity]), index < 5, rng.choice(stamps))
+    
+    insert('user_players', '''
+        INSERT INTO user_players (user_id, player_id, is_starter, acquired_at) VALUES (?, ?, ?, ?)
+    ''', user_player_rows())
+    
+    # Partidas entre usuários com time, sorteados pela atividade
+    wins, losses = {}, {}
+    
+    def match_rows():
+        for _ in range(int(users * team_ratio * matches_per_user)):
+            challenger = active_user(rng, users)
+            challenged = active_user(rng, users)
+            if challenger == challenged or not (has_team[challenger] and has_team[challenged]):
+                continue
+            created_at = rng.choice(stamps)
+            if rng.random() < 0.02:
+                yield (challenger, challenged, 'pending', None, 0, 0, created_at, None)
+                continue
+            scores = sorted((rng.randint(80, 130), rng.randint(70, 129)), reverse=True)
+            winner, loser = (challenger, challenged) if rng.random() < 0.5 else (challenged, challenger)
+            wins[winner] = wins.get(winner, 0) + 1
+            losses[loser] = losses.get(loser, 0) + 1
+            challenger_score, challenged_score = scores if winner == challenger else scores[::-1]
+            yield (challenger, challenged, 'completed', winner, challenger_score, challenged_score,
+                   created_at, created_at)
+    
+    insert('matches', '''
+        INSERT INTO matches (challenger_id, challenged_id, status, winner_id, challenger_score,
+                             challenged_score, created_at, ended_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    ''', match_rows())
+    
+    def team_rows():
+        for user_id in range(1, users + 1):
+            if has_team[user_id]:
+                yield (user_id, f"Time {user_id}", wins.get(user_id, 0), losses.get(user_id, 0),
+                       rng.choice(stamps))
+    
+    insert('teams', '''
+        INSERT INTO teams (user_id, team_name, wins, losses, created_at) VALUES (?, ?, ?, ?, ?)
+    ''', team_rows())
+    
+    # Loja: a maior parte já expirada (a limpeza do refresh_shop também precisa de volume)
+    if shop:
+        player_ids = [player_id for ids in by_rarity.values() for player_id in ids]
+        now = datetime.now()
+        
+        def shop_rows():
+            for _ in range(shop):
+                expires_at = now + timedelta(minutes=rng.uniform(-7 * 1440, 10) if rng.random() < 0.9
+                                             else rng.uniform(0, 10))
+                yield (rng.choice(player_ids), rng.randint(1_000_000, 60_000_000), expires_at)
+        
+        insert('shop', 'INSERT INTO shop (player_id, price, expires_at) VALUES (?, ?, ?)', shop_rows())
+    
+    # Servidores também sorteados pela atividade: poucos enormes, muitos pequenos
+    if guilds:
+        def guild_member_rows():
+            for user_id in range(1, users + 1):
+                if not has_team[user_id]:
+                    continue
+                joined = {active_user(rng, guilds) for _ in range(1 + int(rng.expovariate(1.0)))}
+                for guild in joined:
+                    yield (guild, user_id, rng.choice(stamps))
+        
+        insert('guild_members', '''
+            INSERT INTO guild_members (guild_id, user_id, joined_at) VALUES (?, ?, ?)
+        ''', guild_member_rows())
+    
+    # Triggers, índices e team_stats voltam como o bot os mantém
+    start = time.perf_counter()
+    db.init_database()
+    cursor.execute('BEGIN')
+    counts['team_stats'] = db._rebuild_team_stats(cursor)
+    conn.commit()
+    cursor.execute('ANALYZE')
+    conn.close()
+    if progress:
+        progress(f"{'índices':<14} {counts['team_stats']:>11,} times    em {time.perf_counter() - start:6.1f}s")
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("arquivo", help="arquivo SQLite a criar")
+    parser.add_argument("--usuarios", type=int, default=1_000_000)
+    parser.add_argument("--elenco", type=float, default=12, help="tamanho médio dos elencos")
+    parser.add_argument("--com-time", type=float, default=0.8, help="fração de usuários com time")
+    parser.add_argument("--partidas-por-usuario", type=float, default=2)
+    parser.add_argument("--loja", type=int, default=1000, help="itens na loja (90%% expirados)")
+    parser.add_argument("--servidores", type=int, default=0)
+    parser.add_argument("--catalogo", type=int, default=0, help="jogadores sintéticos além do catálogo real")
+    parser.add_argument("--dias", type=int, default=180, help="período coberto pelas datas")
+    parser.add_argument("--semente", type=int, default=42)
+    parser.add_argument("--substituir", action="store_true", help="apaga o arquivo se já existir")
+    args = parser.parse_args()
+    
+    if os.path.exists(args.arquivo):
+        if not args.substituir:
+            raise SystemExit(f"{args.arquivo} já existe (use --substituir)")
+        os.remove(args.arquivo)
+    
+    start = time.perf_counter()
+    counts = generate(args.arquivo, users=args.usuarios, roster=args.elenco, team_ratio=args.com_time,
+                      matches_per_user=args.partidas_por_usuario, shop=args.loja, guilds=args.servidores,
+                      catalog=args.catalogo, days=args.dias, seed=args.semente)
+    total = sum(counts.values())
+    print(f"{total:,} linhas em {time.perf_counter() - start:.1f}s, "
+          f"{os.path.getsize(args.arquivo) / 1024 / 1024:.0f} MB")
+
+if __name__ == "__main__":
+    main()
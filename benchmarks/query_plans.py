@@ -0,0 +1,122 @@
+"""Checagem dos planos de consulta: nenhum comando quente pode varrer tabela grande.
+
+Roda os casos de benchmarks.db_methods num banco gerado por benchmarks.population e
+captura cada comando SQL que os métodos do Database executam (Database.trace_sql). Cada
+comando passa por EXPLAIN QUERY PLAN e é reprovado se:
+- fizer SCAN de uma tabela grande (a consulta deveria usar um índice);
+- usar uma B-tree temporária para ORDER BY/GROUP BY/DISTINCT numa tabela grande
+  (um índice deveria entregar a ordem).
+Varreduras inerentes ao método (ex: get_standings lê todos os times) ficam em ALLOWED.
+
+Sai com código 1 se algum plano for reprovado, então serve de portão antes de um release.
+
+Uso: python -m benchmarks.query_plans [--usuarios N] [--verbose]
+"""
+import argparse
+import asyncio
+import os
+import re
+import sqlite3
+import tempfile
+from typing import Dict, List, Set, Tuple
+
+from benchmarks.db_methods import CASES, Context, GUILDS
+from benchmarks.population import generate
+from database import Database
+
+# Tabelas que crescem com o número de usuários
+LARGE_TABLES = {'users', 'teams', 'user_players', 'matches', 'team_stats', 'guild_members', 'ranking_history'}
+
+# (método, tabela) -> por que a varredura é esperada
+ALLOWED = {
+    ('get_standings', 'teams'): "carga completa dos rankings em memória",
+    ('rebuild_team_stats', 'user_players'): "recalcula todos os times",
+    ('get_ranks_at', 'ranking_history'): "posição de todos os times num instante"
+}
+
+SKIP = re.compile(r"^\s*(PRAGMA|BEGIN|COMMIT|ROLLBACK|CREATE|DROP|ANALYZE)", re.IGNORECASE)
+ACCESS = re.compile(r"^(SCAN|SEARCH) (\w+)")
+TEMP_BTREE = re.compile(r"USE TEMP B-TREE FOR (ORDER BY|GROUP BY|DISTINCT)")
+ALIAS = re.compile(r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+AS)?\s+(\w+)", re.IGNORECASE)
+KEYWORDS = {'on', 'where', 'join', 'left', 'inner', 'cross', 'group', 'order', 'limit', 'using'}
+
+def normalize(sql: str) -> str:
+    """Comando sem literais, para agrupar as execuções do mesmo SQL"""
+    sql = re.sub(r"'(?:[^']|'')*'", "?", sql)
+    sql = re.sub(r"\b\d+(\.\d+)?\b", "?", sql)
+    return re.sub(r"\s+", " ", sql).strip()
+
+def plan(conn: sqlite3.Connection, sql: str) -> List[str]:
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+
+def problems(sql: str, details: List[str]) -> List[Tuple[str, str]]:
+    """(tabela, linha do plano) de cada varredura ou ordenação temporária em tabela grande
+    
+    A ordenação só conta quando a tabela grande foi lida sem limite (SCAN ou faixa de
+    valores): ordenar o elenco de um usuário encontrado pela chave é barato.
+    """
+    aliases = {alias: table for table, alias in ALIAS.findall(sql) if alias.lower() not in KEYWORDS}
+    
+    found = []
+    unbounded = None  # Última tabela grande lida sem limite
+    for detail in details:
+        access = ACCESS.match(detail)
+        if access:
+            table = aliases.get(access.group(2), access.group(2))
+            if table in LARGE_TABLES and (access.group(1) == 'SCAN' or '>' in detail or '<' in detail):
+                unbounded = table
+                if access.group(1) == 'SCAN':
+                    found.append((table, detail))
+        elif TEMP_BTREE.search(detail) and unbounded:
+            found.append((unbounded, detail))
+    return found
+
+async def capture(db_path: str, users: int, iterations: int) -> Dict[str, Dict[str, str]]:
+    """método -> {comando normalizado: um exemplo com valores}"""
+    db = Database(db_path)
+    ctx = Context(db, users, iterations, seed=42)
+    statements: Dict[str, Dict[str, str]] = {}
+    for name, case in CASES.items():
+        seen = statements.setdefault(name, {})
+        db.trace_sql = lambda sql: None if SKIP.match(sql) else seen.setdefault(normalize(sql), sql)
+        for _ in range(iterations):
+            await case(ctx)
+    db.trace_sql = None
+    return statements
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, default=20_000)
+    parser.add_argument("--iteracoes", type=int, default=3, help="chamadas por método (variam os caminhos)")
+    parser.add_argument("--verbose", action="store_true", help="mostra o plano de todos os comandos")
+    args = parser.parse_args()
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "plans.db")
+        generate(db_path, users=args.usuarios, guilds=GUILDS, progress=None)
+        statements = asyncio.run(capture(db_path, args.usuarios, args.iteracoes))
+        
+        conn = sqlite3.connect(db_path)
+        failures = 0
+        checked: Set[str] = set()
+        for method, commands in statements.items():
+            for normalized, sql in commands.items():
+                details = plan(conn, sql)
+                found = [(table, detail) for table, detail in problems(sql, details)
+                         if (method, table) not in ALLOWED]
+                if normalized in checked and not found:
+                    continue
+                checked.add(normalized)
+                if found or args.verbose:
+                    print(f"{'REPROVADO' if found else 'ok':<9} {method}: {normalized[:160]}")
+                    for detail in details:
+                        print(f"          {detail}")
+                failures += bool(found)
+        conn.close()
+    
+    print(f"\n{len(checked)} comandos de {len(statements)} métodos, {failures} reprovados")
+    if failures:
+        raise SystemExit(1)
+
+if __name__ == "__main__":
+    main()
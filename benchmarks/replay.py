@@ -0,0 +1,241 @@
+"""Replay do tráfego capturado (TRAFFIC_CAPTURE) contra uma cópia do banco.
+
+Lê o arquivo gravado pelo traffic_capture e reproduz cada interação no mesmo ritmo
+(ou mais rápido, com --velocidade) pelos cogs, com a camada falsa do benchmarks.load.
+O banco é uma cópia (backup do SQLite, seguro com o bot rodando) ou, sem --banco,
+uma população gerada pelo benchmarks.population.
+
+Os usuários aparecem só como hash. Com --sal igual ao TRAFFIC_SALT da captura, cada hash
+volta a ser o usuário real da cópia; sem ele, os hashes mais frequentes ficam com os
+usuários que têm time.
+
+O relatório compara a latência gravada em produção com a do replay, por rota. Com --saida
+o resumo vira JSON; com --comparar, a execução é comparada com um resumo anterior
+(ex: mesma captura no release anterior).
+
+Uso: python -m benchmarks.replay logs/traffic.jsonl [--banco hoopcore.db] [--sal SAL]
+                                 [--velocidade 1] [--limite N] [--saida resumo.json] [--comparar base.json]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List
+
+from benchmarks.load import ErrorCounter, FakeInteraction, FakeUser, build_bot, percentile, run_command, scheduled_at
+from benchmarks.population import generate
+from leaderboard import leaderboards
+from metrics import component_route
+from traffic_capture import TrafficRecorder
+
+HASHED_ID = re.compile(r"~([0-9a-f]{16})")
+
+def read_events(paths: List[str], limit: int) -> List[Dict]:
+    events = []
+    for path in paths:
+        with open(path, encoding='utf-8') as capture:
+            for line in capture:
+                line = line.strip()
+                if line:
+                    events.append(json.loads(line))
+    events.sort(key=lambda event: event['t'])
+    return events[:limit] if limit else events
+
+def copy_database(source: str, target: str):
+    """Cópia consistente mesmo com o bot gravando no original"""
+    src = sqlite3.connect(f"file:{source}?mode=ro", uri=True)
+    dst = sqlite3.connect(target)
+    src.backup(dst)
+    dst.close()
+    src.close()
+
+def map_users(events: List[Dict], db_path: str, salt: str) -> Dict[str, int]:
+    """hash -> user_id da cópia (pelo sal da captura ou pela frequência)"""
+    hashes = Counter(event['u'] for event in events)
+    for event in events:
+        hashes.update(HASHED_ID.findall(event['r']))
+        # Usuários passados como argumento (ex: /desafiar jogador)
+        hashes.update(value['id'] for value in event.get('a', {}).values()
+                      if isinstance(value, dict) and 'id' in value)
+    conn = sqlite3.connect(db_path)
+    owners = [row[0] for row in conn.execute('SELECT user_id FROM teams ORDER BY user_id')]
+    others = [row[0] for row in conn.execute(
+        'SELECT user_id FROM users WHERE user_id NOT IN (SELECT user_id FROM teams) ORDER BY user_id')]
+    conn.close()
+    
+    mapping = {}
+    if salt:
+        recorder = TrafficRecorder(salt=salt)
+        known = {recorder.hash_id(user_id): user_id for user_id in owners + others}
+        mapping = {value: known[value] for value in hashes if value in known}
+    free = [user_id for user_id in owners + others if user_id not in set(mapping.values())]
+    next_id = max(owners + others, default=0) + 1
+    for value, _ in hashes.most_common():
+        if value not in mapping:
+            if free:
+                mapping[value] = free.pop(0)
+            else:
+                mapping[value] = next_id
+                next_id += 1
+    return mapping
+
+class Replay:
+    def __init__(self, bot, users: Dict[str, int], api_latency: float):
+        self.bot = bot
+        self.users = users
+        self.guilds: Dict[str, int] = {}
+        self.api_latency = api_latency
+        self.latencies = defaultdict(list)
+        self.recorded = defaultdict(list)
+        self.errors = Counter()
+        self.skipped = Counter()
+    
+    def route(self, event: Dict) -> str:
+        return f"/{event['r']}" if event['k'] == 'c' else component_route(event['r'])
+    
+    def argument(self, value):
+        if isinstance(value, dict):
+            if 'id' in value:
+                return FakeUser(self.users.get(value['id'], 0))
+            if 'len' in value:
+                return 'x' * value['len']
+            return None
+        return value
+    
+    def interaction(self, event: Dict, **kwargs) -> FakeInteraction:
+        guild_id = self.guilds.setdefault(event.get('g'), len(self.guilds) + 1) if event.get('g') else None
+        interaction = FakeInteraction(self.bot, self.users[event['u']], guild_id, self.api_latency, **kwargs)
+        if not guild_id:
+            interaction.guild = None
+        return interaction
+    
+    async def one(self, event: Dict, scheduled: float):
+        route = self.route(event)
+        scheduled_at.set(scheduled)
+        try:
+            if event['k'] == 'c':
+                command = self.bot.tree.get_command(event['r'])
+                if command is None:
+                    self.skipped[route] += 1
+                    return
+                params = {name: self.argument(value) for name, value in event.get('a', {}).items()}
+                await run_command(self.bot, self.interaction(event, command=command), **params)
+            else:
+                custom_id = HASHED_ID.sub(lambda match: str(self.users.get(match.group(1), 0)), event['r'])
+                interaction = self.interaction(event, custom_id=custom_id)
+                if event['k'] == 'm':
+                    interaction.data = {'custom_id': custom_id, 'component_type': 3,
+                                        'values': event.get('a', {}).get('values', [])}
+                await self.bot.on_interaction(interaction)
+        except Exception as error:
+            self.errors[f"{route}: {type(error).__name__}: {error}"] += 1
+        self.latencies[route].append(time.perf_counter() - scheduled)
+        self.recorded[route].append(event['d'] / 1000)
+    
+    async def run(self, events: List[Dict], speed: float) -> float:
+        tasks = []
+        start = time.perf_counter()
+        first = events[0]['t']
+        for event in events:
+            scheduled = start + (event['t'] - first) / speed
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(self.one(event, max(scheduled, start))))
+        await asyncio.gather(*tasks)
+        return time.perf_counter() - start
+
+def summarize(values: List[float]) -> Dict:
+    values = sorted(values)
+    return {'count': len(values), 'p50_ms': round(percentile(values, 0.50) * 1000, 2),
+            'p95_ms': round(percentile(values, 0.95) * 1000, 2), 'p99_ms': round(percentile(values, 0.99) * 1000, 2)}
+
+def report(replay: Replay, elapsed: float, logged: Counter) -> Dict:
+    completed = sum(len(values) for values in replay.latencies.values())
+    print(f"{completed} interações reproduzidas em {elapsed:.1f}s ({completed / elapsed:.0f}/s)")
+    print()
+    print(f"{'rota':<24} {'ops':>6} {'erros':>6} {'prod p50':>9} {'prod p95':>9} "
+          f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    summary = {}
+    for route in sorted(replay.latencies, key=lambda route: -len(replay.latencies[route])):
+        result = summarize(replay.latencies[route])
+        production = summarize(replay.recorded[route])
+        errors = sum(count for key, count in replay.errors.items() if key.startswith(f"{route}:"))
+        summary[route] = {**result, 'errors': errors, 'production_p50_ms': production['p50_ms'],
+                          'production_p95_ms': production['p95_ms']}
+        print(f"{route:<24} {result['count']:>6} {errors:>6} {production['p50_ms']:>9.1f} "
+              f"{production['p95_ms']:>9.1f} {result['p50_ms']:>8.1f} {result['p95_ms']:>8.1f} {result['p99_ms']:>8.1f}")
+    
+    if replay.skipped:
+        print(f"\nComandos que não existem mais (ignorados): {dict(replay.skipped)}")
+    if replay.errors or logged:
+        print("\nErros:")
+        for message, count in (replay.errors + logged).most_common(10):
+            print(f"  {count:>5}x {message}")
+    return summary
+
+def compare(summary: Dict, baseline: Dict):
+    print(f"\nComparação com o resumo anterior:")
+    print(f"{'rota':<24} {'p50 antes':>10} {'p50 agora':>10} {'p95 antes':>10} {'p95 agora':>10} {'Δ p95':>7}")
+    for route, result in summary.items():
+        before = baseline.get(route)
+        if not before:
+            continue
+        change = result['p95_ms'] / before['p95_ms'] - 1 if before['p95_ms'] else 0.0
+        print(f"{route:<24} {before['p50_ms']:>10.1f} {result['p50_ms']:>10.1f} {before['p95_ms']:>10.1f} "
+              f"{result['p95_ms']:>10.1f} {change:>+7.0%}")
+
+async def run(args):
+    events = read_events(args.arquivos, args.limite)
+    if not events:
+        raise SystemExit("Nenhuma interação na captura")
+    span = events[-1]['t'] - events[0]['t']
+    print(f"{len(events)} interações capturadas em {span / 60:.1f} min, velocidade {args.velocidade}x")
+    
+    logged = ErrorCounter()
+    logging.getLogger().addHandler(logged)
+    
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "replay.db")
+        if args.banco:
+            copy_database(args.banco, db_path)
+        else:
+            generate(db_path, users=args.usuarios, progress=None)
+        
+        bot = await build_bot(db_path)
+        leaderboards.load(await bot.db.get_standings())
+        replay = Replay(bot, map_users(events, db_path, args.sal), args.latencia_api / 1000)
+        elapsed = await replay.run(events, args.velocidade)
+        summary = report(replay, elapsed, logged.counts)
+        await bot.close()
+    
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as file:
+            compare(summary, json.load(file))
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as file:
+            json.dump(summary, file, ensure_ascii=False, indent=2)
+        print(f"\nResumo salvo em {args.saida}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("arquivos", nargs='+', help="capturas (ex: logs/traffic.jsonl.1 logs/traffic.jsonl)")
+    parser.add_argument("--banco", help="banco a copiar (sem ele, gera uma população)")
+    parser.add_argument("--usuarios", type=int, default=10_000, help="tamanho da população gerada")
+    parser.add_argument("--sal", default=os.getenv('TRAFFIC_SALT'), help="TRAFFIC_SALT usado na captura")
+    parser.add_argument("--velocidade", type=float, default=1.0, help="multiplicador do ritmo original")
+    parser.add_argument("--limite", type=int, default=0, help="só as primeiras N interações")
+    parser.add_argument("--latencia-api", type=float, default=0, help="ms simulados em cada resposta ao Discord")
+    parser.add_argument("--saida", help="grava o resumo por rota em JSON")
+    parser.add_argument("--comparar", help="resumo de uma execução anterior")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+if __name__ == "__main__":
+    main()
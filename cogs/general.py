@@ -4,70 +4,34 @@ from discord.ext import commands
 from typing import Optional
 import asyncio
 from datetime import datetime
-from database import Database
+from loop_watchdog import loop_watchdog
 from utils import EmbedBuilder, LanguageManager
-from config import COLORS, EMOJIS, LANGUAGES
+from config import COLORS, EMOJIS, FAULT_INJECTION, LANGUAGES, PROFILER
 
 class GeneralCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="ajuda", description="Mostra todos os comandos disponíveis")
     async def help_command(self, interaction: discord.Interaction):
         """Mostra todos os comandos disponíveis"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         embed = EmbedBuilder.create_embed(
-            "🏀 HoopCore - Comandos",
-            "Lista completa de todos os comandos disponíveis:",
+            t('help.title'),
+            t('help.description'),
             COLORS['primary']
         )
         
-        embed.add_field(
-            name="🏗️ Times",
-            value="• `/criartime` - Cria um novo time\n"
-                  "• `/time` - Mostra informações do seu time\n"
-                  "• `/jogadores` - Lista seus jogadores",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💰 Economia",
-            value="• `/loja` - Mostra jogadores disponíveis\n"
-                  "• `/pack` - Ganha um jogador aleatório\n"
-                  "• `/packpremium` - Pack premium (mais raros)\n"
-                  "• `/diario` - Coleta recompensa diária\n"
-                  "• `/vender` - Vende um jogador",
-            inline=False
-        )
+        embed.add_field(name=t('help.teams_title'), value=t('help.teams'), inline=False)
+        embed.add_field(name=t('common.economy'), value=t('help.economy'), inline=False)
+        embed.add_field(name=t('help.competition_title'), value=t('help.competition'), inline=False)
+        embed.add_field(name=t('help.utilities_title'), value=t('help.utilities'), inline=False)
+        embed.add_field(name=t('help.tips_title'), value=t('help.tips'), inline=False)
         
-        embed.add_field(
-            name="⚔️ Competição",
-            value="• `/desafiar` - Desafia outro jogador\n"
-                  "• `/partida` - Inicia partida simulada\n"
-                  "• `/ranking` - Mostra rankings do servidor",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚙️ Utilitários",
-            value="• `/estatisticas` - Suas estatísticas\n"
-                  "• `/ping` - Testa latência do bot\n"
-                  "• `/idioma` - Troca idioma do bot",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💡 Dicas",
-            value="• Crie um time primeiro com `/criartime`\n"
-                  "• Use `/pack` para obter jogadores gratuitos\n"
-                  "• Complete seu time com 5 titulares\n"
-                  "• Desafie outros jogadores para ganhar dinheiro",
-            inline=False
-        )
-        
-        embed.set_footer(text="HoopCore - Jogo de Basquete da NBA 2025 | Criado por Theus.zk")
+        embed.set_footer(text=t('common.footer'))
         
         await interaction.followup.send(embed=embed)
     
@@ -75,25 +39,25 @@ class GeneralCog(commands.Cog):
     async def status_command(self, interaction: discord.Interaction):
         """Mostra status do bot"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         # Calcula uptime
         uptime = datetime.now() - self.bot.start_time if hasattr(self.bot, 'start_time') else None
         
         # Obtém estatísticas
         total_guilds = len(self.bot.guilds)
-        total_users = sum(guild.member_count for guild in self.bot.guilds)
+        total_users = sum(guild.member_count or 0 for guild in self.bot.guilds)
         
         embed = EmbedBuilder.create_embed(
-            f"{EMOJIS['basketball']} Status do HoopCore",
-            "Informações sobre o bot e sua performance",
+            t('status.title'),
+            t('status.description'),
             COLORS['info']
         )
         
         embed.add_field(
-            name="📊 Estatísticas",
-            value=f"**Servidores:** {total_guilds}\n"
-                  f"**Usuários:** {total_users:,}\n"
-                  f"**Latência:** {round(self.bot.latency * 1000)}ms",
+            name=t('common.stats'),
+            value=t('status.stats', guilds=total_guilds, users=total_users,
+                    latency=round(self.bot.latency * 1000)),
             inline=True
         )
         
@@ -103,127 +67,119 @@ class GeneralCog(commands.Cog):
             minutes, seconds = divmod(remainder, 60)
             uptime_str = f"{days}d {hours}h {minutes}m {seconds}s"
         else:
-            uptime_str = "Desconhecido"
+            uptime_str = t('status.unknown')
         
         embed.add_field(
             name="⏰ Uptime",
-            value=f"**Tempo Online:** {uptime_str}\n"
-                  f"**Versão:** 1.0.0\n"
-                  f"**Discord.py:** {discord.__version__}",
+            value=t('status.uptime', uptime=uptime_str, version=discord.__version__),
             inline=True
         )
         
+        # Event loop: atraso recente e onde ele ficou bloqueado
+        loop = loop_watchdog.stats()
+        loop_value = t('status.loop', p50=round(loop['p50'] * 1000), p95=round(loop['p95'] * 1000),
+                       p99=round(loop['p99'] * 1000), max=round(loop['max'] * 1000),
+                       blocks=loop['blocks'], threshold=round(loop['threshold'] * 1000))
+        for site in loop['sites']:
+            loop_value += "\n" + t('status.loop_site', site=site['site'], count=site['count'],
+                                   ms=round(site['seconds'] * 1000))
+        embed.add_field(
+            name=t('status.loop_title'),
+            value=loop_value,
+            inline=False
+        )
+        
         embed.add_field(
-            name="🔧 Funcionalidades",
-            value="• ✅ Sistema de Times\n"
-                  "• ✅ Loja de Jogadores\n"
-                  "• ✅ Sistema de Partidas\n"
-                  "• ✅ Rankings\n"
-                  "• ✅ Sistema Econômico\n"
-                  "• ✅ Packs de Jogadores",
+            name=t('status.features_title'),
+            value=t('status.features'),
             inline=False
         )
         
-        embed.set_footer(text="HoopCore - Desenvolvido com ❤️")
+        embed.set_footer(text=t('status.footer'))
         
         await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="idioma", description="Troca o idioma do bot")
     @app_commands.describe(
-        idioma="Idioma desejado"
+        idioma="Idioma desejado",
+        escopo="Só para você ou padrão do servidor (requer Gerenciar Servidor)"
     )
-    @app_commands.choices(idioma=[
-        app_commands.Choice(name="Português", value="pt"),
-        app_commands.Choice(name="English", value="en"),
-        app_commands.Choice(name="Español", value="es")
-    ])
-    async def change_language(self, interaction: discord.Interaction, idioma: str):
-        """Troca o idioma do bot"""
-        await interaction.response.defer()
-        
+    @app_commands.choices(
+        idioma=[
+            app_commands.Choice(name="Português", value="pt"),
+            app_commands.Choice(name="English", value="en"),
+            app_commands.Choice(name="Español", value="es")
+        ],
+        escopo=[
+            app_commands.Choice(name="Usuário", value="usuario"),
+            app_commands.Choice(name="Servidor", value="servidor")
+        ]
+    )
+    async def change_language(self, interaction: discord.Interaction, idioma: str, escopo: str = "usuario"):
+        """Troca o idioma do bot para o usuário ou para o servidor"""
         user_id = interaction.user.id
         
+        if escopo == "servidor":
+            t = await self.bot.locales.translator(interaction)
+            if not interaction.guild:
+                await interaction.response.send_message(t('language.guild_only'), ephemeral=True)
+                return
+            if not interaction.user.guild_permissions.manage_guild:
+                await interaction.response.send_message(t('language.guild_permission'), ephemeral=True)
+                return
+            
+            await interaction.response.defer()
+            await self.bot.locales.set_guild_language(interaction.guild_id, idioma)
+            
+            t = LanguageManager.translator(idioma)
+            embed = EmbedBuilder.create_embed(
+                t('language.changed_title'),
+                t('language.guild_changed', language=LANGUAGES[idioma]),
+                COLORS['success']
+            )
+            embed.add_field(name=t('common.info'), value=t('language.guild_changed_note'), inline=False)
+            await interaction.followup.send(embed=embed)
+            return
+        
+        await interaction.response.defer()
+        
         # Verifica se usuário existe
         user = await self.db.get_user(user_id)
         if not user:
             # Cria usuário se não existir
             await self.db.create_user(user_id, interaction.user.display_name)
         
-        # Atualiza idioma (implementar no database)
-        # Por enquanto, apenas confirma
-        
-        language_name = LANGUAGES.get(idioma, "Português")
+        await self.bot.locales.set_user_language(user_id, idioma)
         
+        # A confirmação já sai no idioma escolhido
+        t = LanguageManager.translator(idioma)
         embed = EmbedBuilder.create_embed(
-            "🌍 Idioma Alterado",
-            f"O idioma do bot foi alterado para **{language_name}**!",
+            t('language.changed_title'),
+            t('language.changed', language=LANGUAGES[idioma]),
             COLORS['success']
         )
         
-        embed.add_field(
-            name="ℹ️ Informação",
-            value="Algumas mensagens podem continuar em português por enquanto.\n"
-                  "A tradução completa será implementada em breve!",
-            inline=False
-        )
-        
         await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="info", description="Informações sobre o bot")
     async def info_command(self, interaction: discord.Interaction):
         """Mostra informações sobre o bot"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         embed = EmbedBuilder.create_embed(
-            "🏀 Sobre o HoopCore",
-            "Um jogo de basquete inspirado na NBA 2025",
+            t('about.title'),
+            t('about.description'),
             COLORS['primary']
         )
         
-        embed.add_field(
-            name="🎯 Sobre",
-            value="HoopCore é um bot de jogo de basquete que permite você:\n"
-                  "• Criar e gerenciar seu próprio time\n"
-                  "• Colecionar jogadores da NBA 2025\n"
-                  "• Competir em partidas emocionantes\n"
-                  "• Construir o melhor time da liga",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏆 Jogadores",
-            value="• **Lendários:** LeBron James, Stephen Curry, Giannis, etc.\n"
-                  "• **Épicos:** Ja Morant, Zion Williamson, Anthony Edwards\n"
-                  "• **Raros:** Jogadores com overall 80-89\n"
-                  "• **Comuns:** Jogadores com overall 70-79",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="💰 Economia",
-            value="• **Recompensa Diária:** $1,000\n"
-                  "• **Vitória em Partida:** +$500\n"
-                  "• **Pack Premium:** $5,000\n"
-                  "• **Dinheiro Inicial:** $10,000",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="⚙️ Sistema",
-            value="• **5 Titulares** + Reservas\n"
-                  "• **Posições:** PG, SG, SF, PF, C\n"
-                  "• **Overall:** Baseado na média dos titulares\n"
-                  "• **Rankings:** Por vitórias, dinheiro e overall",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="👨‍💻 Desenvolvedor",
-            value="**Theus.zk** - Criador e desenvolvedor do HoopCore",
-            inline=False
-        )
+        embed.add_field(name=t('about.about_title'), value=t('about.about'), inline=False)
+        embed.add_field(name=t('about.players_title'), value=t('about.players'), inline=False)
+        embed.add_field(name=t('common.economy'), value=t('about.economy'), inline=False)
+        embed.add_field(name=t('about.system_title'), value=t('about.system'), inline=False)
+        embed.add_field(name=t('about.developer_title'), value=t('about.developer'), inline=False)
         
-        embed.set_footer(text="Desenvolvido com discord.py | NBA 2025")
+        embed.set_footer(text=t('about.footer'))
         
         await interaction.followup.send(embed=embed)
     
@@ -231,50 +187,20 @@ class GeneralCog(commands.Cog):
     async def credits(self, interaction: discord.Interaction):
         """Mostra os créditos do bot"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         embed = EmbedBuilder.create_embed(
-            f"{EMOJIS['star']} Créditos",
-            "Pessoas e recursos que tornaram este bot possível",
+            t('credits.title'),
+            t('credits.description'),
             COLORS['gold']
         )
         
-        embed.add_field(
-            name="👨‍💻 Desenvolvimento",
-            value="• **Desenvolvedor:** IA Assistant\n"
-                  "• **Framework:** discord.py 2.3.0+\n"
-                  "• **Banco de Dados:** SQLite\n"
-                  "• **Inspiração:** DreamTeam (Futebol)",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🏀 NBA 2025",
-            value="• **Jogadores:** Baseados na temporada 2025\n"
-                  "• **Times:** Todos os 30 times da NBA\n"
-                  "• **Overall:** Baseado em estatísticas reais\n"
-                  "• **Raridades:** Sistema balanceado",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🛠️ Tecnologias",
-            value="• **Python 3.8+**\n"
-                  "• **discord.py**\n"
-                  "• **SQLite**\n"
-                  "• **asyncio**",
-            inline=False
-        )
-        
-        embed.add_field(
-            name="🙏 Agradecimentos",
-            value="• Comunidade Discord\n"
-                  "• Desenvolvedores do discord.py\n"
-                  "• Fãs de basquete da NBA\n"
-                  "• Todos os usuários do bot",
-            inline=False
-        )
+        embed.add_field(name=t('credits.development_title'), value=t('credits.development'), inline=False)
+        embed.add_field(name=t('credits.nba_title'), value=t('credits.nba'), inline=False)
+        embed.add_field(name=t('credits.tech_title'), value=t('credits.tech'), inline=False)
+        embed.add_field(name=t('credits.thanks_title'), value=t('credits.thanks'), inline=False)
         
-        embed.set_footer(text="Obrigado por usar o HoopCore! 🏀")
+        embed.set_footer(text=t('credits.footer'))
         
         await interaction.followup.send(embed=embed)
     
@@ -282,31 +208,30 @@ class GeneralCog(commands.Cog):
     async def ping(self, interaction: discord.Interaction):
         """Testa a latência do bot"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         latency = round(self.bot.latency * 1000)
         
         # Determina cor baseada na latência
         if latency < 100:
             color = COLORS['success']
-            status = "Excelente"
+            status = t('ping.excellent')
         elif latency < 200:
             color = COLORS['warning']
-            status = "Boa"
+            status = t('ping.good')
         else:
             color = COLORS['error']
-            status = "Lenta"
+            status = t('ping.slow')
         
         embed = EmbedBuilder.create_embed(
             "🏓 Pong!",
-            f"Latência do bot: **{latency}ms**\nStatus: **{status}**",
+            t('ping.description', latency=latency, status=status),
             color
         )
         
         embed.add_field(
-            name="📊 Informações",
-            value=f"• **Latência:** {latency}ms\n"
-                  f"• **Status:** {status}\n"
-                  f"• **API:** Discord",
+            name=t('ping.info_title'),
+            value=t('ping.info', latency=latency, status=status),
             inline=False
         )
         
@@ -315,13 +240,15 @@ class GeneralCog(commands.Cog):
     @app_commands.command(name="admin", description="Comandos administrativos (apenas para o dono)")
     async def admin_command(self, interaction: discord.Interaction):
         """Comandos administrativos para o dono do bot"""
+        t = await self.bot.locales.translator(interaction)
+        
         # Verifica se é o dono do bot - SUBSTITUA PELO SEU ID REAL
         OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
         
         if interaction.user.id != OWNER_ID:
             embed = EmbedBuilder.create_embed(
-                "❌ Acesso Negado",
-                "Apenas o dono do bot pode usar este comando.",
+                t('admin.denied_title'),
+                t('admin.denied'),
                 COLORS['error']
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -331,8 +258,8 @@ class GeneralCog(commands.Cog):
         
         # Cria embed com opções administrativas
         embed = EmbedBuilder.create_embed(
-            "⚙️ Painel Administrativo",
-            "Selecione uma ação administrativa:",
+            t('admin.panel_title'),
+            t('admin.panel'),
             COLORS['primary']
         )
         
@@ -342,7 +269,7 @@ class GeneralCog(commands.Cog):
         # Adicionar dinheiro
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.green,
-            label="💰 Adicionar Dinheiro",
+            label=t('admin.add_money'),
             emoji="💵",
             custom_id="admin_add_money"
         ))
@@ -350,7 +277,7 @@ class GeneralCog(commands.Cog):
         # Adicionar jogador
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.blue,
-            label="🏀 Adicionar Jogador",
+            label=t('admin.add_player'),
             emoji="👤",
             custom_id="admin_add_player"
         ))
@@ -358,7 +285,7 @@ class GeneralCog(commands.Cog):
         # Resetar cooldowns
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.yellow,
-            label="⏰ Resetar Cooldowns",
+            label=t('admin.reset_cooldowns'),
             emoji="🔄",
             custom_id="admin_reset_cooldowns"
         ))
@@ -366,11 +293,69 @@ class GeneralCog(commands.Cog):
         # Ver estatísticas do servidor
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.secondary,
-            label="📊 Estatísticas do Servidor",
+            label=t('admin.server_stats'),
             emoji="📈",
             custom_id="admin_server_stats"
         ))
         
+        # Reconstruir o resumo dos times
+        view.add_item(discord.ui.Button(
+            style=discord.ButtonStyle.secondary,
+            label=t('admin.rebuild_stats'),
+            emoji="🧮",
+            custom_id="admin_rebuild_stats"
+        ))
+        
+        # Profiler por amostragem do bot em execução
+        for seconds in PROFILER['durations']:
+            view.add_item(discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label=t('admin.profile', seconds=seconds),
+                emoji="🔬",
+                custom_id=f"admin_profile_start_{seconds}"
+            ))
+        view.add_item(discord.ui.Button(
+            style=discord.ButtonStyle.red,
+            label=t('admin.profile_stop'),
+            emoji="⏹️",
+            custom_id="admin_profile_stop"
+        ))
+        
+        # Memória: caches do bot + tracemalloc
+        view.add_item(discord.ui.Button(
+            style=discord.ButtonStyle.secondary,
+            label=t('admin.memory'),
+            emoji="🧠",
+            custom_id="admin_memory_snapshot"
+        ))
+        view.add_item(discord.ui.Button(
+            style=discord.ButtonStyle.red,
+            label=t('admin.memory_stop'),
+            emoji="🧹",
+            custom_id="admin_memory_stop"
+        ))
+        
+        # Ensaio de falhas no banco: conjuntos de regras, trava exclusiva e desligar
+        for preset in FAULT_INJECTION['presets']:
+            view.add_item(discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label=t('admin.faults', preset=preset),
+                emoji="🧪",
+                custom_id=f"admin_faults_{preset}"
+            ))
+        view.add_item(discord.ui.Button(
+            style=discord.ButtonStyle.secondary,
+            label=t('admin.faults_hold', seconds=FAULT_INJECTION['hold_seconds']),
+            emoji="🔒",
+            custom_id="admin_faults_hold"
+        ))
+        view.add_item(discord.ui.Button(
+            style=discord.ButtonStyle.green,
+            label=t('admin.faults_off'),
+            emoji="✅",
+            custom_id="admin_faults_off"
+        ))
+        
         await interaction.followup.send(embed=embed, view=view)
 
 async def setup(bot):
@@ -1,25 +1,68 @@
 import discord
 from discord import app_commands
-from discord.ext import commands
+from discord.ext import commands, tasks
 from typing import Optional
 import asyncio
+import logging
+import time
 from datetime import datetime
-from database import Database
-from utils import EmbedBuilder, ButtonBuilder, GameLogic
-from config import COLORS, EMOJIS, ECONOMY, MATCH_SETTINGS
-import random
+from utils import EmbedBuilder, ButtonBuilder, LanguageManager, PageToken, RARITY_EMOJIS
+from config import COLORS, EMOJIS, ECONOMY, MATCH_SETTINGS, PAGINATION, RANKING_HISTORY
+from admission import AdmissionRejected, admission
+from leaderboard import leaderboards
+from memory_stats import cache_registry
+from rate_limit import rate_limited
+
+log = logging.getLogger(__name__)
 
 class MatchesCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
         self.active_matches = {}  # Armazena partidas ativas
+        cache_registry.register('match_sessions', lambda: self.active_matches)
+    
+    async def cog_load(self):
+        self.ranking_snapshot.start()
+    
+    async def cog_unload(self):
+        self.ranking_snapshot.cancel()
+    
+    @tasks.loop(seconds=RANKING_HISTORY['snapshot_interval'])
+    async def ranking_snapshot(self):
+        """Grava o histórico dos rankings e recalcula as maiores subidas"""
+        try:
+            # Tarefa de fundo: espera as interações liberarem o banco
+            async with admission.slot('background'):
+                now = int(time.time())
+                if self.ranking_snapshot.current_loop == 0:
+                    # Continua de onde o último processo parou
+                    for category in leaderboards.CATEGORIES:
+                        leaderboards.seed_snapshot(category, await self.db.get_ranks_at(category, now))
+                
+                await self.db.record_ranking_snapshot(leaderboards.snapshot_changes(), now)
+                
+                since = now - RANKING_HISTORY['climbers_window']
+                for category in leaderboards.CATEGORIES:
+                    leaderboards.set_baseline(category, await self.db.get_ranks_at(category, since, 86400))
+        except AdmissionRejected:
+            log.warning("Banco sobrecarregado: histórico dos rankings fica para a próxima rodada")
+        except Exception:
+            log.exception("Erro ao gravar histórico dos rankings")
+    
+    @ranking_snapshot.before_loop
+    async def before_ranking_snapshot(self):
+        # Os rankings em memória são carregados no bootstrap, que pode terminar depois do ready
+        await self.bot.wait_until_ready()
+        await self.bot.wait_until_bootstrapped()
     
     @app_commands.command(name="desafiar", description="Desafia outro jogador para uma partida")
     @app_commands.describe(jogador="Mencione o jogador que você quer desafiar")
+    @rate_limited('match')
     async def challenge_player(self, interaction: discord.Interaction, jogador: discord.Member):
         """Desafia outro jogador para uma partida"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         challenger_id = interaction.user.id
         challenged_id = jogador.id
@@ -27,8 +70,8 @@ class MatchesCog(commands.Cog):
         # Verifica se não está desafiando a si mesmo
         if challenger_id == challenged_id:
             embed = EmbedBuilder.create_embed(
-                "❌ Erro",
-                "Você não pode desafiar a si mesmo!",
+                t('common.error'),
+                t('challenge.self'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -40,8 +83,8 @@ class MatchesCog(commands.Cog):
         
         if not challenger_team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!",
+                t('common.no_team'),
+                t('common.need_team'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -49,8 +92,8 @@ class MatchesCog(commands.Cog):
         
         if not challenged_team:
             embed = EmbedBuilder.create_embed(
-                "❌ Jogador Sem Time",
-                f"{jogador.display_name} ainda não criou um time!",
+                t('challenge.opponent_no_team_title'),
+                t('challenge.opponent_no_team', name=jogador.display_name),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -62,8 +105,8 @@ class MatchesCog(commands.Cog):
         
         if len(challenger_players) < 5:
             embed = EmbedBuilder.create_embed(
-                "❌ Time Incompleto",
-                "Você precisa de pelo menos 5 jogadores para desafiar!",
+                t('challenge.incomplete_title'),
+                t('challenge.need_players'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -71,8 +114,8 @@ class MatchesCog(commands.Cog):
         
         if len(challenged_players) < 5:
             embed = EmbedBuilder.create_embed(
-                "❌ Time Incompleto",
-                f"{jogador.display_name} precisa de pelo menos 5 jogadores!",
+                t('challenge.incomplete_title'),
+                t('challenge.opponent_need_players', name=jogador.display_name),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -82,13 +125,15 @@ class MatchesCog(commands.Cog):
         embed = EmbedBuilder.match_embed(
             interaction.user.display_name,
             jogador.display_name,
-            0  # Match ID será gerado
+            0,  # Match ID será gerado
+            t.language
         )
         
         # Adiciona informações dos times
         embed.add_field(
-            name="🏀 Times",
-            value=f"**{challenger_team['team_name']}** vs **{challenged_team['team_name']}**",
+            name=t('challenge.teams_title'),
+            value=t('challenge.teams', challenger=challenger_team['team_name'],
+                    challenged=challenged_team['team_name']),
             inline=False
         )
         
@@ -96,27 +141,29 @@ class MatchesCog(commands.Cog):
         view = discord.ui.View()
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.green,
-            label="Aceitar Desafio",
+            label=t('challenge.accept'),
             emoji=EMOJIS['check'],
             custom_id=f"accept_challenge_{challenger_id}"
         ))
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.red,
-            label="Recusar Desafio",
+            label=t('challenge.decline'),
             emoji=EMOJIS['cross'],
             custom_id=f"decline_challenge_{challenger_id}"
         ))
         
         await interaction.followup.send(
-            f"{jogador.mention} você foi desafiado!",
+            t('challenge.mention', mention=jogador.mention),
             embed=embed,
             view=view
         )
     
     @app_commands.command(name="partida", description="Inicia uma partida simulada")
+    @rate_limited('match')
     async def start_match(self, interaction: discord.Interaction):
         """Inicia uma partida simulada"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -124,8 +171,8 @@ class MatchesCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!",
+                t('common.no_team'),
+                t('common.need_team'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -137,8 +184,8 @@ class MatchesCog(commands.Cog):
         
         if len(starters) < 5:
             embed = EmbedBuilder.create_embed(
-                "⚠️ Time Incompleto",
-                f"Você precisa de 5 titulares para jogar. Atualmente tem {len(starters)}.",
+                t('common.incomplete_team'),
+                t('common.need_starters', count=len(starters)),
                 COLORS['warning']
             )
             await interaction.followup.send(embed=embed)
@@ -149,16 +196,15 @@ class MatchesCog(commands.Cog):
     
     async def start_interactive_match(self, interaction, team, starters):
         """Inicia partida interativa"""
+        t = await self.bot.locales.translator(interaction)
+        
         # Calcula overall do time
         team_overall = sum(p['overall'] for p in starters) / len(starters)
         
         # Cria embed inicial da partida
         embed = discord.Embed(
-            title="🏀 Partida Iniciada!",
-            description=f"**{team['team_name']}** vs **CPU**\n\n"
-                       f"Overall do Time: **{team_overall:.1f}**\n"
-                       f"Quartos: 4 x 12 minutos\n\n"
-                       f"Clique em **Iniciar** para começar!",
+            title=t('match.started_title'),
+            description=t('match.started', team=team['team_name'], overall=team_overall),
             color=0x00ff00
         )
         
@@ -166,322 +212,125 @@ class MatchesCog(commands.Cog):
         view = discord.ui.View()
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.green,
-            label="🚀 Iniciar Partida",
+            label=t('match.start_button'),
             emoji="🏀",
             custom_id="start_match"
         ))
         
         await interaction.followup.send(embed=embed, view=view)
     
-    async def handle_match_situation(self, interaction, quarter, time, score_player, score_cpu):
-        """Lida com situação da partida"""
-        # Situações variadas baseadas no momento da partida
-        situations = [
-            {
-                "name": "🏀 Ataque Rápido",
-                "description": "Seu time tem uma chance de contra-ataque!",
-                "options": [
-                    {"label": "⚡ Correr para a cesta", "custom_id": "fast_break_run", "success_rate": 0.7},
-                    {"label": "🎯 Passar para o ala", "custom_id": "fast_break_pass", "success_rate": 0.8},
-                    {"label": "🏃‍♂️ Drible e finalização", "custom_id": "fast_break_dribble", "success_rate": 0.6}
-                ]
-            },
-            {
-                "name": "🎯 Arremesso de 3 Pontos",
-                "description": "Chance de arremesso de longa distância!",
-                "options": [
-                    {"label": "🎯 Arremesso limpo", "custom_id": "three_clean", "success_rate": 0.4},
-                    {"label": "🏃‍♂️ Drible e arremesso", "custom_id": "three_dribble", "success_rate": 0.3},
-                    {"label": "🤝 Passar para melhor posição", "custom_id": "three_pass", "success_rate": 0.9}
-                ]
-            },
-            {
-                "name": "💪 Jogo Interior",
-                "description": "Chance de jogada próxima à cesta!",
-                "options": [
-                    {"label": "🏀 Hook shot", "custom_id": "inside_hook", "success_rate": 0.6},
-                    {"label": "💪 Post-up", "custom_id": "inside_post", "success_rate": 0.7},
-                    {"label": "🔄 Girar e finalizar", "custom_id": "inside_spin", "success_rate": 0.5}
-                ]
-            },
-            {
-                "name": "🛡️ Defesa",
-                "description": "O adversário está atacando!",
-                "options": [
-                    {"label": "🛡️ Bloqueio", "custom_id": "defense_block", "success_rate": 0.3},
-                    {"label": "🏃‍♂️ Roubar a bola", "custom_id": "defense_steal", "success_rate": 0.4},
-                    {"label": "📏 Forçar arremesso ruim", "custom_id": "defense_contest", "success_rate": 0.7}
-                ]
-            },
-            {
-                "name": "🎭 Jogada Especial",
-                "description": "Chance de uma jogada espetacular!",
-                "options": [
-                    {"label": "🔥 Alley-oop", "custom_id": "special_alley", "success_rate": 0.2},
-                    {"label": "💫 Crossover", "custom_id": "special_crossover", "success_rate": 0.4},
-                    {"label": "🚀 Tomahawk dunk", "custom_id": "special_tomahawk", "success_rate": 0.3}
-                ]
-            },
-            {
-                "name": "⏰ Final de Quarto",
-                "description": "Última chance do quarto!",
-                "options": [
-                    {"label": "🎯 Arremesso de 3", "custom_id": "quarter_three", "success_rate": 0.3},
-                    {"label": "🏃‍♂️ Penetração", "custom_id": "quarter_drive", "success_rate": 0.6},
-                    {"label": "🤝 Passar para finalização", "custom_id": "quarter_pass", "success_rate": 0.8}
-                ]
-            }
-        ]
-        
-        # Escolhe situação baseada no momento
-        if quarter == 4 and time <= 60:  # Final do jogo
-            situation = situations[5]  # Final de quarto
-        elif time <= 30:  # Final do quarto
-            situation = situations[5]  # Final de quarto
-        elif score_player > score_cpu + 10:  # Time na frente
-            situation = random.choice(situations[0:3])  # Ataque
-        elif score_cpu > score_player + 10:  # Time atrás
-            situation = random.choice(situations[0:3])  # Ataque agressivo
-        else:  # Jogo equilibrado
-            situation = random.choice(situations)
-        
-        # Cria embed da situação
-        embed = discord.Embed(
-            title=situation["name"],
-            description=f"{situation['description']}\n\n"
-                       f"**Quarto {quarter}** | **{time}s** restantes\n"
-                       f"**Placar:** {score_player} x {score_cpu}",
-            color=0x1e90ff
-        )
-        
-        # Cria botões para as opções
-        view = discord.ui.View()
-        for option in situation["options"]:
-            button = discord.ui.Button(
-                style=discord.ButtonStyle.primary,
-                label=option["label"],
-                custom_id=f"match_{option['custom_id']}_{quarter}_{time}_{score_player}_{score_cpu}",
-                emoji="🎯"
-            )
-            view.add_item(button)
-        
-        await interaction.response.edit_message(embed=embed, view=view)
-    
-    async def resolve_match_action(self, interaction, action, quarter, time, score_player, score_cpu):
-        """Resolve a ação escolhida na partida"""
-        # Mapeia ações para resultados
-        action_results = {
-            "fast_break_run": {"success": "🏃‍♂️ **Contra-ataque perfeito!** +2 pontos", "fail": "❌ Defesa interceptou o passe"},
-            "fast_break_pass": {"success": "🤝 **Passe perfeito!** +2 pontos", "fail": "❌ Passe interceptado"},
-            "fast_break_dribble": {"success": "🏀 **Drible e finalização!** +2 pontos", "fail": "❌ Bola roubada"},
-            
-            "three_clean": {"success": "🎯 **Três pontos!** +3 pontos", "fail": "❌ Arremesso errou"},
-            "three_dribble": {"success": "🏃‍♂️ **Três pontos com drible!** +3 pontos", "fail": "❌ Arremesso errou"},
-            "three_pass": {"success": "🤝 **Passe para posição melhor!** +2 pontos", "fail": "❌ Passe interceptado"},
-            
-            "inside_hook": {"success": "🏀 **Hook shot perfeito!** +2 pontos", "fail": "❌ Hook shot errou"},
-            "inside_post": {"success": "💪 **Post-up dominante!** +2 pontos", "fail": "❌ Defesa forçou erro"},
-            "inside_spin": {"success": "🔄 **Giro e finalização!** +2 pontos", "fail": "❌ Giro perdeu o equilíbrio"},
-            
-            "defense_block": {"success": "🛡️ **Bloqueio espetacular!** Bola recuperada", "fail": "❌ Bloqueio falhou, +2 pontos CPU"},
-            "defense_steal": {"success": "🏃‍♂️ **Roubo de bola!** Contra-ataque", "fail": "❌ Roubo falhou, +2 pontos CPU"},
-            "defense_contest": {"success": "📏 **Arremesso contestado!** CPU errou", "fail": "❌ Contestação falhou, +2 pontos CPU"},
-            
-            "special_alley": {"success": "🔥 **ALLEY-OOP ESPETACULAR!** +3 pontos", "fail": "❌ Alley-oop falhou"},
-            "special_crossover": {"success": "💫 **CROSSOVER PERFEITO!** +2 pontos", "fail": "❌ Crossover falhou"},
-            "special_tomahawk": {"success": "🚀 **TOMAHAWK DUNK!** +3 pontos", "fail": "❌ Dunk falhou"},
-            
-            "quarter_three": {"success": "🎯 **TRÊS PONTOS NO FINAL!** +3 pontos", "fail": "❌ Arremesso final errou"},
-            "quarter_drive": {"success": "🏃‍♂️ **Penetração perfeita!** +2 pontos", "fail": "❌ Penetração falhou"},
-            "quarter_pass": {"success": "🤝 **Passe para finalização!** +2 pontos", "fail": "❌ Passe final falhou"}
-        }
-        
-        # Obtém resultado da ação
-        action_key = action.split("_", 1)[1]  # Remove "match_" do início
-        result = action_results.get(action_key, {"success": "✅ Ação bem-sucedida!", "fail": "❌ Ação falhou"})
-        
-        # Simula dados de RPG (1-100)
-        roll = random.randint(1, 100)
-        
-        # Determina sucesso baseado na taxa de sucesso da ação
-        success_rate = 0.5  # Taxa padrão
-        for situation in self.get_match_situations():
-            for option in situation["options"]:
-                if option["custom_id"] == action_key:
-                    success_rate = option["success_rate"]
-                    break
-        
-        # Calcula sucesso (roll <= success_rate * 100)
-        is_success = roll <= (success_rate * 100)
-        
-        # Atualiza placar
-        if is_success:
-            if "pontos" in result["success"]:
-                if "+3 pontos" in result["success"]:
-                    score_player += 3
-                elif "+2 pontos" in result["success"]:
-                    score_player += 2
-        else:
-            if "pontos" in result["fail"]:
-                if "+2 pontos" in result["fail"]:
-                    score_cpu += 2
-                elif "+3 pontos" in result["fail"]:
-                    score_cpu += 3
-        
-        # Cria embed do resultado
-        embed = discord.Embed(
-            title="🎯 Resultado da Jogada",
-            description=f"**Dados:** {roll}/100\n"
-                       f"**Taxa de Sucesso:** {success_rate*100:.0f}%\n\n"
-                       f"**Resultado:** {result['success'] if is_success else result['fail']}\n\n"
-                       f"**Placar Atual:** {score_player} x {score_cpu}",
-            color=0x00ff00 if is_success else 0xff0000
-        )
-        
-        # Adiciona informações do jogo
-        embed.add_field(
-            name="⏰ Tempo",
-            value=f"Quarto {quarter} | {time}s restantes",
-            inline=True
-        )
-        
-        # Botão para continuar
-        view = discord.ui.View()
-        view.add_item(discord.ui.Button(
-            style=discord.ButtonStyle.green,
-            label="▶️ Continuar",
-            emoji="🏀",
-            custom_id=f"continue_match_{quarter}_{time}_{score_player}_{score_cpu}"
-        ))
-        
-        await interaction.response.edit_message(embed=embed, view=view)
-    
-    def get_match_situations(self):
-        """Retorna todas as situações possíveis"""
-        return [
-            {
-                "name": "🏀 Ataque Rápido",
-                "description": "Seu time tem uma chance de contra-ataque!",
-                "options": [
-                    {"label": "⚡ Correr para a cesta", "custom_id": "fast_break_run", "success_rate": 0.7},
-                    {"label": "🎯 Passar para o ala", "custom_id": "fast_break_pass", "success_rate": 0.8},
-                    {"label": "🏃‍♂️ Drible e finalização", "custom_id": "fast_break_dribble", "success_rate": 0.6}
-                ]
-            },
-            {
-                "name": "🎯 Arremesso de 3 Pontos",
-                "description": "Chance de arremesso de longa distância!",
-                "options": [
-                    {"label": "🎯 Arremesso limpo", "custom_id": "three_clean", "success_rate": 0.4},
-                    {"label": "🏃‍♂️ Drible e arremesso", "custom_id": "three_dribble", "success_rate": 0.3},
-                    {"label": "🤝 Passar para melhor posição", "custom_id": "three_pass", "success_rate": 0.9}
-                ]
-            },
-            {
-                "name": "💪 Jogo Interior",
-                "description": "Chance de jogada próxima à cesta!",
-                "options": [
-                    {"label": "🏀 Hook shot", "custom_id": "inside_hook", "success_rate": 0.6},
-                    {"label": "💪 Post-up", "custom_id": "inside_post", "success_rate": 0.7},
-                    {"label": "🔄 Girar e finalizar", "custom_id": "inside_spin", "success_rate": 0.5}
-                ]
-            },
-            {
-                "name": "🛡️ Defesa",
-                "description": "O adversário está atacando!",
-                "options": [
-                    {"label": "🛡️ Bloqueio", "custom_id": "defense_block", "success_rate": 0.3},
-                    {"label": "🏃‍♂️ Roubar a bola", "custom_id": "defense_steal", "success_rate": 0.4},
-                    {"label": "📏 Forçar arremesso ruim", "custom_id": "defense_contest", "success_rate": 0.7}
-                ]
-            },
-            {
-                "name": "🎭 Jogada Especial",
-                "description": "Chance de uma jogada espetacular!",
-                "options": [
-                    {"label": "🔥 Alley-oop", "custom_id": "special_alley", "success_rate": 0.2},
-                    {"label": "💫 Crossover", "custom_id": "special_crossover", "success_rate": 0.4},
-                    {"label": "🚀 Tomahawk dunk", "custom_id": "special_tomahawk", "success_rate": 0.3}
-                ]
-            },
-            {
-                "name": "⏰ Final de Quarto",
-                "description": "Última chance do quarto!",
-                "options": [
-                    {"label": "🎯 Arremesso de 3", "custom_id": "quarter_three", "success_rate": 0.3},
-                    {"label": "🏃‍♂️ Penetração", "custom_id": "quarter_drive", "success_rate": 0.6},
-                    {"label": "🤝 Passar para finalização", "custom_id": "quarter_pass", "success_rate": 0.8}
-                ]
-            }
-        ]
-    
     @app_commands.command(name="ranking", description="Mostra os rankings")
     @app_commands.describe(
-        categoria="Tipo de ranking (overall, dinheiro, vitorias)"
+        categoria="Tipo de ranking (overall, dinheiro, vitorias)",
+        pagina="Página do ranking",
+        escopo="Ranking deste servidor ou global"
     )
     @app_commands.choices(categoria=[
         app_commands.Choice(name="Overall", value="overall"),
         app_commands.Choice(name="Dinheiro", value="money"),
         app_commands.Choice(name="Vitórias", value="wins")
+    ], escopo=[
+        app_commands.Choice(name="Servidor", value="guild"),
+        app_commands.Choice(name="Global", value="global")
     ])
-    async def show_rankings(self, interaction: discord.Interaction, categoria: str = "overall"):
-        """Mostra os rankings"""
+    @rate_limited('ranking')
+    async def show_rankings(self, interaction: discord.Interaction, categoria: str = "overall",
+                            pagina: app_commands.Range[int, 1] = 1, escopo: str = "guild"):
+        """Mostra os rankings (do servidor por padrão)"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
-        # Obtém rankings
-        rankings = await self.db.get_rankings()
-        
-        if not rankings:
-            embed = EmbedBuilder.create_embed(
-                "📊 Ranking",
-                "Nenhum dado disponível para rankings ainda.",
-                COLORS['info']
-            )
-            await interaction.followup.send(embed=embed)
-            return
-        
-        if not rankings.get(categoria) or len(rankings[categoria]) == 0:
-            if categoria == "overall":
-                message = "Nenhum time com 5 titulares ainda para calcular overall."
-            elif categoria == "money":
-                message = "Nenhum time criado ainda."
-            else:
-                message = "Nenhuma partida jogada ainda."
-            
-            embed = EmbedBuilder.create_embed(
-                "📊 Ranking",
-                message,
-                COLORS['info']
-            )
-            await interaction.followup.send(embed=embed)
-            return
-        
-        embed = EmbedBuilder.ranking_embed(rankings, categoria)
-        
-        # Adiciona botões para outros rankings
+        guild = interaction.guild if escopo == "guild" else None
+        embed, view = await self.build_ranking_page(interaction.user.id, categoria, pagina, t.language, guild)
+        await interaction.followup.send(embed=embed, view=view)
+    
+    async def build_ranking_page(self, user_id: int, category: str, page: int, language: str = 'pt',
+                                 guild: Optional[discord.Guild] = None):
+        """Monta embed e botões de uma página do ranking, com a posição de quem pediu
+        
+        Com guild, só entram os times de quem já jogou naquele servidor.
+        """
+        t = LanguageManager.translator(language)
+        boards = await self.bot.guild_leaderboards.get(guild.id) if guild else leaderboards
+        scope = 'guild' if guild else 'global'
+        suffix = "_guild" if guild else ""
+        
+        # Botões para outros rankings
         view = discord.ui.View()
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.primary,
-            label="Overall",
-            custom_id="ranking_overall"
+            label=t('ranking.button_overall'),
+            custom_id=f"ranking_overall{suffix}"
         ))
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.success,
-            label="Dinheiro",
-            custom_id="ranking_money"
+            label=t('ranking.button_money'),
+            custom_id=f"ranking_money{suffix}"
         ))
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.secondary,
-            label="Vitórias",
-            custom_id="ranking_wins"
+            label=t('ranking.button_wins'),
+            custom_id=f"ranking_wins{suffix}"
         ))
         
-        await interaction.followup.send(embed=embed, view=view)
+        total = boards.count(category)
+        if not total:
+            embed = EmbedBuilder.create_embed(
+                t('ranking.title'),
+                t(f"ranking.empty_{category}"),
+                COLORS['info']
+            )
+            return embed, view
+        
+        page_size = PAGINATION['ranking_page_size']
+        total_pages = -(-total // page_size)
+        page = min(page, total_pages)
+        entries = boards.page(category, (page - 1) * page_size, page_size)
+        
+        embed = EmbedBuilder.ranking_embed(entries, category, page, total_pages, language)
+        embed.set_author(name=t('ranking.scope_guild', guild=guild.name) if guild else t('ranking.scope_global'))
+        rank = boards.rank(category, user_id)
+        if rank:
+            embed.description = t('ranking.your_position', rank=rank, total=total)
+        else:
+            embed.description = t('ranking.not_ranked')
+        
+        # Subidas da semana vêm do histórico global
+        climbers = leaderboards.climbers(category)
+        if page == 1 and climbers and not guild:
+            embed.add_field(
+                name=t('ranking.climbers_title'),
+                value="\n".join(t('ranking.climber', position=climber['position'], team=climber['team_name'],
+                                  change=climber['change']) for climber in climbers),
+                inline=False
+            )
+        
+        if total_pages > 1:
+            def token(target_page: int) -> str:
+                return PageToken.encode('ranking', user_id, target_page, False, (), category, scope)
+            
+            prev_id = token(page - 1) if page > 1 else None
+            next_id = token(page + 1) if page < total_pages else None
+            for button in ButtonBuilder.page_buttons(prev_id, next_id, language):
+                view.add_item(button)
+            
+            # Pula direto para a página de quem pediu
+            my_page = -(-rank // page_size) if rank else None
+            view.add_item(discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label=t('ranking.jump_to_me'),
+                emoji="📍",
+                custom_id=f"{token(my_page)}:me" if my_page else "page:none:me",
+                disabled=my_page is None or my_page == page
+            ))
+        
+        return embed, view
     
     @app_commands.command(name="estatisticas", description="Mostra suas estatísticas")
     async def show_stats(self, interaction: discord.Interaction):
         """Mostra estatísticas do usuário"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -489,8 +338,8 @@ class MatchesCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!",
+                t('common.no_team'),
+                t('common.no_team_text'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -500,11 +349,6 @@ class MatchesCog(commands.Cog):
         user = await self.db.get_user(user_id)
         players = await self.db.get_user_players(user_id)
         
-        # Calcula estatísticas
-        total_players = len(players)
-        starters = [p for p in players if p['is_starter']]
-        avg_overall = GameLogic.calculate_team_overall(starters) if starters else 0
-        
         # Conta jogadores por raridade
         rarity_counts = {}
         for player in players:
@@ -513,38 +357,56 @@ class MatchesCog(commands.Cog):
         
         # Cria embed
         embed = EmbedBuilder.create_embed(
-            f"{EMOJIS['stats']} Estatísticas - {team['team_name']}",
-            f"Estatísticas detalhadas do seu time",
+            t('stats.title', team=team['team_name']),
+            t('stats.description'),
             COLORS['primary']
         )
         
         embed.add_field(
-            name="📊 Record",
-            value=f"**Vitórias:** {team['wins']}\n**Derrotas:** {team['losses']}\n**Win Rate:** {(team['wins']/(team['wins']+team['losses'])*100):.1f}%" if (team['wins']+team['losses']) > 0 else "0%",
+            name=t('stats.record_title'),
+            value=t('stats.record', wins=team['wins'], losses=team['losses'],
+                    rate=team['wins']/(team['wins']+team['losses'])*100) if (team['wins']+team['losses']) > 0 else t('stats.no_games'),
             inline=True
         )
         
         embed.add_field(
-            name="💰 Economia",
-            value=f"**Dinheiro:** ${user['money']:,}\n**Jogadores:** {total_players}\n**Titulares:** {len(starters)}/5",
+            name=t('common.economy'),
+            value=t('stats.economy', money=user['money'], players=team['roster_size'], starters=team['starters']),
             inline=True
         )
         
         embed.add_field(
-            name="🏀 Time",
-            value=f"**Overall Médio:** {avg_overall:.1f}\n**Melhor Jogador:** {max(players, key=lambda x: x['overall'])['name'] if players else 'N/A'}",
+            name=t('stats.team_title'),
+            value=t('stats.team', avg=team['avg_overall'],
+                    best=max(players, key=lambda x: x['overall'])['name'] if players else t('stats.none')),
             inline=True
         )
         
+        # Posição no ranking de overall e evolução diária na última semana
+        rank = leaderboards.rank('overall', user_id)
+        if rank:
+            now = int(time.time())
+            history = await self.db.get_rank_history(user_id, 'overall', 86400, now - 6 * 86400, now)
+            lines = [t('stats.ranking', rank=rank, total=leaderboards.count('overall'))]
+            change = leaderboards.rank_change('overall', user_id)
+            if change is not None:
+                lines.append(t('stats.ranking_week', change=change))
+            lines.append("`" + " → ".join(f"#{point['rank']}" if point['rank'] else "—" for point in history) + "`")
+            
+            embed.add_field(
+                name=t('stats.ranking_title'),
+                value="\n".join(lines),
+                inline=False
+            )
+        
         # Adiciona distribuição por raridade
         if rarity_counts:
             rarity_text = ""
             for rarity, count in rarity_counts.items():
-                rarity_emoji = {'comum': '⚪', 'raro': '🔵', 'épico': '🟣', 'lendário': '🟡'}
-                rarity_text += f"{rarity_emoji.get(rarity, '⚪')} {rarity}: {count}\n"
+                rarity_text += f"{RARITY_EMOJIS.get(rarity, '⚪')} {t(f'rarity.{rarity}')}: {count}\n"
             
             embed.add_field(
-                name="⭐ Raridades",
+                name=t('stats.rarities'),
                 value=rarity_text,
                 inline=False
             )
@@ -555,6 +417,7 @@ class MatchesCog(commands.Cog):
     async def show_match_history(self, interaction: discord.Interaction):
         """Mostra histórico de partidas"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -562,8 +425,8 @@ class MatchesCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!",
+                t('common.no_team'),
+                t('common.no_team_text'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -573,23 +436,21 @@ class MatchesCog(commands.Cog):
         # (implementar histórico completo no database)
         
         embed = EmbedBuilder.create_embed(
-            f"{EMOJIS['game']} Histórico de Partidas",
-            f"Histórico de partidas do {team['team_name']}",
+            t('history.title'),
+            t('history.description', team=team['team_name']),
             COLORS['info']
         )
         
         embed.add_field(
-            name="📊 Resumo",
-            value=f"**Total de Partidas:** {team['wins'] + team['losses']}\n"
-                  f"**Vitórias:** {team['wins']}\n"
-                  f"**Derrotas:** {team['losses']}\n"
-                  f"**Win Rate:** {(team['wins']/(team['wins']+team['losses'])*100):.1f}%" if (team['wins']+team['losses']) > 0 else "0%",
+            name=t('history.summary_title'),
+            value=t('history.summary', total=team['wins'] + team['losses'], wins=team['wins'], losses=team['losses'],
+                    rate=team['wins']/(team['wins']+team['losses'])*100) if (team['wins']+team['losses']) > 0 else t('stats.no_games'),
             inline=False
         )
         
         embed.add_field(
-            name="ℹ️ Informação",
-            value="Histórico detalhado de partidas será implementado em breve!",
+            name=t('common.info'),
+            value=t('history.coming_soon'),
             inline=False
         )
         
@@ -1,22 +1,27 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import asyncio
+import logging
 from datetime import datetime, timedelta
-from database import Database
-from utils import EmbedBuilder, ButtonBuilder, GameLogic
-from config import COLORS, EMOJIS, ECONOMY, TIMERS
+from utils import EmbedBuilder, ButtonBuilder, GameLogic, LanguageManager, PageToken, RARITY_EMOJIS
+from config import COLORS, EMOJIS, ECONOMY, TIMERS, PAGINATION
+from rate_limit import rate_limited
+
+log = logging.getLogger(__name__)
 
 class ShopCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="loja", description="Mostra a loja de jogadores")
+    @rate_limited('shop')
     async def show_shop(self, interaction: discord.Interaction):
         """Mostra a loja de jogadores"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -24,57 +29,90 @@ class ShopCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!\nUse `/criartime` para criar seu time.",
+                t('common.no_team'),
+                t('common.need_team_hint'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
             return
         
-        # Obtém itens da loja
-        shop_items = await self.db.get_shop_items()
+        # Obtém dinheiro do usuário
+        user = await self.db.get_user(user_id)
         
-        if not shop_items:
+        # Monta a primeira página da loja
+        embed, view = await self.build_shop_page(user, 1, None, False, t.language)
+        
+        if not embed:
             embed = EmbedBuilder.create_embed(
-                "🛒 Loja Vazia",
-                "A loja está vazia no momento.\nTente novamente em alguns minutos!",
+                t('shop.empty_title'),
+                t('shop.empty'),
                 COLORS['warning']
             )
             await interaction.followup.send(embed=embed)
             return
         
-        # Obtém dinheiro do usuário
-        user = await self.db.get_user(user_id)
+        await interaction.followup.send(embed=embed, view=view)
+    
+    async def build_shop_page(self, user: Dict, page: int, cursor: Optional[Tuple], backwards: bool,
+                              language: str = 'pt'):
+        """Monta embed e botões de uma página da loja (None se a loja estiver vazia)"""
+        page_size = PAGINATION['shop_page_size']
+        items, has_more, total = await self.db.get_shop_page(cursor, backwards, page_size)
+        
+        # A loja girou desde a última página: volta para o início
+        if not items and cursor:
+            page, backwards = 1, False
+            items, has_more, total = await self.db.get_shop_page(None, False, page_size)
+        
+        if not items:
+            return None, None
+        
+        total_pages = max(1, -(-total // page_size))
+        has_prev = has_more if backwards else page > 1
+        has_next = True if backwards else has_more
         
-        embed = EmbedBuilder.shop_embed(shop_items)
+        def token(target_page: int, to_backwards: bool, item: Dict) -> str:
+            edge = (item['rarity'], item['overall'], item['id'])
+            return PageToken.encode('shop', user['user_id'], target_page, to_backwards, edge)
+        
+        prev_id = token(page - 1, True, items[0]) if has_prev else None
+        next_id = token(page + 1, False, items[-1]) if has_next else None
+        
+        t = LanguageManager.translator(language)
+        embed = EmbedBuilder.shop_embed(items, (page - 1) * page_size + 1, page, total_pages, language)
         embed.add_field(
-            name="💰 Seu Dinheiro",
-            value=f"**${user['money']:,}**",
+            name=t('shop.your_money'),
+            value=t('common.money', amount=user['money']),
             inline=False
         )
         
         # Adiciona botões
         view = discord.ui.View()
+        if total_pages > 1:
+            for button in ButtonBuilder.page_buttons(prev_id, next_id, language):
+                view.add_item(button)
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.primary,
-            label="Atualizar Loja",
+            label=t('shop.refresh'),
             emoji=EMOJIS['reload'],
             custom_id="refresh_shop"
         ))
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.success,
-            label="Comprar Pack",
+            label=t('shop.buy_pack'),
             emoji=EMOJIS['shop'],
             custom_id="buy_pack"
         ))
         
-        await interaction.followup.send(embed=embed, view=view)
+        return embed, view
     
     @app_commands.command(name="comprar", description="Compra um jogador da loja")
     @app_commands.describe(numero="Número do jogador na loja")
+    @rate_limited('shop')
     async def buy_player(self, interaction: discord.Interaction, numero: int):
         """Compra um jogador da loja"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -82,8 +120,8 @@ class ShopCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!",
+                t('common.no_team'),
+                t('common.need_team'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -94,8 +132,8 @@ class ShopCog(commands.Cog):
         
         if not shop_items:
             embed = EmbedBuilder.create_embed(
-                "❌ Loja Vazia",
-                "A loja está vazia no momento.",
+                t('shop.empty_short_title'),
+                t('shop.empty_short'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -104,8 +142,8 @@ class ShopCog(commands.Cog):
         # Verifica se o número é válido
         if numero < 1 or numero > len(shop_items):
             embed = EmbedBuilder.create_embed(
-                "❌ Número Inválido",
-                f"Digite um número entre 1 e {len(shop_items)}.",
+                t('shop.invalid_number_title'),
+                t('shop.invalid_number', count=len(shop_items)),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -120,8 +158,8 @@ class ShopCog(commands.Cog):
         # Verifica se tem dinheiro suficiente
         if user['money'] < selected_item['price']:
             embed = EmbedBuilder.create_embed(
-                "❌ Dinheiro Insuficiente",
-                f"Você precisa de **${selected_item['price']:,}** mas tem apenas **${user['money']:,}**.",
+                t('common.insufficient_money'),
+                t('shop.need_money', price=selected_item['price'], money=user['money']),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -132,33 +170,35 @@ class ShopCog(commands.Cog):
         
         if success:
             embed = EmbedBuilder.create_embed(
-                "✅ Compra Realizada!",
-                f"Você comprou **{selected_item['name']}** por **${selected_item['price']:,}**!\n\n"
-                f"Overall: {selected_item['overall']} | Time: {selected_item['team']}\n"
-                f"Raridade: {selected_item['rarity']} | Posição: {selected_item['position']}",
+                t('shop.bought_title'),
+                t('shop.bought', name=selected_item['name'], price=selected_item['price'])
+                + t('common.player_details', overall=selected_item['overall'], team=selected_item['team'],
+                    rarity=t(f"rarity.{selected_item['rarity']}"), position=selected_item['position']),
                 COLORS['success']
             )
             
             # Atualiza dinheiro restante
             remaining_money = user['money'] - selected_item['price']
             embed.add_field(
-                name="💰 Dinheiro Restante",
-                value=f"**${remaining_money:,}**",
+                name=t('common.remaining_money'),
+                value=t('common.money', amount=remaining_money),
                 inline=False
             )
         else:
             embed = EmbedBuilder.create_embed(
-                "❌ Erro na Compra",
-                "Erro ao realizar a compra. Tente novamente.",
+                t('shop.buy_error_title'),
+                t('shop.buy_error'),
                 COLORS['error']
             )
         
         await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="pack", description="Abre um pack gratuito de jogadores")
+    @rate_limited('pack')
     async def open_free_pack(self, interaction: discord.Interaction):
         """Abre um pack gratuito"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -166,8 +206,8 @@ class ShopCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!",
+                t('common.no_team'),
+                t('common.need_team'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -191,14 +231,14 @@ class ShopCog(commands.Cog):
                     seconds = int(remaining_time % 60)
                     
                     embed = EmbedBuilder.create_embed(
-                        "⏰ Cooldown",
-                        f"Você pode abrir outro pack em **{minutes}m {seconds}s**.",
+                        t('common.cooldown'),
+                        t('pack.cooldown', minutes=minutes, seconds=seconds),
                         COLORS['warning']
                     )
                     await interaction.followup.send(embed=embed)
                     return
-            except Exception as e:
-                print(f"Erro ao verificar cooldown: {e}")
+            except Exception:
+                log.exception("Erro ao verificar cooldown")
                 # Se houver erro, continua normalmente
         
         # Obtém jogador aleatório
@@ -206,8 +246,8 @@ class ShopCog(commands.Cog):
         
         if not player:
             embed = EmbedBuilder.create_embed(
-                "❌ Erro",
-                "Erro ao gerar jogador. Tente novamente.",
+                t('common.error'),
+                t('pack.generate_error'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -221,50 +261,45 @@ class ShopCog(commands.Cog):
             await self.db.update_last_free_pack(user_id)
             
             # Cria embed do jogador obtido
-            embed = EmbedBuilder.player_card(player)
-            embed.title = "🎁 Pack Aberto!"
-            embed.description = f"🎉 Parabéns! Você obteve:\n\n{embed.description}"
+            embed = EmbedBuilder.player_card(player, language=t.language)
+            embed.title = t('pack.opened_title')
+            embed.description = t('pack.opened', card=embed.description)
             
             # Adiciona informações extras
             embed.add_field(
-                name="📦 Tipo de Pack",
-                value="Pack Gratuito",
+                name=t('pack.type'),
+                value=t('pack.free'),
                 inline=True
             )
             
             embed.add_field(
-                name="⏰ Próximo Pack",
-                value="Em 25 minutos",
+                name=t('pack.next'),
+                value=t('pack.next_in'),
                 inline=True
             )
             
             # Adiciona emoji de raridade
-            rarity_emoji = {
-                'comum': '⚪',
-                'raro': '🔵',
-                'épico': '🟣',
-                'lendário': '🟡'
-            }
-            
             embed.add_field(
-                name="⭐ Raridade",
-                value=f"{rarity_emoji.get(player['rarity'], '⚪')} {player['rarity'].title()}",
+                name=t('card.rarity'),
+                value=f"{RARITY_EMOJIS.get(player['rarity'], '⚪')} {t('rarity.' + player['rarity'])}",
                 inline=True
             )
             
         else:
             embed = EmbedBuilder.create_embed(
-                "❌ Erro",
-                "Erro ao adicionar jogador. Tente novamente.",
+                t('common.error'),
+                t('pack.add_error'),
                 COLORS['error']
             )
         
         await interaction.followup.send(embed=embed)
     
     @app_commands.command(name="packpremium", description="Compra e abre um pack premium")
+    @rate_limited('pack')
     async def buy_premium_pack(self, interaction: discord.Interaction):
         """Compra um pack premium"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -272,8 +307,8 @@ class ShopCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!",
+                t('common.no_team'),
+                t('common.need_team'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -285,8 +320,8 @@ class ShopCog(commands.Cog):
         # Verifica se tem dinheiro suficiente
         if user['money'] < ECONOMY['pack_cost']:
             embed = EmbedBuilder.create_embed(
-                "❌ Dinheiro Insuficiente",
-                f"Pack Premium custa **${ECONOMY['pack_cost']:,}** mas você tem apenas **${user['money']:,}**.",
+                t('common.insufficient_money'),
+                t('pack.premium_need_money', money=user['money']),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -306,32 +341,31 @@ class ShopCog(commands.Cog):
         
         if players:
             embed = EmbedBuilder.create_embed(
-                "🎁 Pack Premium Aberto!",
-                f"Você obteve **{len(players)} jogadores** por **${ECONOMY['pack_cost']:,}**!",
+                t('pack.premium_opened_title'),
+                t('pack.premium_opened', count=len(players)),
                 COLORS['purple']
             )
             
             # Mostra os jogadores obtidos
             for i, player in enumerate(players, 1):
-                rarity_emoji = {'comum': '⚪', 'raro': '🔵', 'épico': '🟣', 'lendário': '🟡'}
                 embed.add_field(
-                    name=f"{i}. {player['name']} {rarity_emoji.get(player['rarity'], '⚪')}",
-                    value=f"Overall: **{player['overall']}** | Time: {player['team']}\n"
-                          f"Raridade: {player['rarity']} | Posição: {player['position']}",
+                    name=f"{i}. {player['name']} {RARITY_EMOJIS.get(player['rarity'], '⚪')}",
+                    value=t('pack.premium_player', overall=player['overall'], team=player['team'],
+                            rarity=t(f"rarity.{player['rarity']}"), position=player['position']),
                     inline=False
                 )
             
             # Atualiza dinheiro restante
             remaining_money = user['money'] - ECONOMY['pack_cost']
             embed.add_field(
-                name="💰 Dinheiro Restante",
-                value=f"**${remaining_money:,}**",
+                name=t('common.remaining_money'),
+                value=t('common.money', amount=remaining_money),
                 inline=False
             )
         else:
             embed = EmbedBuilder.create_embed(
-                "❌ Erro",
-                "Erro ao abrir pack. Seu dinheiro foi devolvido.",
+                t('common.error'),
+                t('pack.premium_error'),
                 COLORS['error']
             )
             # Devolve o dinheiro
@@ -343,6 +377,7 @@ class ShopCog(commands.Cog):
     async def daily_reward(self, interaction: discord.Interaction):
         """Coleta recompensa diária"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -350,8 +385,8 @@ class ShopCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!",
+                t('common.no_team'),
+                t('common.need_team'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -375,14 +410,14 @@ class ShopCog(commands.Cog):
                     minutes = int((remaining_time % 3600) // 60)
                     
                     embed = EmbedBuilder.create_embed(
-                        "⏰ Cooldown",
-                        f"Você pode coletar a recompensa diária em **{hours}h {minutes}m**.",
+                        t('common.cooldown'),
+                        t('daily.cooldown', hours=hours, minutes=minutes),
                         COLORS['warning']
                     )
                     await interaction.followup.send(embed=embed)
                     return
-            except Exception as e:
-                print(f"Erro ao verificar cooldown diário: {e}")
+            except Exception:
+                log.exception("Erro ao verificar cooldown diário")
                 # Se houver erro, continua normalmente
         
         # Adiciona dinheiro
@@ -392,17 +427,16 @@ class ShopCog(commands.Cog):
         await self.db.update_last_daily(user_id)
         
         embed = EmbedBuilder.create_embed(
-            "💰 Recompensa Diária!",
-            f"Você recebeu **${ECONOMY['daily_reward']:,}** como recompensa diária!\n\n"
-            f"Use o dinheiro para comprar jogadores na loja ou abrir packs premium.",
+            t('daily.title'),
+            t('daily.collected'),
             COLORS['success']
         )
         
         # Atualiza dinheiro total
         new_money = user['money'] + ECONOMY['daily_reward']
         embed.add_field(
-            name="💰 Dinheiro Total",
-            value=f"**${new_money:,}**",
+            name=t('daily.total'),
+            value=t('common.money', amount=new_money),
             inline=False
         )
         
@@ -412,6 +446,7 @@ class ShopCog(commands.Cog):
     async def show_money(self, interaction: discord.Interaction):
         """Mostra o dinheiro do usuário"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -419,8 +454,8 @@ class ShopCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você precisa criar um time primeiro!",
+                t('common.no_team'),
+                t('common.need_team'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -430,26 +465,22 @@ class ShopCog(commands.Cog):
         user = await self.db.get_user(user_id)
         
         embed = EmbedBuilder.create_embed(
-            f"{EMOJIS['money']} Seu Dinheiro",
-            f"Você possui **${user['money']:,}**",
+            t('money.title'),
+            t('money.balance', money=user['money']),
             COLORS['gold']
         )
         
         # Adiciona informações sobre como ganhar dinheiro
         embed.add_field(
-            name="💡 Como Ganhar Dinheiro",
-            value="• **Recompensa Diária:** `/diario` (+$1,000)\n"
-                  "• **Vitórias em Partidas:** +$500\n"
-                  "• **Vender Jogadores:** 80% do valor de mercado",
+            name=t('money.earn_title'),
+            value=t('money.earn'),
             inline=False
         )
         
         # Adiciona informações sobre gastos
         embed.add_field(
-            name="💸 Como Gastar Dinheiro",
-            value="• **Loja:** Comprar jogadores\n"
-                  "• **Pack Premium:** $5,000 (3 jogadores)\n"
-                  "• **Derrotas em Partidas:** -$200",
+            name=t('money.spend_title'),
+            value=t('money.spend'),
             inline=False
         )
         
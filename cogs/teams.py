@@ -1,16 +1,19 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import asyncio
-from database import Database
-from utils import EmbedBuilder, ButtonBuilder, GameLogic
-from config import COLORS, EMOJIS, MATCH_SETTINGS
+import logging
+from lineup_renderer import lineup_renderer
+from utils import EmbedBuilder, ButtonBuilder, GameLogic, PageToken, RARITY_EMOJIS
+from config import COLORS, EMOJIS, MATCH_SETTINGS, PAGINATION
+
+log = logging.getLogger(__name__)
 
 class TeamsCog(commands.Cog):
     def __init__(self, bot):
         self.bot = bot
-        self.db = Database()
+        self.db = bot.db
     
     @app_commands.command(name="criartime", description="Cria um novo time de basquete")
     @app_commands.describe(
@@ -20,6 +23,7 @@ class TeamsCog(commands.Cog):
     async def create_team(self, interaction: discord.Interaction, nome: str, logo: Optional[str] = None):
         """Cria um novo time para o usuário"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         username = interaction.user.display_name
@@ -33,8 +37,8 @@ class TeamsCog(commands.Cog):
         existing_team = await self.db.get_team(user_id)
         if existing_team:
             embed = EmbedBuilder.create_embed(
-                "❌ Erro",
-                "Você já possui um time!",
+                t('common.error'),
+                t('team.exists'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -44,19 +48,16 @@ class TeamsCog(commands.Cog):
         success = await self.db.create_team(user_id, nome, logo)
         if success:
             embed = EmbedBuilder.create_embed(
-                f"✅ Time Criado!",
-                f"Seu time **{nome}** foi criado com sucesso!\n\n"
-                f"Use `/time` para ver informações do seu time\n"
-                f"Use `/loja` para comprar jogadores\n"
-                f"Use `/pack` para abrir um pack gratuito",
+                t('team.created_title'),
+                t('team.created', name=nome),
                 COLORS['success']
             )
             if logo:
                 embed.set_thumbnail(url=logo)
         else:
             embed = EmbedBuilder.create_embed(
-                "❌ Erro",
-                "Erro ao criar o time. Tente novamente.",
+                t('common.error'),
+                t('team.create_error'),
                 COLORS['error']
             )
         
@@ -66,6 +67,7 @@ class TeamsCog(commands.Cog):
     async def team_info(self, interaction: discord.Interaction):
         """Mostra informações do time do usuário"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -73,8 +75,8 @@ class TeamsCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!\nUse `/criartime` para criar seu time.",
+                t('common.no_team'),
+                t('common.no_team_hint'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -84,29 +86,63 @@ class TeamsCog(commands.Cog):
         players = await self.db.get_user_players(user_id)
         user = await self.db.get_user(user_id)
         
-        embed = EmbedBuilder.team_overview(team, players, user['money'])
+        # Imagem dos titulares (vem do cache em disco quando a escalação se repete)
+        starters = [p for p in players if p['is_starter']][:5]
+        image_path = None
+        try:
+            image_path = await lineup_renderer.render(team['team_name'], starters)
+        except Exception:
+            log.exception("Erro ao renderizar escalação")
+        
+        embed = EmbedBuilder.team_overview(team, players, user['money'], list_starters=image_path is None,
+                                           language=t.language)
+        extra = {}
+        if image_path:
+            extra['file'] = discord.File(image_path, filename="escalacao.png")
+            embed.set_image(url="attachment://escalacao.png")
         
         # Adiciona botões
         view = discord.ui.View()
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.primary,
-            label="Ver Jogadores",
+            label=t('team.view_players'),
             emoji=EMOJIS['team'],
             custom_id="view_players"
         ))
         view.add_item(discord.ui.Button(
             style=discord.ButtonStyle.success,
-            label="Gerenciar Time",
+            label=t('team.manage'),
             emoji="⚙️",
             custom_id="manage_team"
         ))
         
-        await interaction.followup.send(embed=embed, view=view)
+        await interaction.followup.send(embed=embed, view=view, **extra)
     
     @app_commands.command(name="jogadores", description="Mostra todos os seus jogadores")
-    async def show_players(self, interaction: discord.Interaction):
+    @app_commands.describe(
+        raridade="Filtrar por raridade (opcional)",
+        posicao="Filtrar por posição (opcional)"
+    )
+    @app_commands.choices(
+        raridade=[
+            app_commands.Choice(name="Comum", value="comum"),
+            app_commands.Choice(name="Raro", value="raro"),
+            app_commands.Choice(name="Épico", value="épico"),
+            app_commands.Choice(name="Lendário", value="lendário")
+        ],
+        posicao=[
+            app_commands.Choice(name="PG", value="PG"),
+            app_commands.Choice(name="SG", value="SG"),
+            app_commands.Choice(name="SF", value="SF"),
+            app_commands.Choice(name="PF", value="PF"),
+            app_commands.Choice(name="C", value="C")
+        ]
+    )
+    async def show_players(self, interaction: discord.Interaction,
+                           raridade: Optional[str] = None, posicao: Optional[str] = None):
         """Mostra todos os jogadores do usuário"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -114,80 +150,81 @@ class TeamsCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!",
+                t('common.no_team'),
+                t('common.no_team_text'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
             return
         
-        # Obtém jogadores
-        players = await self.db.get_user_players(user_id)
-        
-        if not players:
-            embed = EmbedBuilder.create_embed(
-                "📭 Sem Jogadores",
-                "Você ainda não tem jogadores!\nUse `/loja` para comprar jogadores ou `/pack` para abrir um pack.",
-                COLORS['warning']
-            )
+        # Monta a primeira página
+        embed, view = await self.build_roster_page(user_id, team, 1, None, False, raridade, posicao, t.language)
+        
+        if not embed:
+            if raridade or posicao:
+                embed = EmbedBuilder.create_embed(
+                    t('roster.no_match_title'),
+                    t('roster.no_match'),
+                    COLORS['warning']
+                )
+            else:
+                embed = EmbedBuilder.create_embed(
+                    t('common.no_players'),
+                    t('roster.empty'),
+                    COLORS['warning']
+                )
             await interaction.followup.send(embed=embed)
             return
         
-        # Separa titulares e reservas
-        starters = [p for p in players if p['is_starter']]
-        bench = [p for p in players if not p['is_starter']]
-        
-        embed = EmbedBuilder.create_embed(
-            f"👥 Jogadores - {team['team_name']}",
-            f"**Titulares:** {len(starters)}/5 | **Reservas:** {len(bench)}",
-            COLORS['primary']
+        await interaction.followup.send(embed=embed, view=view)
+    
+    async def build_roster_page(self, user_id: int, team: Dict, page: int, cursor: Optional[Tuple],
+                                backwards: bool, rarity: Optional[str], position: Optional[str],
+                                language: str = 'pt'):
+        """Monta embed e botões de uma página do elenco (None se não houver jogadores)"""
+        summary = await self.db.get_roster_summary(user_id, rarity, position)
+        if summary['total'] == 0:
+            return None, None
+        
+        page_size = PAGINATION['roster_page_size']
+        players, has_more = await self.db.get_user_players_page(
+            user_id, cursor, backwards, page_size, rarity, position
         )
         
-        # Lista titulares
-        if starters:
-            starters_text = ""
-            for i, player in enumerate(starters[:5], 1):
-                rarity_emoji = {'comum': '⚪', 'raro': '🔵', 'épico': '🟣', 'lendário': '🟡'}
-                starters_text += f"{i}. {player['name']} ({player['overall']}) {rarity_emoji.get(player['rarity'], '⚪')}\n"
-            
-            embed.add_field(
-                name="⭐ Titulares",
-                value=starters_text,
-                inline=False
+        # A lista mudou desde a última página (ex: venda): volta para o início
+        if not players:
+            page, backwards = 1, False
+            players, has_more = await self.db.get_user_players_page(
+                user_id, None, False, page_size, rarity, position
             )
         
-        # Lista reservas
-        if bench:
-            bench_text = ""
-            for i, player in enumerate(bench[:10], 1):  # Máximo 10 reservas
-                rarity_emoji = {'comum': '⚪', 'raro': '🔵', 'épico': '🟣', 'lendário': '🟡'}
-                bench_text += f"{i}. {player['name']} ({player['overall']}) {rarity_emoji.get(player['rarity'], '⚪')}\n"
-            
-            embed.add_field(
-                name="🪑 Reservas",
-                value=bench_text,
-                inline=False
-            )
+        total_pages = max(1, -(-summary['total'] // page_size))
+        has_prev = has_more if backwards else page > 1
+        has_next = True if backwards else has_more
         
-        # Adiciona estatísticas
-        if players:
-            avg_overall = sum(p['overall'] for p in players) / len(players)
-            highest_rarity = max(players, key=lambda x: {'comum': 1, 'raro': 2, 'épico': 3, 'lendário': 4}[x['rarity']])
-            
-            embed.add_field(
-                name="📊 Estatísticas",
-                value=f"**Overall Médio:** {avg_overall:.1f}\n"
-                      f"**Melhor Jogador:** {highest_rarity['name']} ({highest_rarity['overall']})\n"
-                      f"**Total de Jogadores:** {len(players)}",
-                inline=False
-            )
+        def token(target_page: int, to_backwards: bool, player: Dict) -> str:
+            edge = (int(player['is_starter']), player['overall'], player['id'])
+            return PageToken.encode('roster', user_id, target_page, to_backwards, edge, rarity, position)
         
-        await interaction.followup.send(embed=embed)
+        prev_id = token(page - 1, True, players[0]) if has_prev else None
+        next_id = token(page + 1, False, players[-1]) if has_next else None
+        
+        embed = EmbedBuilder.roster_embed(
+            team, players, summary, (page - 1) * page_size + 1, page, total_pages, language
+        )
+        
+        view = discord.ui.View()
+        if total_pages > 1:
+            for button in ButtonBuilder.page_buttons(prev_id, next_id, language):
+                view.add_item(button)
+        
+        return embed, view
     
     @app_commands.command(name="titular", description="Define um jogador como titular")
     async def set_starter(self, interaction: discord.Interaction):
         """Define um jogador como titular"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -195,8 +232,8 @@ class TeamsCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!",
+                t('common.no_team'),
+                t('common.no_team_text'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -207,8 +244,8 @@ class TeamsCog(commands.Cog):
         
         if not players:
             embed = EmbedBuilder.create_embed(
-                "📭 Sem Jogadores",
-                "Você não tem jogadores para definir como titular!",
+                t('common.no_players'),
+                t('lineup.no_players_starter'),
                 COLORS['warning']
             )
             await interaction.followup.send(embed=embed)
@@ -219,8 +256,8 @@ class TeamsCog(commands.Cog):
         
         if not bench_players:
             embed = EmbedBuilder.create_embed(
-                "ℹ️ Todos Titulares",
-                "Todos os seus jogadores já são titulares!",
+                t('lineup.all_starters_title'),
+                t('lineup.all_starters'),
                 COLORS['info']
             )
             await interaction.followup.send(embed=embed)
@@ -228,16 +265,15 @@ class TeamsCog(commands.Cog):
         
         # Cria embed com lista de jogadores
         embed = EmbedBuilder.create_embed(
-            "⭐ Definir Titular",
-            "Selecione um jogador para definir como titular:",
+            t('lineup.starter_title'),
+            t('lineup.starter_prompt'),
             COLORS['primary']
         )
         
         # Cria menu suspenso com jogadores
         options = []
         for player in bench_players[:25]:  # Discord limita a 25 opções
-            rarity_emoji = {'comum': '⚪', 'raro': '🔵', 'épico': '🟣', 'lendário': '🟡'}
-            emoji = rarity_emoji.get(player['rarity'], '⚪')
+            emoji = RARITY_EMOJIS.get(player['rarity'], '⚪')
             options.append(discord.SelectOption(
                 label=f"{player['name']} ({player['overall']})",
                 value=str(player['id']),
@@ -247,7 +283,7 @@ class TeamsCog(commands.Cog):
         
         # Cria o menu suspenso
         select = discord.ui.Select(
-            placeholder="Escolha um jogador...",
+            placeholder=t('common.choose_player'),
             options=options,
             custom_id="select_starter"
         )
@@ -262,6 +298,7 @@ class TeamsCog(commands.Cog):
     async def set_bench(self, interaction: discord.Interaction):
         """Define um jogador como reserva"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -269,8 +306,8 @@ class TeamsCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!",
+                t('common.no_team'),
+                t('common.no_team_text'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -281,8 +318,8 @@ class TeamsCog(commands.Cog):
         
         if not players:
             embed = EmbedBuilder.create_embed(
-                "📭 Sem Jogadores",
-                "Você não tem jogadores para definir como reserva!",
+                t('common.no_players'),
+                t('lineup.no_players_bench'),
                 COLORS['warning']
             )
             await interaction.followup.send(embed=embed)
@@ -293,8 +330,8 @@ class TeamsCog(commands.Cog):
         
         if not starter_players:
             embed = EmbedBuilder.create_embed(
-                "ℹ️ Sem Titulares",
-                "Você não tem jogadores titulares para definir como reserva!",
+                t('lineup.no_starters_title'),
+                t('lineup.no_starters'),
                 COLORS['info']
             )
             await interaction.followup.send(embed=embed)
@@ -302,16 +339,15 @@ class TeamsCog(commands.Cog):
         
         # Cria embed com lista de jogadores
         embed = EmbedBuilder.create_embed(
-            "🪑 Definir Reserva",
-            "Selecione um jogador para definir como reserva:",
+            t('lineup.bench_title'),
+            t('lineup.bench_prompt'),
             COLORS['primary']
         )
         
         # Cria menu suspenso com jogadores
         options = []
         for player in starter_players[:25]:  # Discord limita a 25 opções
-            rarity_emoji = {'comum': '⚪', 'raro': '🔵', 'épico': '🟣', 'lendário': '🟡'}
-            emoji = rarity_emoji.get(player['rarity'], '⚪')
+            emoji = RARITY_EMOJIS.get(player['rarity'], '⚪')
             options.append(discord.SelectOption(
                 label=f"{player['name']} ({player['overall']})",
                 value=str(player['id']),
@@ -321,7 +357,7 @@ class TeamsCog(commands.Cog):
         
         # Cria o menu suspenso
         select = discord.ui.Select(
-            placeholder="Escolha um jogador...",
+            placeholder=t('common.choose_player'),
             options=options,
             custom_id="select_bench"
         )
@@ -336,6 +372,7 @@ class TeamsCog(commands.Cog):
     async def sell_player(self, interaction: discord.Interaction):
         """Vende um jogador"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -343,8 +380,8 @@ class TeamsCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!",
+                t('common.no_team'),
+                t('common.no_team_text'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -355,8 +392,8 @@ class TeamsCog(commands.Cog):
         
         if not players:
             embed = EmbedBuilder.create_embed(
-                "📭 Sem Jogadores",
-                "Você não tem jogadores para vender!",
+                t('common.no_players'),
+                t('sell.no_players'),
                 COLORS['warning']
             )
             await interaction.followup.send(embed=embed)
@@ -364,28 +401,28 @@ class TeamsCog(commands.Cog):
         
         # Cria embed com lista de jogadores
         embed = EmbedBuilder.create_embed(
-            "💰 Vender Jogador",
-            "Selecione um jogador para vender:",
+            t('sell.title'),
+            t('sell.prompt'),
             COLORS['warning']
         )
         
         # Cria menu suspenso com jogadores
         options = []
         for player in players[:25]:  # Discord limita a 25 opções
-            rarity_emoji = {'comum': '⚪', 'raro': '🔵', 'épico': '🟣', 'lendário': '🟡'}
             sell_value = int(player['market_value'] * 0.8)
-            emoji = rarity_emoji.get(player['rarity'], '⚪')
+            emoji = RARITY_EMOJIS.get(player['rarity'], '⚪')
             
             options.append(discord.SelectOption(
                 label=f"{player['name']} (${sell_value:,})",
                 value=str(player['id']),
-                description=f"Overall: {player['overall']} | {player['position']} - {player['team']}",
+                description=t('sell.option', overall=player['overall'], position=player['position'],
+                              team=player['team']),
                 emoji=emoji
             ))
         
         # Cria o menu suspenso
         select = discord.ui.Select(
-            placeholder="Escolha um jogador para vender...",
+            placeholder=t('sell.placeholder'),
             options=options,
             custom_id="select_sell"
         )
@@ -400,6 +437,7 @@ class TeamsCog(commands.Cog):
     async def set_position(self, interaction: discord.Interaction):
         """Define a posição de um jogador no time"""
         await interaction.response.defer()
+        t = await self.bot.locales.translator(interaction)
         
         user_id = interaction.user.id
         
@@ -407,8 +445,8 @@ class TeamsCog(commands.Cog):
         team = await self.db.get_team(user_id)
         if not team:
             embed = EmbedBuilder.create_embed(
-                "❌ Sem Time",
-                "Você ainda não criou um time!",
+                t('common.no_team'),
+                t('common.no_team_text'),
                 COLORS['error']
             )
             await interaction.followup.send(embed=embed)
@@ -420,8 +458,8 @@ class TeamsCog(commands.Cog):
         
         if len(starter_players) < 5:
             embed = EmbedBuilder.create_embed(
-                "⚠️ Time Incompleto",
-                f"Você precisa de 5 titulares para definir posições. Atualmente tem {len(starter_players)}.",
+                t('common.incomplete_team'),
+                t('lineup.positions_incomplete', count=len(starter_players)),
                 COLORS['warning']
             )
             await interaction.followup.send(embed=embed)
@@ -429,19 +467,13 @@ class TeamsCog(commands.Cog):
         
         # Cria embed com posições
         embed = EmbedBuilder.create_embed(
-            "🏀 Definir Posições",
-            "Selecione a posição para cada jogador:",
+            t('lineup.positions_title'),
+            t('lineup.positions_prompt'),
             COLORS['primary']
         )
         
         # Posições do basquete
-        positions = {
-            'PG': 'Point Guard (Armador)',
-            'SG': 'Shooting Guard (Ala-armador)', 
-            'SF': 'Small Forward (Ala)',
-            'PF': 'Power Forward (Ala-pivô)',
-            'C': 'Center (Pivô)'
-        }
+        positions = {pos: t(f"position.{pos}") for pos in ('PG', 'SG', 'SF', 'PF', 'C')}
         
         # Cria menus suspensos para cada posição
         view = discord.ui.View()
@@ -470,7 +502,7 @@ class TeamsCog(commands.Cog):
             
             # Cria o menu para esta posição
             select = discord.ui.Select(
-                placeholder=f"Selecione {pos} ({desc})",
+                placeholder=t('lineup.position_placeholder', position=pos, description=desc),
                 options=options,
                 custom_id=f"position_{pos}"
             )
@@ -65,6 +65,12 @@ LANGUAGES = {
     'es': 'Español'
 }
 
+# Localização (catálogos em locales/)
+LOCALIZATION = {
+    'default_language': 'pt',
+    'cache_size': 50000       # Preferências de idioma de usuários/servidores em memória
+}
+
 # Configurações de Partida
 MATCH_SETTINGS = {
     'max_players_per_team': 15,
@@ -74,6 +80,182 @@ MATCH_SETTINGS = {
     'decision_time': 30     # 30 segundos para decisões
 }
 
+# Paginação das listagens
+PAGINATION = {
+    'roster_page_size': 10,   # Jogadores por página em /jogadores
+    'shop_page_size': 5,      # Itens por página em /loja
+    'ranking_page_size': 10   # Times por página em /ranking
+}
+
+# Histórico dos rankings (um ponto por intervalo, só quando a posição ou o valor muda)
+RANKING_HISTORY = {
+    'snapshot_interval': 3600,         # Segundos entre snapshots
+    'climbers_window': 7 * 86400,      # Janela das "maiores subidas"
+    'resolutions': {                   # Segundos por ponto -> por quanto tempo guardar
+        3600: 7 * 86400,               # Por hora, 7 dias
+        86400: 180 * 86400,            # Por dia, 6 meses
+        604800: 2 * 365 * 86400        # Por semana, 2 anos
+    }
+}
+
+# Rankings por servidor
+GUILD_RANKINGS = {
+    'guild_cache_size': 200,       # Servidores com ranking montado em memória (LRU)
+    'member_cache_size': 100000    # Pares (servidor, usuário) já gravados no índice de membros
+}
+
+# Intents que cada funcionalidade precisa (comandos slash e botões só precisam de guilds)
+FEATURE_INTENTS = {
+    'interactions': ('guilds',),                           # Comandos slash, botões, canais do servidor
+    'member_events': ('members',),                         # Entrada/saída e atualização de membros
+    'prefix_commands': ('guild_messages', 'message_content'),
+    'presences': ('presences',)
+}
+
+# Perfis de conexão com o gateway: intents, cache de membros, cache de mensagens e chunking
+GATEWAY_PROFILES = {
+    'minimal': {                   # O que o bot usa hoje: só interações
+        'features': ['interactions'],
+        'member_cache': 'none',
+        'max_messages': None,
+        'chunk_guilds_at_startup': False
+    },
+    'members': {                   # Membros em cache conforme chegam eventos (sem chunking)
+        'features': ['interactions', 'member_events'],
+        'member_cache': 'from_intents',
+        'max_messages': None,
+        'chunk_guilds_at_startup': False
+    },
+    'full': {                      # Comportamento antigo: Intents.all() e caches padrão
+        'features': list(FEATURE_INTENTS),
+        'all_intents': True,
+        'member_cache': 'all',
+        'max_messages': 1000,
+        'chunk_guilds_at_startup': True
+    }
+}
+
+GATEWAY = {
+    'profile': os.getenv('GATEWAY_PROFILE', 'minimal')
+}
+
+# Sincronização dos comandos slash (só roda quando o hash dos comandos muda)
+COMMAND_SYNC = {
+    'sync_global': os.getenv('SYNC_GLOBAL', '1') == '1',
+    'dev_guilds': [int(guild_id) for guild_id in os.getenv('DEV_GUILD_IDS', '').split(',') if guild_id.strip()],
+    'force': os.getenv('FORCE_COMMAND_SYNC', '0') == '1'    # Sincroniza mesmo sem mudanças
+}
+
+# Métricas no formato do Prometheus (servidor HTTP local)
+METRICS = {
+    'enabled': os.getenv('METRICS_ENABLED', '1') == '1',
+    'host': os.getenv('METRICS_HOST', '127.0.0.1'),
+    'port': int(os.getenv('METRICS_PORT', '9108'))
+}
+
+# Vigia do event loop (atraso contínuo + pilha de quem bloqueia)
+LOOP_WATCHDOG = {
+    'interval': 0.1,            # Segundos entre batimentos
+    'block_threshold': 0.1,     # Atraso a partir do qual o loop conta como bloqueado
+    'window': 3000,             # Amostras usadas nos percentis (~5 min)
+    'max_sites': 200,           # Linhas culpadas guardadas
+    'top_sites': 3              # Linhas mostradas no /status
+}
+
+# Logs estruturados (JSON, um por linha) com rotação e compressão
+LOGGING = {
+    'dir': os.getenv('LOG_DIR', 'logs'),
+    'file': 'hoopcore.log',
+    'level': os.getenv('LOG_LEVEL', 'INFO'),
+    'max_bytes': 10 * 1024 * 1024,   # Tamanho do arquivo antes de rotacionar
+    'backup_count': 10,              # Arquivos .gz guardados
+    'queue_size': 10000,             # Registros pendentes antes de descartar
+    'sample_window': 60,             # Segundos da janela de amostragem de erros repetidos
+    'sample_burst': 10,              # Erros iguais registrados por janela antes de amostrar
+    'sample_every': 100              # Depois disso, registra 1 a cada N
+}
+
+# Tracing das interações (formato Trace Event, abre no Perfetto / chrome://tracing)
+TRACING = {
+    'enabled': os.getenv('TRACING_ENABLED', '1') == '1',
+    'sample_rate': float(os.getenv('TRACE_SAMPLE_RATE', '0.01')),   # Fração das interações rastreadas
+    'file': os.getenv('TRACE_FILE', 'logs/traces.json'),
+    'max_bytes': 50 * 1024 * 1024    # Tamanho do arquivo antes de rotacionar (guarda um .1)
+}
+
+# Captura de tráfego real (sanitizado) para o benchmarks.replay
+TRAFFIC_CAPTURE = {
+    'enabled': os.getenv('TRAFFIC_CAPTURE', '0') == '1',
+    'sample_rate': float(os.getenv('TRAFFIC_SAMPLE_RATE', '1.0')),  # Fração das interações gravadas
+    'file': os.getenv('TRAFFIC_FILE', 'logs/traffic.jsonl'),
+    'salt': os.getenv('TRAFFIC_SALT'),   # Chave dos hashes de IDs (sem ela, muda a cada processo)
+    'max_bytes': 100 * 1024 * 1024       # Tamanho do arquivo antes de rotacionar (guarda um .1)
+}
+
+# Controle de admissão na frente do banco (picos: descarta cedo em vez de atrasar todo mundo)
+ADMISSION = {
+    'enabled': os.getenv('ADMISSION_ENABLED', '1') == '1',
+    'slots': int(os.getenv('ADMISSION_SLOTS', '256')),  # Máximo de interações e tarefas em andamento
+    'min_slots': 4,                                      # O limite adaptativo não desce daqui
+    'target_latency': 1.0,                               # Duração (desde a chegada) acima da qual o limite encolhe
+    'outlier_latency': 5.0,                              # Durações acima disso (API travada, rota longa) não mexem no limite
+    'background_slots': 2,                               # Quantas vagas as tarefas de fundo podem usar
+    'queue_limits': {'interactive': 500, 'background': 20},   # Tamanho máximo de cada fila
+    'max_wait': {'interactive': 1.0, 'background': None},     # Segundos desde a chegada (o Discord exige resposta em 3s)
+    # Botões do /admin que ficam minutos aguardando (perfil, trava do banco, reconstrução): não ocupam vaga
+    'exempt_routes': ('admin_profile_start', 'admin_faults_hold', 'admin_rebuild_stats')
+}
+
+# Limite por usuário (balde de fichas por classe de rota): capacity é a rajada, per_second a reposição
+RATE_LIMITS = {
+    'enabled': os.getenv('RATE_LIMITS_ENABLED', '1') == '1',
+    'classes': {
+        'pack': {'capacity': 3, 'per_second': 0.2},      # /pack, /packpremium
+        'ranking': {'capacity': 6, 'per_second': 0.5},   # /ranking e botões de categoria
+        'match': {'capacity': 10, 'per_second': 2.0},    # /partida, /desafiar e lances
+        'shop': {'capacity': 6, 'per_second': 1.0}       # /loja, /comprar, páginas e atualização
+    },
+    'sweep_interval': 60        # Segundos entre limpezas dos baldes parados
+}
+
+# Injeção de falhas no acesso ao banco (ensaios e testes de carga; sem regras, desligada)
+# Regras: "método:chave=valor,...;..." com latency (ms), dist (fixed, uniform, exp, lognormal),
+# lock e fail (probabilidades) e wait (ms); '*' vale para os métodos sem regra própria
+FAULT_INJECTION = {
+    'rules': os.getenv('FAULT_INJECTION', ''),
+    'lock_wait': 5.0,           # Segundos até o "database is locked" (timeout padrão do sqlite3.connect)
+    'hold_seconds': 10,         # Trava exclusiva segurada pelo botão do painel
+    'presets': {                # Botões do painel /admin
+        'slow': '*:latency=50,dist=lognormal',
+        'locked': '*:lock=0.05,wait=1000',
+        'flaky': '*:fail=0.02'
+    }
+}
+
+# Profiler por amostragem (painel /admin)
+PROFILER = {
+    'interval': 0.005,          # Segundos entre amostras da pilha
+    'durations': (30, 120),     # Opções de duração nos botões do painel
+    'max_duration': 300,        # Limite (a resposta da interação expira em 15 min)
+    'top_functions': 40         # Linhas do resumo
+}
+
+# Relatório de memória (painel /admin)
+MEMORY = {
+    'tracemalloc_frames': 1,    # Frames guardados por alocação (1 = agrupa por arquivo e linha)
+    'top_lines': 30,            # Linhas do relatório do tracemalloc
+    'size_depth': 12,           # Níveis de referência seguidos ao medir um cache
+    'size_sample': 1000         # Itens medidos por coleção; o resto é estimado
+}
+
+# Imagem dos titulares no /time
+LINEUP_RENDER = {
+    'cache_dir': os.getenv('LINEUP_CACHE_DIR', 'cache/lineups'),
+    'max_cache_bytes': 64 * 1024 * 1024,   # Limite do cache em disco (LRU)
+    'workers': 2,                          # Processos de renderização
+    'font': 'DejaVuSans-Bold.ttf'
+}
+
 # Emojis
 EMOJIS = {
     'basketball': '🏀',
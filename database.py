@@ -1,21 +1,83 @@
 import sqlite3
 import json
 import asyncio
+import logging
+import sys
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import random
-from config import ECONOMY, NBA_TEAMS, RARITIES
+from config import ECONOMY, NBA_TEAMS, RARITIES, RANKING_HISTORY
+from fault_injection import fault_injector
+from metrics import db_errors_total, db_seconds, instrument_methods
+from tracing import trace_methods
 
+log = logging.getLogger(__name__)
+
+@trace_methods('db')
+@instrument_methods(db_seconds, db_errors_total)
 class Database:
+    # PRAGMA user_version depois de todas as migrações. Aumente ao criar tabelas ou índices
+    # em init_database ou ao migrar dados em _migrate: bancos já na versão atual pulam as duas.
+    SCHEMA_VERSION = 4
+    
     def __init__(self, db_path: str = "hoopcore.db"):
         self.db_path = db_path
-        self.init_database()
-        self.load_players_data()
+        self.catalog_listeners = []  # Callbacks chamados quando o catálogo recarrega
+        self.standings_listeners = []  # Callbacks chamados com a nova situação dos times (rankings)
+        self.trace_sql = None  # Recebe cada comando SQL executado (ex: checagem dos planos de consulta)
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Conexão nova ao banco (cada método abre e fecha a sua)"""
+        if fault_injector.active:
+            fault_injector.inject(sys._getframe(1).f_code.co_name)
+        conn = sqlite3.connect(self.db_path)
+        if self.trace_sql:
+            conn.set_trace_callback(self.trace_sql)
+        return conn
+    
+    async def bootstrap(self) -> bool:
+        """Prepara o banco numa thread: esquema, catálogo e loja
+        
+        Retorna se o esquema precisou ser criado ou migrado.
+        """
+        return await asyncio.to_thread(self._bootstrap)
+    
+    def _bootstrap(self) -> bool:
+        conn = self._connect()
+        version = conn.execute('PRAGMA user_version').fetchone()[0]
+        conn.close()
+        
+        migrated = version < self.SCHEMA_VERSION
+        if migrated:
+            self.init_database()
+            self.load_players_data()
+            self._migrate(version)
         self.refresh_shop()  # Inicializa a loja
+        return migrated
+    
+    def _migrate(self, version: int):
+        """Migrações de dados a partir da versão `version` e grava SCHEMA_VERSION"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        # Versão 1: o idioma do usuário passa a ser opcional (NULL segue o servidor).
+        # O /idioma nunca salvou nada antes, então todo 'pt' existente é só o valor padrão.
+        if version < 1:
+            cursor.execute("UPDATE users SET language = NULL WHERE language = 'pt'")
+        
+        # Versão 2: team_stats nasce vazia, então é preenchida a partir dos elencos existentes
+        if version < 2:
+            self._rebuild_team_stats(cursor)
+        
+        # Versões 3 (command_sync) e 4 (idx_teams_user) só criam tabela e índice em init_database
+        
+        cursor.execute(f'PRAGMA user_version = {self.SCHEMA_VERSION}')
+        conn.commit()
+        conn.close()
     
     def init_database(self):
         """Inicializa o banco de dados com todas as tabelas necessárias"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Tabela de usuários
@@ -110,12 +172,132 @@ class Database:
             )
         ''')
         
+        # Resumo por time mantido pelos triggers de user_players (rankings, /time, /jogadores)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS team_stats (
+                user_id INTEGER PRIMARY KEY,
+                roster_size INTEGER NOT NULL DEFAULT 0,
+                roster_overall_sum INTEGER NOT NULL DEFAULT 0,
+                starter_count INTEGER NOT NULL DEFAULT 0,
+                starter_overall_sum INTEGER NOT NULL DEFAULT 0,
+                starter_overall_avg REAL GENERATED ALWAYS AS (
+                    CASE WHEN starter_count > 0 THEN CAST(starter_overall_sum AS REAL) / starter_count END
+                ) VIRTUAL,
+                total_market_value INTEGER NOT NULL DEFAULT 0,
+                FOREIGN KEY (user_id) REFERENCES users (user_id)
+            )
+        ''')
+        
+        # Cada trigger aplica só a diferença da linha alterada
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS team_stats_insert AFTER INSERT ON user_players
+            BEGIN
+                INSERT OR IGNORE INTO team_stats (user_id) VALUES (NEW.user_id);
+                UPDATE team_stats SET
+                    roster_size = roster_size + 1,
+                    roster_overall_sum = roster_overall_sum + p.overall,
+                    starter_count = starter_count + (NEW.is_starter = 1),
+                    starter_overall_sum = starter_overall_sum + (NEW.is_starter = 1) * p.overall,
+                    total_market_value = total_market_value + p.market_value
+                FROM (SELECT overall, market_value FROM players WHERE player_id = NEW.player_id) AS p
+                WHERE user_id = NEW.user_id;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS team_stats_delete AFTER DELETE ON user_players
+            BEGIN
+                UPDATE team_stats SET
+                    roster_size = roster_size - 1,
+                    roster_overall_sum = roster_overall_sum - p.overall,
+                    starter_count = starter_count - (OLD.is_starter = 1),
+                    starter_overall_sum = starter_overall_sum - (OLD.is_starter = 1) * p.overall,
+                    total_market_value = total_market_value - p.market_value
+                FROM (SELECT overall, market_value FROM players WHERE player_id = OLD.player_id) AS p
+                WHERE user_id = OLD.user_id;
+            END
+        ''')
+        cursor.execute('''
+            CREATE TRIGGER IF NOT EXISTS team_stats_update AFTER UPDATE OF user_id, player_id, is_starter ON user_players
+            BEGIN
+                UPDATE team_stats SET
+                    roster_size = roster_size - 1,
+                    roster_overall_sum = roster_overall_sum - p.overall,
+                    starter_count = starter_count - (OLD.is_starter = 1),
+                    starter_overall_sum = starter_overall_sum - (OLD.is_starter = 1) * p.overall,
+                    total_market_value = total_market_value - p.market_value
+                FROM (SELECT overall, market_value FROM players WHERE player_id = OLD.player_id) AS p
+                WHERE user_id = OLD.user_id;
+                INSERT OR IGNORE INTO team_stats (user_id) VALUES (NEW.user_id);
+                UPDATE team_stats SET
+                    roster_size = roster_size + 1,
+                    roster_overall_sum = roster_overall_sum + p.overall,
+                    starter_count = starter_count + (NEW.is_starter = 1),
+                    starter_overall_sum = starter_overall_sum + (NEW.is_starter = 1) * p.overall,
+                    total_market_value = total_market_value + p.market_value
+                FROM (SELECT overall, market_value FROM players WHERE player_id = NEW.player_id) AS p
+                WHERE user_id = NEW.user_id;
+            END
+        ''')
+        
+        # Histórico dos rankings: um ponto por (time, categoria, resolução, intervalo).
+        # Só grava quando posição/valor mudam; a leitura repete o último ponto nos intervalos vazios.
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS ranking_history (
+                user_id INTEGER NOT NULL,
+                category TEXT NOT NULL,
+                resolution INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                rank INTEGER,
+                value REAL,
+                PRIMARY KEY (user_id, category, resolution, bucket)
+            ) WITHOUT ROWID
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_ranking_history_bucket
+            ON ranking_history (resolution, bucket)
+        ''')
+        
+        # Quem já jogou em cada servidor (rankings por servidor)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS guild_members (
+                guild_id INTEGER NOT NULL,
+                user_id INTEGER NOT NULL,
+                joined_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (guild_id, user_id)
+            ) WITHOUT ROWID
+        ''')
+        
+        # Hash dos comandos slash da última sincronização, por escopo (global ou servidor)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS command_sync (
+                scope TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                synced_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        ''')
+        
+        # Índices para as listagens paginadas
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_user_players_user
+            ON user_players (user_id, is_starter)
+        ''')
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_shop_expires
+            ON shop (expires_at)
+        ''')
+        
+        # Busca do time do usuário (/time, partidas, rankings)
+        cursor.execute('''
+            CREATE INDEX IF NOT EXISTS idx_teams_user
+            ON teams (user_id)
+        ''')
+        
         conn.commit()
         conn.close()
     
     def load_players_data(self):
         """Carrega dados dos jogadores da NBA 2025"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Verifica se já existem jogadores
@@ -174,10 +356,14 @@ class Database:
         
         conn.commit()
         conn.close()
+        
+        # Avisa quem mantém dados derivados do catálogo (ex: cache de cards)
+        for callback in self.catalog_listeners:
+            callback()
     
     def refresh_shop(self):
         """Atualiza a loja com novos jogadores"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Remove itens expirados
@@ -213,7 +399,7 @@ class Database:
     
     async def get_user(self, user_id: int) -> Optional[Dict]:
         """Obtém dados de um usuário"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -238,13 +424,13 @@ class Database:
     
     async def create_user(self, user_id: int, username: str) -> bool:
         """Cria um novo usuário"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
             cursor.execute('''
-                INSERT INTO users (user_id, username, money)
-                VALUES (?, ?, ?)
+                INSERT INTO users (user_id, username, money, language)
+                VALUES (?, ?, ?, NULL)
             ''', (user_id, username, ECONOMY['starting_money']))
             
             conn.commit()
@@ -254,14 +440,61 @@ class Database:
             conn.close()
             return False
     
+    async def get_language_settings(self, user_id: Optional[int],
+                                    server_id: Optional[int]) -> Tuple[Optional[str], Optional[str]]:
+        """Obtém (idioma do usuário, idioma do servidor) em uma consulta"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT (SELECT language FROM users WHERE user_id = ?),
+                   (SELECT language FROM server_settings WHERE server_id = ?)
+        ''', (user_id, server_id))
+        
+        result = cursor.fetchone()
+        conn.close()
+        return result[0], result[1]
+    
+    async def set_user_language(self, user_id: int, language: Optional[str]) -> bool:
+        """Define o idioma do usuário (None segue o idioma do servidor)"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            UPDATE users SET language = ? WHERE user_id = ?
+        ''', (language, user_id))
+        
+        success = cursor.rowcount > 0
+        conn.commit()
+        conn.close()
+        return success
+    
+    async def set_server_language(self, server_id: int, language: str) -> bool:
+        """Define o idioma padrão do servidor"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT INTO server_settings (server_id, language) VALUES (?, ?)
+            ON CONFLICT (server_id) DO UPDATE SET language = excluded.language
+        ''', (server_id, language))
+        
+        conn.commit()
+        conn.close()
+        return True
+    
     async def get_team(self, user_id: int) -> Optional[Dict]:
         """Obtém o time de um usuário"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
-            SELECT team_id, team_name, team_logo, wins, losses, created_at
-            FROM teams WHERE user_id = ?
+            SELECT t.team_id, t.team_name, t.team_logo, t.wins, t.losses, t.created_at,
+                   COALESCE(s.roster_size, 0), COALESCE(s.starter_count, 0),
+                   COALESCE(s.starter_overall_avg, 0), COALESCE(s.total_market_value, 0)
+            FROM teams t
+            LEFT JOIN team_stats s ON s.user_id = t.user_id
+            WHERE t.user_id = ?
         ''', (user_id,))
         
         result = cursor.fetchone()
@@ -274,13 +507,17 @@ class Database:
                 'team_logo': result[2],
                 'wins': result[3],
                 'losses': result[4],
-                'created_at': result[5]
+                'created_at': result[5],
+                'roster_size': result[6],
+                'starters': result[7],
+                'avg_overall': result[8],
+                'total_value': result[9]
             }
         return None
     
     async def create_team(self, user_id: int, team_name: str, team_logo: str = None) -> bool:
         """Cria um novo time"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -290,6 +527,7 @@ class Database:
             ''', (user_id, team_name, team_logo))
             
             conn.commit()
+            self._publish_standings(cursor, [user_id])
             conn.close()
             return True
         except sqlite3.IntegrityError:
@@ -298,7 +536,7 @@ class Database:
     
     async def get_user_players(self, user_id: int) -> List[Dict]:
         """Obtém todos os jogadores de um usuário"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -330,9 +568,145 @@ class Database:
         
         return players
     
+    async def get_user_players_page(self, user_id: int, cursor: Optional[Tuple] = None,
+                                    backwards: bool = False, limit: int = 10,
+                                    rarity: str = None, position: str = None) -> Tuple[List[Dict], bool]:
+        """Obtém uma página de jogadores do usuário (paginação por keyset)
+        
+        O cursor é a tupla (is_starter, overall, id) de um jogador já exibido. Retorna
+        os jogadores da página e se existem mais jogadores na direção pedida.
+        """
+        conn = self._connect()
+        db_cursor = conn.cursor()
+        
+        conditions = ["up.user_id = ?"]
+        params = [user_id]
+        if rarity:
+            conditions.append("p.rarity = ?")
+            params.append(rarity)
+        if position:
+            conditions.append("p.position = ?")
+            params.append(position)
+        if cursor:
+            conditions.append(f"(up.is_starter, p.overall, up.id) {'>' if backwards else '<'} (?, ?, ?)")
+            params.extend(cursor)
+        order = "ASC" if backwards else "DESC"
+        
+        db_cursor.execute(f'''
+            SELECT up.id, p.player_id, p.name, p.overall, p.height, p.team, p.rarity, 
+                   p.market_value, p.position, up.is_starter
+            FROM user_players up
+            JOIN players p ON up.player_id = p.player_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY up.is_starter {order}, p.overall {order}, up.id {order}
+            LIMIT ?
+        ''', (*params, limit + 1))
+        
+        results = db_cursor.fetchall()
+        conn.close()
+        
+        has_more = len(results) > limit
+        results = results[:limit]
+        if backwards:
+            results.reverse()
+        
+        players = [{
+            'id': result[0],
+            'player_id': result[1],
+            'name': result[2],
+            'overall': result[3],
+            'height': result[4],
+            'team': result[5],
+            'rarity': result[6],
+            'market_value': result[7],
+            'position': result[8],
+            'is_starter': bool(result[9])
+        } for result in results]
+        
+        return players, has_more
+    
+    async def get_roster_summary(self, user_id: int, rarity: str = None, position: str = None) -> Dict:
+        """Obtém totais do elenco do usuário sem carregar todos os jogadores"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        conditions = ["up.user_id = ?"]
+        params = [user_id]
+        if rarity:
+            conditions.append("p.rarity = ?")
+            params.append(rarity)
+        if position:
+            conditions.append("p.position = ?")
+            params.append(position)
+        where = ' AND '.join(conditions)
+        
+        if len(conditions) == 1:
+            # Sem filtros os totais já estão em team_stats
+            cursor.execute('''
+                SELECT roster_size, starter_count,
+                       CAST(roster_overall_sum AS REAL) / NULLIF(roster_size, 0)
+                FROM team_stats WHERE user_id = ?
+            ''', (user_id,))
+        else:
+            cursor.execute(f'''
+                SELECT COUNT(*), COALESCE(SUM(up.is_starter = 1), 0), AVG(p.overall)
+                FROM user_players up
+                JOIN players p ON up.player_id = p.player_id
+                WHERE {where}
+            ''', params)
+        total, starters, avg_overall = cursor.fetchone() or (0, 0, None)
+        
+        # Melhor jogador: maior raridade, depois a mesma ordem da listagem
+        cursor.execute(f'''
+            SELECT p.name, p.overall
+            FROM user_players up
+            JOIN players p ON up.player_id = p.player_id
+            WHERE {where}
+            ORDER BY CASE p.rarity
+                         WHEN 'lendário' THEN 4 WHEN 'épico' THEN 3
+                         WHEN 'raro' THEN 2 ELSE 1
+                     END DESC,
+                     up.is_starter DESC, p.overall DESC
+            LIMIT 1
+        ''', params)
+        best = cursor.fetchone()
+        conn.close()
+        
+        return {
+            'total': total,
+            'starters': starters,
+            'bench': total - starters,
+            'avg_overall': avg_overall or 0,
+            'best_player': {'name': best[0], 'overall': best[1]} if best else None
+        }
+    
+    async def get_catalog(self) -> List[Dict]:
+        """Obtém todos os jogadores do catálogo"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            SELECT player_id, name, overall, height, team, rarity, market_value, position
+            FROM players ORDER BY player_id
+        ''')
+        
+        results = cursor.fetchall()
+        conn.close()
+        
+        return [{
+            'player_id': result[0],
+            'name': result[1],
+            'overall': result[2],
+            'height': result[3],
+            'team': result[4],
+            'rarity': result[5],
+            'market_value': result[6],
+            'position': result[7]
+        } for result in results]
+    
     async def add_player_to_user(self, user_id: int, player_id: int) -> bool:
         """Adiciona um jogador ao usuário"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -350,7 +724,7 @@ class Database:
     
     async def get_random_player(self) -> Optional[Dict]:
         """Obtém um jogador aleatório baseado na raridade"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         # Determina raridade baseada nas probabilidades
@@ -387,7 +761,7 @@ class Database:
     
     async def update_money(self, user_id: int, amount: int) -> bool:
         """Atualiza o dinheiro de um usuário"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -395,12 +769,13 @@ class Database:
         ''', (amount, user_id))
         
         conn.commit()
+        self._publish_standings(cursor, [user_id])
         conn.close()
         return True
     
     async def update_player_starter_status(self, user_id: int, player_id: int, is_starter: bool) -> bool:
         """Atualiza o status de titular/reserva de um jogador"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -424,16 +799,17 @@ class Database:
             ''', (is_starter, user_id, player_id))
             
             conn.commit()
+            self._publish_standings(cursor, [user_id])
             conn.close()
             return True
-        except Exception as e:
-            print(f"Erro ao atualizar status do jogador: {e}")
+        except Exception:
+            log.exception("Erro ao atualizar status do jogador")
             conn.close()
             return False
     
     async def sell_player(self, user_id: int, player_id: int) -> Optional[int]:
         """Vende um jogador e retorna o valor da venda"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -464,16 +840,17 @@ class Database:
             ''', (sell_value, user_id))
             
             conn.commit()
+            self._publish_standings(cursor, [user_id])
             conn.close()
             return sell_value
-        except Exception as e:
-            print(f"Erro ao vender jogador: {e}")
+        except Exception:
+            log.exception("Erro ao vender jogador")
             conn.close()
             return None
     
     async def update_last_free_pack(self, user_id: int) -> bool:
         """Atualiza o timestamp do último pack gratuito"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -486,7 +863,7 @@ class Database:
     
     async def update_last_daily(self, user_id: int) -> bool:
         """Atualiza o timestamp da última recompensa diária"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -502,7 +879,7 @@ class Database:
         # Atualiza a loja primeiro
         self.refresh_shop()
         
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         cursor.execute('''
@@ -511,7 +888,7 @@ class Database:
             FROM shop s
             JOIN players p ON s.player_id = p.player_id
             WHERE s.expires_at > datetime('now')
-            ORDER BY p.rarity DESC, p.overall DESC
+            ORDER BY p.rarity DESC, p.overall DESC, s.id DESC
         ''')
         
         results = cursor.fetchall()
@@ -535,9 +912,66 @@ class Database:
         
         return items
     
+    async def get_shop_page(self, cursor: Optional[Tuple] = None, backwards: bool = False,
+                            limit: int = 5) -> Tuple[List[Dict], bool, int]:
+        """Obtém uma página da loja (paginação por keyset)
+        
+        O cursor é a tupla (rarity, overall, id) de um item já exibido; a ordem é a
+        mesma de get_shop_items, então a numeração bate com o /comprar. Retorna os
+        itens da página, se existem mais itens na direção pedida e o total da loja.
+        """
+        self.refresh_shop()
+        
+        conn = self._connect()
+        db_cursor = conn.cursor()
+        
+        conditions = ["s.expires_at > datetime('now')"]
+        params = []
+        if cursor:
+            conditions.append(f"(p.rarity, p.overall, s.id) {'>' if backwards else '<'} (?, ?, ?)")
+            params.extend(cursor)
+        order = "ASC" if backwards else "DESC"
+        
+        db_cursor.execute(f'''
+            SELECT s.id, p.player_id, p.name, p.overall, p.height, p.team, p.rarity, 
+                   p.market_value, p.position, s.price, s.expires_at
+            FROM shop s
+            JOIN players p ON s.player_id = p.player_id
+            WHERE {' AND '.join(conditions)}
+            ORDER BY p.rarity {order}, p.overall {order}, s.id {order}
+            LIMIT ?
+        ''', (*params, limit + 1))
+        
+        results = db_cursor.fetchall()
+        
+        db_cursor.execute("SELECT COUNT(*) FROM shop WHERE expires_at > datetime('now')")
+        total = db_cursor.fetchone()[0]
+        conn.close()
+        
+        has_more = len(results) > limit
+        results = results[:limit]
+        if backwards:
+            results.reverse()
+        
+        items = [{
+            'id': result[0],
+            'player_id': result[1],
+            'name': result[2],
+            'overall': result[3],
+            'height': result[4],
+            'team': result[5],
+            'rarity': result[6],
+            'market_value': result[7],
+            'position': result[8],
+            'price': result[9],
+            'expires_at': result[10]
+        } for result in results]
+        
+        return items, has_more, total
+    
     async def buy_player(self, user_id: int, shop_item_id: int) -> bool:
         """Compra um jogador da loja"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -575,6 +1009,7 @@ class Database:
             cursor.execute('DELETE FROM shop WHERE id = ?', (shop_item_id,))
             
             conn.commit()
+            self._publish_standings(cursor, [user_id])
             conn.close()
             return True
         except:
@@ -584,7 +1019,7 @@ class Database:
     async def update_match_result(self, match_id: int, winner_id: int, 
                                 challenger_score: int, challenged_score: int) -> bool:
         """Atualiza resultado de uma partida"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self._connect()
         cursor = conn.cursor()
         
         try:
@@ -647,77 +1082,216 @@ class Database:
                 ''', (ECONOMY['match_loss_penalty'], challenger_id))
             
             conn.commit()
+            self._publish_standings(cursor, [challenger_id, challenged_id])
             conn.close()
             return True
         except:
             conn.close()
             return False
     
-    async def get_rankings(self) -> Dict:
-        """Obtém rankings do servidor"""
-        conn = sqlite3.connect(self.db_path)
+    async def get_standings(self) -> List[Dict]:
+        """Obtém a situação de todos os times (carga inicial dos rankings)"""
+        conn = self._connect()
         cursor = conn.cursor()
+        standings = self._query_standings(cursor)
+        conn.close()
+        return standings
+    
+    def _query_standings(self, cursor, user_ids: Optional[List[int]] = None) -> List[Dict]:
+        """Dinheiro, vitórias e overall dos titulares por time (overall só com 5 titulares)"""
+        where = ''
+        if user_ids is not None:
+            where = f"WHERE t.user_id IN ({', '.join('?' * len(user_ids))})"
         
-        # Ranking por overall
-        cursor.execute('''
-            SELECT t.team_name, u.username, 
-                   (SELECT AVG(p.overall) FROM user_players up 
-                    JOIN players p ON up.player_id = p.player_id 
-                    WHERE up.user_id = u.user_id AND up.is_starter = 1) as avg_overall
+        cursor.execute(f'''
+            SELECT t.user_id, t.team_name, u.username, u.money, t.wins,
+                   COALESCE(s.starter_count, 0), s.starter_overall_avg
             FROM teams t
             JOIN users u ON t.user_id = u.user_id
-            WHERE (SELECT COUNT(*) FROM user_players up WHERE up.user_id = u.user_id AND up.is_starter = 1) >= 5
-            ORDER BY avg_overall DESC
-            LIMIT 10
+            LEFT JOIN team_stats s ON s.user_id = t.user_id
+            {where}
+        ''', user_ids or [])
+        
+        return [{
+            'user_id': result[0],
+            'team_name': result[1],
+            'username': result[2],
+            'money': result[3],
+            'wins': result[4],
+            'overall': round(result[6], 1) if result[5] >= 5 else None
+        } for result in cursor.fetchall()]
+    
+    async def rebuild_team_stats(self) -> int:
+        """Recalcula team_stats do zero (reparo caso o resumo fique inconsistente)"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        count = self._rebuild_team_stats(cursor)
+        conn.commit()
+        conn.close()
+        return count
+    
+    def _rebuild_team_stats(self, cursor) -> int:
+        cursor.execute('DELETE FROM team_stats')
+        cursor.execute('''
+            INSERT INTO team_stats (user_id, roster_size, roster_overall_sum, starter_count,
+                                    starter_overall_sum, total_market_value)
+            SELECT up.user_id, COUNT(*), SUM(p.overall), SUM(up.is_starter = 1),
+                   SUM((up.is_starter = 1) * p.overall), SUM(p.market_value)
+            FROM user_players up
+            JOIN players p ON up.player_id = p.player_id
+            GROUP BY up.user_id
         ''')
+        return cursor.rowcount
+    
+    async def add_guild_member(self, guild_id: int, user_id: int) -> bool:
+        """Registra que o usuário jogou no servidor (True se é a primeira vez)"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('''
+            INSERT OR IGNORE INTO guild_members (guild_id, user_id) VALUES (?, ?)
+        ''', (guild_id, user_id))
         
-        overall_ranking = []
-        for result in cursor.fetchall():
-            if result[2]:  # Se tem overall calculado
-                overall_ranking.append({
-                    'team_name': result[0],
-                    'username': result[1],
-                    'value': round(result[2], 1)
-                })
+        conn.commit()
+        conn.close()
+        return cursor.rowcount > 0
+    
+    async def get_guild_members(self, guild_id: int) -> List[int]:
+        """IDs dos usuários que já jogaram no servidor (faixa da chave primária)"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT user_id FROM guild_members WHERE guild_id = ?', (guild_id,))
+        members = [result[0] for result in cursor.fetchall()]
+        conn.close()
+        return members
+    
+    async def remove_guild(self, guild_id: int) -> bool:
+        """Apaga o índice de membros de um servidor (bot removido)"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('DELETE FROM guild_members WHERE guild_id = ?', (guild_id,))
+        
+        conn.commit()
+        conn.close()
+        return True
+    
+    async def get_command_fingerprint(self, scope: str) -> Optional[str]:
+        """Hash dos comandos slash da última sincronização do escopo"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        cursor.execute('SELECT fingerprint FROM command_sync WHERE scope = ?', (scope,))
+        result = cursor.fetchone()
+        
+        conn.close()
+        return result[0] if result else None
+    
+    async def set_command_fingerprint(self, scope: str, fingerprint: str) -> bool:
+        """Salva o hash dos comandos slash depois de sincronizar o escopo"""
+        conn = self._connect()
+        cursor = conn.cursor()
         
-        # Ranking por dinheiro
         cursor.execute('''
-            SELECT t.team_name, u.username, u.money
-            FROM teams t
-            JOIN users u ON t.user_id = u.user_id
-            ORDER BY u.money DESC
-            LIMIT 10
-        ''')
+            INSERT INTO command_sync (scope, fingerprint, synced_at) VALUES (?, ?, CURRENT_TIMESTAMP)
+            ON CONFLICT(scope) DO UPDATE SET fingerprint = excluded.fingerprint, synced_at = excluded.synced_at
+        ''', (scope, fingerprint))
         
-        money_ranking = []
-        for result in cursor.fetchall():
-            money_ranking.append({
-                'team_name': result[0],
-                'username': result[1],
-                'value': result[2]
-            })
+        conn.commit()
+        conn.close()
+        return True
+    
+    async def record_ranking_snapshot(self, changes: List[Tuple], timestamp: int) -> int:
+        """Grava (categoria, user_id, posição, valor) em todas as resoluções e aplica a retenção
+        
+        Cada mudança sobrescreve o ponto do intervalo atual, então o ponto diário/semanal
+        fica com o último valor do dia/semana.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        for resolution, retention in RANKING_HISTORY['resolutions'].items():
+            bucket = timestamp - timestamp % resolution
+            cursor.executemany('''
+                INSERT INTO ranking_history (user_id, category, resolution, bucket, rank, value)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(user_id, category, resolution, bucket)
+                DO UPDATE SET rank = excluded.rank, value = excluded.value
+            ''', [(user_id, category, resolution, bucket, rank, value)
+                  for category, user_id, rank, value in changes])
+            
+            # Apaga pontos antigos, mas mantém o último de cada série como base da leitura
+            cutoff = timestamp - retention
+            cursor.execute('''
+                DELETE FROM ranking_history
+                WHERE resolution = ? AND bucket < ?
+                  AND bucket < (SELECT MAX(h.bucket) FROM ranking_history h
+                                WHERE h.user_id = ranking_history.user_id
+                                  AND h.category = ranking_history.category
+                                  AND h.resolution = ranking_history.resolution
+                                  AND h.bucket < ?)
+            ''', (resolution, cutoff, cutoff))
         
-        # Ranking por vitórias
+        conn.commit()
+        conn.close()
+        return len(changes)
+    
+    async def get_ranks_at(self, category: str, timestamp: int,
+                           resolution: int = 3600) -> Dict[int, Tuple[Optional[int], Optional[float]]]:
+        """Posição e valor de cada time num instante (último ponto até timestamp)"""
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        # Com MAX(), o SQLite devolve rank/value da mesma linha do maior bucket
         cursor.execute('''
-            SELECT t.team_name, u.username, t.wins
-            FROM teams t
-            JOIN users u ON t.user_id = u.user_id
-            ORDER BY t.wins DESC
-            LIMIT 10
-        ''')
+            SELECT user_id, rank, value, MAX(bucket)
+            FROM ranking_history
+            WHERE category = ? AND resolution = ? AND bucket <= ?
+            GROUP BY user_id
+        ''', (category, resolution, timestamp))
         
-        wins_ranking = []
-        for result in cursor.fetchall():
-            wins_ranking.append({
-                'team_name': result[0],
-                'username': result[1],
-                'value': result[2]
-            })
+        ranks = {result[0]: (result[1], result[2]) for result in cursor.fetchall()}
+        conn.close()
+        return ranks
+    
+    async def get_rank_history(self, user_id: int, category: str, resolution: int,
+                               since: int, until: int) -> List[Dict]:
+        """Série de posição/valor do time, um ponto por intervalo entre since e until
         
+        Lê só a faixa da chave primária da série (mais o último ponto antes de since).
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        
+        start = since - since % resolution
+        cursor.execute('''
+            SELECT bucket, rank, value FROM ranking_history
+            WHERE user_id = ? AND category = ? AND resolution = ?
+              AND bucket >= COALESCE((SELECT MAX(bucket) FROM ranking_history
+                                      WHERE user_id = ? AND category = ? AND resolution = ?
+                                        AND bucket <= ?), ?)
+              AND bucket <= ?
+            ORDER BY bucket
+        ''', (user_id, category, resolution, user_id, category, resolution, start, start, until))
+        points = cursor.fetchall()
         conn.close()
         
-        return {
-            'overall': overall_ranking,
-            'money': money_ranking,
-            'wins': wins_ranking
-        }
+        # Repete o último ponto nos intervalos sem mudança
+        history = []
+        index = 0
+        rank, value = None, None
+        for bucket in range(start, until - until % resolution + 1, resolution):
+            while index < len(points) and points[index][0] <= bucket:
+                _, rank, value = points[index]
+                index += 1
+            history.append({'bucket': bucket, 'rank': rank, 'value': value})
+        return history
+    
+    def _publish_standings(self, cursor, user_ids: List[int]):
+        """Avisa quem mantém os rankings em memória sobre os times alterados"""
+        if not self.standings_listeners:
+            return
+        standings = self._query_standings(cursor, user_ids)
+        for callback in self.standings_listeners:
+            callback(standings)
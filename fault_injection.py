@@ -0,0 +1,143 @@
+import logging
+import math
+import random
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from config import FAULT_INJECTION
+from metrics import db_faults_total
+
+log = logging.getLogger(__name__)
+
+DISTRIBUTIONS = ('fixed', 'uniform', 'exp', 'lognormal')
+
+class FaultRule:
+    """Falhas de um método do Database (ou de todos, com '*')
+    
+    `latency` é a média em ms, sorteada por `dist`; `lock` e `fail` são probabilidades por
+    chamada. O "database is locked" chega depois de `wait` ms, como o timeout de espera
+    do sqlite3.connect faz quando outra conexão segura a trava.
+    """
+    
+    def __init__(self, latency: float = 0.0, dist: str = 'fixed', lock: float = 0.0, fail: float = 0.0,
+                 wait: float = FAULT_INJECTION['lock_wait'] * 1000):
+        if dist not in DISTRIBUTIONS:
+            raise ValueError(f"Distribuição desconhecida: {dist} (opções: {', '.join(DISTRIBUTIONS)})")
+        self.latency = latency / 1000
+        self.dist = dist
+        self.lock = lock
+        self.fail = fail
+        self.wait = wait / 1000
+    
+    def delay(self, rng: random.Random) -> float:
+        if not self.latency:
+            return 0.0
+        if self.dist == 'uniform':
+            return rng.uniform(0, 2 * self.latency)
+        if self.dist == 'exp':
+            return rng.expovariate(1 / self.latency)
+        if self.dist == 'lognormal':
+            # sigma = 1: cauda longa (p99 ~ 7x a mediana), média igual a `latency`
+            return rng.lognormvariate(math.log(self.latency) - 0.5, 1.0)
+        return self.latency
+    
+    def __str__(self) -> str:
+        parts = []
+        if self.latency:
+            parts.append(f"latency={self.latency * 1000:g}")
+            if self.dist != 'fixed':
+                parts.append(f"dist={self.dist}")
+        if self.lock:
+            parts.append(f"lock={self.lock:g}")
+            parts.append(f"wait={self.wait * 1000:g}")
+        if self.fail:
+            parts.append(f"fail={self.fail:g}")
+        return ','.join(parts)
+
+def parse_rules(spec: str) -> Dict[str, FaultRule]:
+    """"método:chave=valor,...;método:..." -> regras (ex: "*:latency=20,dist=lognormal;buy_player:lock=0.1")"""
+    rules = {}
+    for part in filter(None, (part.strip() for part in spec.split(';'))):
+        method, _, options = part.partition(':')
+        kwargs = {}
+        for option in filter(None, (option.strip() for option in options.split(','))):
+            key, _, value = option.partition('=')
+            if key not in ('latency', 'dist', 'lock', 'fail', 'wait'):
+                raise ValueError(f"Opção desconhecida na regra de {method}: {key}")
+            kwargs[key] = value if key == 'dist' else float(value)
+        rules[method.strip()] = FaultRule(**kwargs)
+    return rules
+
+class FaultInjector:
+    """Latência, trava e falhas no acesso ao banco, por método do Database
+    
+    Database._connect chama inject() com o nome do método que está abrindo a conexão.
+    O atraso é um sleep na thread de quem chamou: o sqlite3 roda na thread do loop, então
+    um banco lento segura o loop do mesmo jeito. Sem regras, custa um teste de atributo.
+    hold_lock() gera contenção de verdade: uma conexão segura a trava exclusiva do arquivo.
+    """
+    
+    def __init__(self, spec: str = FAULT_INJECTION['rules'], seed: Optional[int] = None):
+        self.rules: Dict[str, FaultRule] = {}
+        self._rng = random.Random(seed)
+        self.configure(spec)
+    
+    @property
+    def active(self) -> bool:
+        return bool(self.rules)
+    
+    def configure(self, spec: str):
+        """Troca todas as regras (texto vazio desliga)"""
+        self.rules = parse_rules(spec)
+        if self.rules:
+            log.warning("Injeção de falhas no banco ativa: %s", self.describe())
+    
+    def clear(self):
+        self.rules = {}
+    
+    def describe(self) -> str:
+        return ';'.join(f"{method}:{rule}" for method, rule in self.rules.items())
+    
+    def inject(self, method: str):
+        rule = self.rules.get(method) or self.rules.get('*')
+        if rule is None:
+            return
+        delay = rule.delay(self._rng)
+        if delay:
+            db_faults_total.labels(method, 'latency').inc()
+            time.sleep(delay)
+        roll = self._rng.random()
+        if roll < rule.lock:
+            db_faults_total.labels(method, 'lock').inc()
+            time.sleep(rule.wait)
+            raise sqlite3.OperationalError("database is locked")
+        if roll < rule.lock + rule.fail:
+            db_faults_total.labels(method, 'fail').inc()
+            raise sqlite3.OperationalError("disk I/O error (injetado)")
+    
+    def hold_lock(self, db_path: str, seconds: float) -> threading.Thread:
+        """Segura a trava exclusiva do banco por `seconds` numa thread (as outras conexões esperam)"""
+        ready = threading.Event()
+        
+        def hold():
+            conn = sqlite3.connect(db_path, isolation_level=None)
+            try:
+                conn.execute('BEGIN EXCLUSIVE')
+                ready.set()
+                time.sleep(seconds)
+                conn.execute('ROLLBACK')
+            except sqlite3.Error:
+                log.exception("Erro ao segurar a trava do banco")
+            finally:
+                ready.set()
+                conn.close()
+        
+        thread = threading.Thread(target=hold, name='fault-lock', daemon=True)
+        thread.start()
+        ready.wait()
+        db_faults_total.labels('*', 'hold_lock').inc()
+        log.warning("Trava exclusiva do banco segurada por %.1fs", seconds)
+        return thread
+
+fault_injector = FaultInjector()
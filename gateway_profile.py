@@ -0,0 +1,34 @@
+from typing import Dict, Iterable
+import discord
+from config import FEATURE_INTENTS, GATEWAY, GATEWAY_PROFILES
+
+def intents_for(features: Iterable[str]) -> discord.Intents:
+    """Menor conjunto de intents que cobre as funcionalidades"""
+    intents = discord.Intents.none()
+    for feature in features:
+        for name in FEATURE_INTENTS[feature]:
+            setattr(intents, name, True)
+    return intents
+
+def member_cache_flags(policy: str, intents: discord.Intents) -> discord.MemberCacheFlags:
+    """Política de cache de membros: none, from_intents ou all"""
+    if policy == 'none':
+        return discord.MemberCacheFlags.none()
+    if policy == 'from_intents':
+        return discord.MemberCacheFlags.from_intents(intents)
+    if policy == 'all':
+        return discord.MemberCacheFlags.all()
+    raise ValueError(f"Política de cache de membros inválida: {policy}")
+
+def client_options(profile: str = GATEWAY['profile']) -> Dict:
+    """Argumentos do discord.Client para o perfil (intents, caches e chunking)"""
+    if profile not in GATEWAY_PROFILES:
+        raise ValueError(f"Perfil de gateway inválido: {profile} (opções: {', '.join(GATEWAY_PROFILES)})")
+    settings = GATEWAY_PROFILES[profile]
+    intents = discord.Intents.all() if settings.get('all_intents') else intents_for(settings['features'])
+    return {
+        'intents': intents,
+        'member_cache_flags': member_cache_flags(settings['member_cache'], intents),
+        'max_messages': settings['max_messages'],
+        'chunk_guilds_at_startup': settings['chunk_guilds_at_startup']
+    }
@@ -0,0 +1,248 @@
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+from sortedcontainers import SortedList
+from config import GUILD_RANKINGS
+from memory_stats import cache_registry
+
+class Leaderboard:
+    """Uma categoria do ranking, mantida ordenada em memória
+    
+    As entradas ficam como (-valor, user_id) numa SortedList: atualizar um time,
+    achar a posição dele ou abrir qualquer página custa O(log n).
+    """
+    
+    def __init__(self):
+        self._entries = SortedList()
+        self._values: Dict[int, float] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def update(self, user_id: int, value: Optional[float]):
+        """Atualiza o valor do time (None tira o time da categoria)"""
+        old = self._values.get(user_id)
+        if old == value:
+            return
+        if old is not None:
+            self._entries.remove((-old, user_id))
+        if value is None:
+            del self._values[user_id]
+        else:
+            self._values[user_id] = value
+            self._entries.add((-value, user_id))
+    
+    def rank(self, user_id: int) -> Optional[int]:
+        """Posição do time (1 = primeiro), None se ele não está na categoria"""
+        value = self._values.get(user_id)
+        if value is None:
+            return None
+        return self._entries.index((-value, user_id)) + 1
+    
+    def value(self, user_id: int) -> Optional[float]:
+        """Valor do time na categoria, None se ele não está nela"""
+        return self._values.get(user_id)
+    
+    def page(self, offset: int, limit: int) -> List[Tuple[int, float]]:
+        """Retorna (user_id, valor) das posições offset+1 até offset+limit"""
+        return [(user_id, -value) for value, user_id in self._entries.islice(offset, offset + limit)]
+
+class Leaderboards:
+    """Rankings de overall, dinheiro e vitórias, atualizados a cada mudança no banco"""
+    
+    CATEGORIES = ('overall', 'money', 'wins')
+    
+    def __init__(self):
+        self.boards = {category: Leaderboard() for category in self.CATEGORIES}
+        self._teams: Dict[int, Tuple[str, str]] = {}  # user_id -> (nome do time, usuário)
+        self._snapshot: Dict[str, Dict[int, Tuple]] = {category: {} for category in self.CATEGORIES}
+        self._baseline: Dict[str, Dict[int, Tuple]] = {category: {} for category in self.CATEGORIES}
+        self._climbers: Dict[str, List[Dict]] = {category: [] for category in self.CATEGORIES}
+    
+    def load(self, standings: List[Dict]):
+        """Carrega a tabela completa (usado na inicialização)"""
+        self.boards = {category: Leaderboard() for category in self.CATEGORIES}
+        self._teams.clear()
+        self.update(standings)
+    
+    def update(self, standings: List[Dict]):
+        """Aplica a situação atual dos times alterados (callback do banco)"""
+        for standing in standings:
+            user_id = standing['user_id']
+            self._teams[user_id] = (standing['team_name'], standing['username'])
+            for category in self.CATEGORIES:
+                self.boards[category].update(user_id, standing[category])
+    
+    def standing(self, user_id: int) -> Optional[Dict]:
+        """Situação atual do time no mesmo formato de Database.get_standings"""
+        if user_id not in self._teams:
+            return None
+        team_name, username = self._teams[user_id]
+        standing = {'user_id': user_id, 'team_name': team_name, 'username': username}
+        for category in self.CATEGORIES:
+            standing[category] = self.boards[category].value(user_id)
+        return standing
+    
+    def count(self, category: str) -> int:
+        return len(self.boards[category])
+    
+    def rank(self, category: str, user_id: int) -> Optional[int]:
+        return self.boards[category].rank(user_id)
+    
+    def snapshot_changes(self) -> List[Tuple]:
+        """(categoria, user_id, posição, valor) de quem mudou desde o último snapshot
+        
+        Times que saíram de uma categoria entram com posição e valor None.
+        """
+        changes = []
+        for category, board in self.boards.items():
+            current = {user_id: (rank, value)
+                       for rank, (user_id, value) in enumerate(board.page(0, len(board)), 1)}
+            last = self._snapshot[category]
+            for user_id in current.keys() | last.keys():
+                entry = current.get(user_id, (None, None))
+                if last.get(user_id, (None, None)) != entry:
+                    changes.append((category, user_id) + entry)
+            self._snapshot[category] = current
+        return changes
+    
+    def seed_snapshot(self, category: str, ranks: Dict[int, Tuple]):
+        """Último snapshot gravado no banco (evita regravar tudo ao reiniciar)"""
+        self._snapshot[category] = {user_id: entry for user_id, entry in ranks.items() if entry[0] is not None}
+    
+    def set_baseline(self, category: str, ranks: Dict[int, Tuple], limit: int = 3):
+        """Posições do início da janela de comparação; recalcula as maiores subidas"""
+        self._baseline[category] = ranks
+        climbers = []
+        for user_id, (old_rank, _) in ranks.items():
+            rank = self.rank(category, user_id)
+            if old_rank and rank and old_rank > rank:
+                climbers.append((old_rank - rank, rank, user_id))
+        climbers.sort(key=lambda climber: (-climber[0], climber[1]))
+        self._climbers[category] = [{
+            'user_id': user_id,
+            'team_name': self._teams[user_id][0],
+            'username': self._teams[user_id][1],
+            'position': rank,
+            'change': change
+        } for change, rank, user_id in climbers[:limit]]
+    
+    def climbers(self, category: str) -> List[Dict]:
+        """Maiores subidas na janela (calculadas no último snapshot)"""
+        return self._climbers[category]
+    
+    def rank_change(self, category: str, user_id: int) -> Optional[int]:
+        """Posições ganhas (positivo) ou perdidas desde o início da janela"""
+        old_rank = self._baseline[category].get(user_id, (None, None))[0]
+        rank = self.rank(category, user_id)
+        if not old_rank or not rank:
+            return None
+        return old_rank - rank
+    
+    def page(self, category: str, offset: int, limit: int) -> List[Dict]:
+        """Entradas de uma página do ranking, já com nome do time e do usuário"""
+        entries = []
+        for position, (user_id, value) in enumerate(self.boards[category].page(offset, limit), offset + 1):
+            team_name, username = self._teams[user_id]
+            entries.append({
+                'position': position,
+                'user_id': user_id,
+                'team_name': team_name,
+                'username': username,
+                'value': value
+            })
+        return entries
+
+class GuildLeaderboards:
+    """Rankings por servidor, montados sob demanda a partir do ranking global
+    
+    Só os membros do servidor (índice guild_members) entram; os valores vêm do
+    ranking global em memória, então montar um servidor não varre a tabela de usuários.
+    """
+    
+    def __init__(self, db, global_boards: Leaderboards,
+                 max_guilds: int = GUILD_RANKINGS['guild_cache_size'],
+                 max_known: int = GUILD_RANKINGS['member_cache_size']):
+        self.db = db
+        self.global_boards = global_boards
+        self.max_guilds = max_guilds
+        self.max_known = max_known
+        self._guilds: OrderedDict = OrderedDict()  # guild_id -> Leaderboards (LRU)
+        self._members: Dict[int, Set[int]] = {}  # guild_id -> membros dos servidores montados
+        self._user_guilds: Dict[int, Set[int]] = {}  # user_id -> servidores montados dos quais é membro
+        self._known: Dict[Tuple[int, int], None] = {}  # (guild_id, user_id) já gravados
+        cache_registry.register('guild_leaderboards', lambda: self._guilds)
+        cache_registry.register('guild_members', lambda: (self._members, self._user_guilds, self._known),
+                                count=lambda: len(self._known))
+    
+    async def add_member(self, guild_id: int, user_id: int):
+        """Registra o usuário no servidor (só grava no banco na primeira vez)"""
+        key = (guild_id, user_id)
+        if key in self._known:
+            return
+        await self.db.add_guild_member(guild_id, user_id)
+        if len(self._known) >= self.max_known:
+            # Descarta a entrada mais antiga
+            del self._known[next(iter(self._known))]
+        self._known[key] = None
+        
+        boards = self._guilds.get(guild_id)
+        if boards is not None:
+            self._add(guild_id, boards, user_id)
+    
+    async def get(self, guild_id: int) -> Leaderboards:
+        """Rankings do servidor (monta na primeira consulta)"""
+        boards = self._guilds.get(guild_id)
+        if boards is not None:
+            self._guilds.move_to_end(guild_id)
+            return boards
+        
+        members = await self.db.get_guild_members(guild_id)
+        # Outra consulta pode ter montado o servidor enquanto esta esperava o banco
+        boards = self._guilds.get(guild_id)
+        if boards is not None:
+            self._guilds.move_to_end(guild_id)
+            return boards
+        
+        # Monta sem pausas e só então publica: ninguém vê o ranking pela metade
+        boards = Leaderboards()
+        self._members[guild_id] = set()
+        for user_id in members:
+            self._add(guild_id, boards, user_id)
+        self._guilds[guild_id] = boards
+        
+        if len(self._guilds) > self.max_guilds:
+            self.forget(next(iter(self._guilds)))
+        return boards
+    
+    def forget(self, guild_id: int):
+        """Libera os rankings montados de um servidor"""
+        if self._guilds.pop(guild_id, None) is None:
+            return
+        for user_id in self._members.pop(guild_id):
+            guilds = self._user_guilds[user_id]
+            guilds.discard(guild_id)
+            if not guilds:
+                del self._user_guilds[user_id]
+    
+    async def remove_guild(self, guild_id: int):
+        """Esquece o servidor (bot removido): índice no banco e rankings montados"""
+        await self.db.remove_guild(guild_id)
+        self.forget(guild_id)
+        for key in [key for key in self._known if key[0] == guild_id]:
+            del self._known[key]
+    
+    def update(self, standings: List[Dict]):
+        """Repassa a situação nova dos times aos servidores montados (callback do banco)"""
+        for standing in standings:
+            for guild_id in self._user_guilds.get(standing['user_id'], ()):
+                self._guilds[guild_id].update([standing])
+    
+    def _add(self, guild_id: int, boards: Leaderboards, user_id: int):
+        self._members[guild_id].add(user_id)
+        self._user_guilds.setdefault(user_id, set()).add(guild_id)
+        standing = self.global_boards.standing(user_id)
+        if standing:
+            boards.update([standing])
+
+leaderboards = Leaderboards()
+cache_registry.register('leaderboards', lambda: leaderboards, count=lambda: len(leaderboards._teams))
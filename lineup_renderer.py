@@ -0,0 +1,229 @@
+import asyncio
+import hashlib
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+from config import LINEUP_RENDER, RARITIES, COLORS
+
+try:
+    from PIL import Image, ImageDraw, ImageFont
+except ImportError:  # Pillow é opcional: sem ele o /time mostra a lista em texto
+    Image = None
+
+# Mude quando o layout mudar, para não servir imagens antigas do cache
+RENDER_VERSION = 1
+
+CARD_WIDTH = 200
+CARD_HEIGHT = 280
+MARGIN = 16
+HEADER_HEIGHT = 56
+BACKGROUND = (24, 26, 33)
+TEXT_COLOR = (240, 240, 240)
+MUTED_COLOR = (170, 174, 184)
+
+def _load_font(size: int):
+    """Carrega a fonte configurada, caindo para a fonte padrão do Pillow"""
+    try:
+        return ImageFont.truetype(LINEUP_RENDER['font'], size)
+    except OSError:
+        return ImageFont.load_default(size)
+
+def _rgb(color: int):
+    return (color >> 16) & 0xff, (color >> 8) & 0xff, color & 0xff
+
+def _fit_text(draw, text: str, font, max_width: int) -> str:
+    """Corta o texto com reticências até caber na largura"""
+    if draw.textlength(text, font=font) <= max_width:
+        return text
+    while text and draw.textlength(text + "…", font=font) > max_width:
+        text = text[:-1]
+    return text + "…"
+
+def render_lineup_image(path: str, team_name: str, starters: List[Dict]):
+    """Desenha a imagem dos titulares em path (roda nos processos do pool)"""
+    width = MARGIN + len(starters) * (CARD_WIDTH + MARGIN)
+    height = HEADER_HEIGHT + CARD_HEIGHT + MARGIN
+    image = Image.new("RGB", (width, height), BACKGROUND)
+    draw = ImageDraw.Draw(image)
+    
+    title_font = _load_font(30)
+    overall_font = _load_font(64)
+    name_font = _load_font(20)
+    small_font = _load_font(16)
+    
+    draw.text((MARGIN, 12), _fit_text(draw, team_name, title_font, width - 2 * MARGIN),
+              font=title_font, fill=TEXT_COLOR)
+    
+    for index, player in enumerate(starters):
+        left = MARGIN + index * (CARD_WIDTH + MARGIN)
+        top = HEADER_HEIGHT
+        frame = _rgb(RARITIES.get(player['rarity'], {}).get('color', COLORS['primary']))
+        
+        # Moldura na cor da raridade
+        draw.rounded_rectangle((left, top, left + CARD_WIDTH, top + CARD_HEIGHT),
+                               radius=14, fill=(36, 39, 48), outline=frame, width=6)
+        draw.rectangle((left + 6, top + CARD_HEIGHT - 46, left + CARD_WIDTH - 6, top + CARD_HEIGHT - 40),
+                       fill=frame)
+        
+        draw.text((left + CARD_WIDTH / 2, top + 70), str(player['overall']),
+                  font=overall_font, fill=TEXT_COLOR, anchor="mm")
+        draw.text((left + CARD_WIDTH / 2, top + 130), player['position'],
+                  font=name_font, fill=MUTED_COLOR, anchor="mm")
+        draw.text((left + CARD_WIDTH / 2, top + 180),
+                  _fit_text(draw, player['name'], name_font, CARD_WIDTH - 24),
+                  font=name_font, fill=TEXT_COLOR, anchor="mm")
+        draw.text((left + CARD_WIDTH / 2, top + CARD_HEIGHT - 20),
+                  RARITIES.get(player['rarity'], {}).get('name', player['rarity']),
+                  font=small_font, fill=frame, anchor="mm")
+    
+    image.save(path, format="PNG", optimize=True)
+
+class LineupRenderer:
+    """Renderiza a imagem dos titulares com cache em disco endereçado por conteúdo"""
+    
+    def __init__(self, cache_dir: str, max_bytes: int, workers: int):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.workers = workers
+        self.hits = 0
+        self.misses = 0
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._total_bytes: Optional[int] = None
+    
+    @property
+    def available(self) -> bool:
+        return Image is not None
+    
+    @staticmethod
+    def lineup_key(team_name: str, starters: List[Dict]) -> str:
+        """Hash do conteúdo da escalação: escalações iguais compartilham a imagem"""
+        content = [RENDER_VERSION, team_name] + [
+            [p['name'], p['overall'], p['rarity'], p['position']] for p in starters
+        ]
+        return hashlib.sha256(json.dumps(content, ensure_ascii=False).encode()).hexdigest()
+    
+    async def render(self, team_name: str, starters: List[Dict]) -> Optional[str]:
+        """Retorna o caminho da imagem da escalação, renderizando se necessário"""
+        if not self.available or not starters:
+            return None
+        
+        key = self.lineup_key(team_name, starters)
+        path = os.path.join(self.cache_dir, f"{key}.png")
+        
+        # Marca como usado recentemente para o LRU (uma chamada só: não existe = não está em cache)
+        try:
+            os.utime(path)
+            self.hits += 1
+            return path
+        except FileNotFoundError:
+            pass
+        
+        # Outra chamada já está renderizando a mesma escalação
+        pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if not pending.cancelled():
+                    raise  # Esta chamada é que foi cancelada
+            # A chamada que renderizava foi cancelada: tenta de novo
+            return await self.render(team_name, starters)
+        
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            await self._render_to_cache(path, team_name, starters)
+            future.set_result(path)
+            return path
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            del self._pending[key]
+            # Cancelada no meio: quem esperava a mesma escalação não pode ficar pendurado
+            if not future.done():
+                future.cancel()
+            # Evita o aviso de exceção não recuperada quando ninguém mais esperava
+            elif not future.cancelled():
+                future.exception()
+    
+    async def _render_to_cache(self, path: str, team_name: str, starters: List[Dict]):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        
+        try:
+            await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), render_lineup_image, tmp_path, team_name, starters
+            )
+            os.replace(tmp_path, path)
+        except BaseException:
+            # O .tmp fica fora da contagem e da limpeza do cache
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+        
+        if self._total_bytes is None:
+            self._total_bytes = self._scan_cache_bytes()
+        else:
+            self._total_bytes += os.path.getsize(path)
+        
+        if self._total_bytes > self.max_bytes:
+            self._evict(keep=path)
+    
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn evita herdar sockets e threads do processo do bot
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._executor
+    
+    def _cache_entries(self):
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(".png"):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+    
+    def _scan_cache_bytes(self) -> int:
+        return sum(size for _, size, _ in self._cache_entries())
+    
+    def _evict(self, keep: Optional[str] = None):
+        """Remove as imagens usadas há mais tempo até caber no limite de bytes
+        
+        `keep` (a imagem recém-renderizada, que vai ser devolvida) nunca é removida,
+        mesmo que sozinha passe do limite.
+        """
+        entries = sorted(self._cache_entries())
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+                total -= size
+            except FileNotFoundError:
+                total -= size
+        self._total_bytes = total
+    
+    def shutdown(self):
+        """Encerra os processos de renderização"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+lineup_renderer = LineupRenderer(
+    LINEUP_RENDER['cache_dir'],
+    LINEUP_RENDER['max_cache_bytes'],
+    LINEUP_RENDER['workers']
+)
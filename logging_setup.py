@@ -0,0 +1,158 @@
+import contextvars
+import copy
+import gzip
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Dict, Optional
+from config import LOGGING
+from metrics import registry
+
+log_dropped_total = registry.counter(
+    'hoopcore_log_dropped_total', 'Registros de log descartados com a fila cheia')
+
+# Contexto da interação em andamento (cada evento do discord.py roda na própria task)
+_interaction: contextvars.ContextVar[Optional[Dict]] = contextvars.ContextVar('interaction', default=None)
+
+# Campos extras copiados para o JSON quando presentes no registro
+CONTEXT_FIELDS = ('interaction_id', 'user_id', 'guild_id', 'route', 'duration_ms', 'suppressed')
+
+def bind_interaction(interaction, route: str):
+    """Associa os próximos logs desta task à interação (id, usuário, servidor e rota)"""
+    _interaction.set({
+        'interaction_id': interaction.id,
+        'user_id': interaction.user.id,
+        'guild_id': interaction.guild_id,
+        'route': route,
+        'started': time.perf_counter()
+    })
+
+class ContextFilter(logging.Filter):
+    """Copia o contexto da interação para o registro e calcula a duração até o log"""
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        context = _interaction.get()
+        if context is not None:
+            for field in ('interaction_id', 'user_id', 'guild_id', 'route'):
+                if not hasattr(record, field):
+                    setattr(record, field, context[field])
+            if not hasattr(record, 'duration_ms'):
+                record.duration_ms = round((time.perf_counter() - context['started']) * 1000, 2)
+        return True
+
+class ErrorSampler(logging.Filter):
+    """Limita erros repetidos: por janela, os primeiros `burst` passam e depois 1 a cada `every`
+    
+    Erros iguais são os do mesmo logger, mesma mensagem (sem os argumentos) e mesmo tipo
+    de exceção. O registro que passa leva em `suppressed` quantos foram descartados antes dele.
+    """
+    
+    def __init__(self, window: float = LOGGING['sample_window'], burst: int = LOGGING['sample_burst'],
+                 every: int = LOGGING['sample_every'], max_keys: int = 1000):
+        super().__init__()
+        self.window = window
+        self.burst = burst
+        self.every = every
+        self.max_keys = max_keys
+        self._seen: Dict[tuple, list] = {}  # chave -> [início da janela, vistos, descartados]
+    
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno < logging.WARNING:
+            return True
+        key = (record.name, record.msg, record.exc_info[0] if record.exc_info else None)
+        state = self._seen.get(key)
+        if state is None or record.created - state[0] >= self.window:
+            if state is None and len(self._seen) >= self.max_keys:
+                # Descarta a chave mais antiga
+                del self._seen[next(iter(self._seen))]
+            suppressed = state[2] if state else 0
+            state = self._seen[key] = [record.created, 0, suppressed]
+        
+        state[1] += 1
+        if state[1] <= self.burst or state[1] % self.every == 0:
+            if state[2]:
+                record.suppressed = state[2]
+                state[2] = 0
+            return True
+        state[2] += 1
+        return False
+
+class JsonFormatter(logging.Formatter):
+    """Um objeto JSON por linha"""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'time': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage()
+        }
+        for field in CONTEXT_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                entry[field] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exception'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class LogQueueHandler(logging.handlers.QueueHandler):
+    """Coloca o registro na fila sem bloquear o event loop; com a fila cheia, descarta"""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve mensagem e traceback aqui: os argumentos podem mudar antes da escrita
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            log_dropped_total.inc()
+
+def _gzip_rotator(source: str, dest: str):
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+def setup_logging() -> logging.handlers.QueueListener:
+    """Configura o logger raiz: fila no processo, escrita numa thread (arquivo JSON com rotação + console)"""
+    os.makedirs(LOGGING['dir'], exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        os.path.join(LOGGING['dir'], LOGGING['file']),
+        maxBytes=LOGGING['max_bytes'],
+        backupCount=LOGGING['backup_count'],
+        encoding='utf-8'
+    )
+    file_handler.namer = lambda name: name + '.gz'
+    file_handler.rotator = _gzip_rotator
+    file_handler.setFormatter(JsonFormatter())
+    
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s %(name)s: %(message)s'))
+    
+    log_queue = queue.Queue(LOGGING['queue_size'])
+    queue_handler = LogQueueHandler(log_queue)
+    queue_handler.addFilter(ErrorSampler())
+    queue_handler.addFilter(ContextFilter())
+    
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(LOGGING['level'])
+    
+    listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler,
+                                              respect_handler_level=True)
+    listener.start()
+    return listener
@@ -0,0 +1,132 @@
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from typing import Dict, List, Optional
+from config import LOOP_WATCHDOG
+from metrics import loop_blocks_total, loop_lag_histogram, loop_lag_seconds
+
+log = logging.getLogger(__name__)
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+class LoopWatchdog:
+    """Mede o atraso do event loop e descobre quem o bloqueou
+    
+    Uma task no loop marca um batimento a cada `interval`. Uma thread confere o batimento:
+    se ele atrasar mais que `threshold`, o loop está preso num callback e a thread copia a
+    pilha da thread do loop naquele momento. Quando o loop volta, o bloqueio é atribuído
+    à linha do projeto mais interna da pilha capturada.
+    """
+    
+    def __init__(self, interval: float = LOOP_WATCHDOG['interval'],
+                 threshold: float = LOOP_WATCHDOG['block_threshold'],
+                 window: int = LOOP_WATCHDOG['window'],
+                 max_sites: int = LOOP_WATCHDOG['max_sites']):
+        self.interval = interval
+        self.threshold = threshold
+        self.max_sites = max_sites
+        self.blocks = 0
+        self._lags: deque = deque(maxlen=window)
+        self._sites: Dict[str, List] = {}  # linha -> [bloqueios, segundos bloqueados]
+        self._beat = 0.0
+        self._captured: Optional[tuple] = None  # (batimento, linha, pilha) do bloqueio em andamento
+        self._loop_thread: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+    
+    def start(self):
+        """Começa a vigiar o loop em execução (chamar de dentro dele)"""
+        self._loop_thread = threading.get_ident()
+        self._beat = time.perf_counter()
+        self._stop.clear()
+        self._task = asyncio.create_task(self._heartbeat())
+        self._thread = threading.Thread(target=self._watch, name='loop-watchdog', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self._thread = None
+    
+    async def _heartbeat(self):
+        while True:
+            beat = time.perf_counter()
+            self._beat = beat
+            await asyncio.sleep(self.interval)
+            lag = max(0.0, time.perf_counter() - beat - self.interval)
+            self._lags.append(lag)
+            loop_lag_seconds.set(lag)
+            loop_lag_histogram.observe(lag)
+            if lag >= self.threshold:
+                self._record_block(beat, lag)
+    
+    def _watch(self):
+        while not self._stop.wait(self.interval):
+            beat = self._beat
+            if time.perf_counter() - beat < self.interval + self.threshold:
+                continue
+            if self._captured is not None and self._captured[0] == beat:
+                continue  # Bloqueio já capturado
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is not None:
+                self._captured = (beat, self._call_site(frame), ''.join(traceback.format_stack(frame, limit=15)))
+    
+    @staticmethod
+    def _call_site(frame) -> str:
+        """Linha do projeto mais interna da pilha (ou a mais interna de todas)"""
+        site = frame
+        while site is not None:
+            filename = site.f_code.co_filename
+            if filename.startswith(PROJECT_DIR) and filename != __file__:
+                return f"{os.path.relpath(filename, PROJECT_DIR)}:{site.f_lineno} ({site.f_code.co_name})"
+            site = site.f_back
+        return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} ({frame.f_code.co_name})"
+    
+    def _record_block(self, beat: float, lag: float):
+        captured = self._captured
+        if captured is not None and captured[0] == beat:
+            site, stack = captured[1], captured[2]
+        else:
+            # O bloqueio acabou antes da thread olhar a pilha
+            site, stack = 'desconhecido', ''
+        self._captured = None
+        
+        self.blocks += 1
+        loop_blocks_total.inc()
+        if site not in self._sites and len(self._sites) >= self.max_sites:
+            del self._sites[min(self._sites, key=lambda key: self._sites[key][0])]
+        entry = self._sites.setdefault(site, [0, 0.0])
+        entry[0] += 1
+        entry[1] += lag
+        log.warning("Event loop bloqueado por %.0f ms em %s\n%s", lag * 1000, site, stack)
+    
+    def stats(self, top: int = LOOP_WATCHDOG['top_sites']) -> Dict:
+        """Percentis do atraso na janela recente, total de bloqueios e as linhas que mais bloquearam"""
+        lags = sorted(self._lags)
+        
+        def percentile(fraction: float) -> float:
+            return lags[min(len(lags) - 1, int(fraction * len(lags)))] if lags else 0.0
+        
+        sites = sorted(self._sites.items(), key=lambda item: -item[1][1])[:top]
+        return {
+            'samples': len(lags),
+            'p50': percentile(0.50),
+            'p95': percentile(0.95),
+            'p99': percentile(0.99),
+            'max': lags[-1] if lags else 0.0,
+            'blocks': self.blocks,
+            'threshold': self.threshold,
+            'sites': [{'site': site, 'count': count, 'seconds': seconds} for site, (count, seconds) in sites]
+        }
+
+loop_watchdog = LoopWatchdog()
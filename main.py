@@ -2,38 +2,283 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 import asyncio
+import hashlib
+import io
+import json
+import logging
+import time
+from contextlib import contextmanager
 from datetime import datetime
+from typing import Optional
+from admission import PRIORITIES, admission
 from database import Database
-from utils import EmbedBuilder, ButtonBuilder, GameLogic
-from config import BOT_TOKEN, COLORS, EMOJIS, ECONOMY
+from fault_injection import fault_injector
+from leaderboard import GuildLeaderboards, leaderboards
+from lineup_renderer import lineup_renderer
+from logging_setup import bind_interaction, setup_logging
+from gateway_profile import client_options
+from loop_watchdog import loop_watchdog
+from memory_stats import cache_registry, current_rss, format_bytes, memory_snapshots
+from tracing import finish_trace, instrument_discord_http, start_trace, tracer
+from traffic_capture import traffic_recorder
+from profiler import profiler
+from rate_limit import rate_limited, rate_limiter
+from metrics import (MetricsServer, command_seconds, commands_total, component_route,
+                     component_seconds, components_total, registry)
+from utils import EmbedBuilder, ButtonBuilder, GameLogic, LanguageManager, LocaleResolver, PageToken, player_card_cache
+from config import (ADMISSION, BOT_TOKEN, COLORS, COMMAND_SYNC, EMOJIS, ECONOMY, FAULT_INJECTION, GATEWAY, METRICS, PROFILER,
+                    TRACING, TRAFFIC_CAPTURE)
 import random
 
+log = logging.getLogger("hoopcore")
+
+COGS = ("cogs.teams", "cogs.shop", "cogs.matches", "cogs.general")
+
+def record_command(interaction, status):
+    """Conta o comando slash, registra a duração desde o interaction_check e fecha o trace"""
+    command = interaction.command.qualified_name if interaction.command else "unknown"
+    commands_total.labels(command, status).inc()
+    admitted = interaction.extras.pop("admitted", None)
+    if admitted is not None:
+        admission.release(seconds=time.perf_counter() - admitted)
+    finish_trace(interaction.extras.pop("span", None), status)
+    started = interaction.extras.get("started")
+    if started is not None:
+        seconds = time.perf_counter() - started
+        command_seconds.labels(command).observe(seconds)
+        traffic_recorder.record_command(interaction, status, seconds)
+    log.debug("Comando /%s concluído: %s", command, status)
+
+class HoopCoreTree(app_commands.CommandTree):
+    """Árvore de comandos que mede duração e erros de cada comando slash"""
+    
+    async def interaction_check(self, interaction):
+        interaction.extras["started"] = time.perf_counter()
+        await interaction.client.wait_until_bootstrapped()
+        route = f"/{interaction.command.qualified_name}" if interaction.command else "unknown"
+        bind_interaction(interaction, route)
+        interaction.extras["span"] = start_trace(route, "command", interaction_id=interaction.id)
+        arrived = await interaction.client.admit(interaction)
+        if arrived is None:
+            # Já respondido com "tente de novo": a árvore descarta o comando
+            record_command(interaction, "shed")
+            return False
+        interaction.extras["admitted"] = arrived
+        return True
+    
+    async def on_error(self, interaction, error):
+        record_command(interaction, "error")
+        await super().on_error(interaction, error)
+    
+    async def fingerprint(self, guild=None) -> str:
+        """Hash do payload que sync(guild) enviaria ao Discord"""
+        commands = self.get_commands(guild=guild)
+        if self.translator:
+            payload = [await command.get_translated_payload(self, self.translator) for command in commands]
+        else:
+            payload = [command.to_dict(self) for command in commands]
+        payload.sort(key=lambda command: (command.get('type', 1), command['name']))
+        return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
 class HoopCoreBot(commands.Bot):
     def __init__(self):
+        # Intents, cache de membros/mensagens e chunking vêm do perfil (config.GATEWAY)
         super().__init__(
             command_prefix="!",
-            intents=discord.Intents.all(),
-            application_id=None  # Será definido automaticamente
+            application_id=None,  # Será definido automaticamente
+            tree_cls=HoopCoreTree,
+            **client_options(GATEWAY['profile'])
         )
         self.db = Database()
+        self.locales = LocaleResolver(self.db)
+        self.guild_leaderboards = GuildLeaderboards(self.db, leaderboards)
+        self.metrics_server = MetricsServer()
+        self.startup_phases = []  # (fase, segundos) da inicialização
+        self.bootstrap_task = None
+        self.cogs_loaded = asyncio.Event()  # A sincronização só vê a árvore completa depois disso
         self.start_time = datetime.now()
     
     async def setup_hook(self):
         """Configuração inicial do bot"""
-        print("🔄 Carregando cogs...")
+        # Banco e o que depende dele sobem em segundo plano: o gateway conecta enquanto isso
+        self.bootstrap_task = asyncio.create_task(self.bootstrap())
+        
+        # Compila os catálogos de idioma antes de qualquer interação
+        with self.startup_phase("locales"):
+            LanguageManager.compile()
+        
+        log.info("Carregando cogs...")
+        
+        # Carrega todos os cogs em paralelo
+        with self.startup_phase("cogs"):
+            await asyncio.gather(*(self.load_extension(name) for name in COGS))
+        self.cogs_loaded.set()
+        
+        log.info("Cogs carregados com sucesso!")
+        
+        # Métricas: valores lidos na coleta + servidor HTTP local
+        with self.startup_phase("metrics"):
+            self.register_metrics()
+            self.register_discord_caches()
+            if METRICS['enabled']:
+                try:
+                    await self.metrics_server.start()
+                except OSError:
+                    log.exception("Erro ao iniciar servidor de métricas")
+        
+        # Atraso do event loop e pilha dos callbacks que o bloqueiam
+        loop_watchdog.start()
+        
+        # Tracing amostrado: comandos, rotas de componentes, Database e REST do Discord
+        if TRACING['enabled']:
+            instrument_discord_http()
+            tracer.start()
+        else:
+            tracer.sample_rate = 0
+        
+        # Captura de tráfego para replay (benchmarks.replay)
+        if TRAFFIC_CAPTURE['enabled']:
+            traffic_recorder.start()
+        
+    async def bootstrap(self):
+        """Banco, caches derivados dele e sincronização dos comandos"""
+        try:
+            # Esquema e catálogo só são refeitos quando a versão do banco muda
+            with self.startup_phase("database"):
+                await self.db.bootstrap()
+            
+            # Pré-calcula os cards do catálogo e invalida quando ele recarregar
+            with self.startup_phase("player_cards"):
+                player_card_cache.warm(await self.db.get_catalog())
+                self.db.catalog_listeners.append(player_card_cache.invalidate)
+            
+            # Rankings em memória: carga completa agora, depois só os times alterados
+            with self.startup_phase("leaderboards"):
+                leaderboards.load(await self.db.get_standings())
+                self.db.standings_listeners.append(leaderboards.update)
+                self.db.standings_listeners.append(self.guild_leaderboards.update)
+            
+            # Sincroniza comandos slash (só o que mudou desde a última sincronização).
+            # Com a árvore incompleta, os comandos que faltam seriam apagados no Discord
+            await self.cogs_loaded.wait()
+            with self.startup_phase("command_sync"):
+                await self.sync_commands()
+        except Exception:
+            # Sem banco nenhuma interação funciona: melhor cair e ser reiniciado que ficar conectado
+            log.exception("Erro ao preparar o banco de dados, encerrando o bot")
+            await self.close()
+            raise
+        
+        log.info("Inicialização: %s", self.startup_report())
+    
+    async def wait_until_bootstrapped(self):
+        """Espera o bootstrap do banco (interações que chegam logo depois de conectar)"""
+        if self.bootstrap_task is not None:
+            await asyncio.shield(self.bootstrap_task)
+    
+    @contextmanager
+    def startup_phase(self, name):
+        """Mede uma fase da inicialização"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.startup_phases.append((name, time.perf_counter() - start))
+    
+    def startup_report(self) -> str:
+        return ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in self.startup_phases)
+    
+    async def sync_commands(self):
+        """Sincroniza os comandos slash só quando a definição mudou
         
-        # Carrega todos os cogs
-        await self.load_extension("cogs.teams")
-        await self.load_extension("cogs.shop")
-        await self.load_extension("cogs.matches")
-        await self.load_extension("cogs.general")
+        O hash do payload de cada escopo (global e servidores de desenvolvimento) fica salvo
+        no banco; reiniciar sem mudar comandos não faz nenhuma chamada à API.
+        """
+        targets = [None] if COMMAND_SYNC['sync_global'] else []
+        for guild_id in COMMAND_SYNC['dev_guilds']:
+            guild = discord.Object(id=guild_id)
+            self.tree.copy_global_to(guild=guild)
+            targets.append(guild)
         
-        print("✅ Cogs carregados com sucesso!")
+        for guild in targets:
+            scope = f"{self.application_id}:{guild.id if guild else 'global'}"
+            fingerprint = await self.tree.fingerprint(guild)
+            if not COMMAND_SYNC['force'] and await self.db.get_command_fingerprint(scope) == fingerprint:
+                log.info("Comandos de %s sem mudanças; sincronização ignorada", scope)
+                continue
+            
+            try:
+                log.info("Sincronizando comandos slash (%s)...", scope)
+                await self.tree.sync(guild=guild)
+                await self.db.set_command_fingerprint(scope, fingerprint)
+                log.info("Comandos sincronizados (%s)!", scope)
+            except discord.HTTPException:
+                log.exception("Erro ao sincronizar comandos slash")
+    
+    async def close(self):
+        """Encerra o bot e os processos auxiliares"""
+        loop_watchdog.stop()
+        await self.metrics_server.stop()
+        tracer.stop()
+        traffic_recorder.stop()
+        lineup_renderer.shutdown()
+        await super().close()
+    
+    def register_metrics(self):
+        """Métricas calculadas na coleta a partir dos contadores que os caches já mantêm"""
+        registry.callback('hoopcore_guilds', 'Servidores em que o bot está', lambda: len(self.guilds))
+        registry.callback('hoopcore_cache_hits_total', 'Acertos dos caches', lambda: {
+            ('player_card',): player_card_cache.hits,
+            ('lineup',): lineup_renderer.hits
+        }, 'counter', ['cache'])
+        registry.callback('hoopcore_cache_misses_total', 'Faltas dos caches', lambda: {
+            ('player_card',): player_card_cache.misses,
+            ('lineup',): lineup_renderer.misses
+        }, 'counter', ['cache'])
+        registry.callback('hoopcore_cache_entries', 'Entradas em memória dos caches', lambda: {
+            ('player_card',): len(player_card_cache),
+            ('locale_users',): len(self.locales._users),
+            ('locale_guilds',): len(self.locales._guilds),
+            ('guild_leaderboards',): len(self.guild_leaderboards._guilds)
+        }, 'gauge', ['cache'])
+        registry.callback('hoopcore_leaderboard_entries', 'Times em cada ranking global', lambda: {
+            (category,): leaderboards.count(category) for category in leaderboards.CATEGORIES
+        }, 'gauge', ['category'])
+        registry.callback('hoopcore_admission_queue_depth', 'Tarefas esperando vaga para usar o banco', lambda: {
+            (priority,): admission.depth(priority) for priority in PRIORITIES
+        }, 'gauge', ['priority'])
+        registry.callback('hoopcore_admission_in_flight', 'Tarefas com vaga usando o banco', lambda: {
+            (priority,): admission.in_flight[priority] for priority in PRIORITIES
+        }, 'gauge', ['priority'])
+        registry.callback('hoopcore_admission_limit', 'Limite adaptativo de vagas', lambda: int(admission.limit))
+        registry.callback('hoopcore_rate_limit_buckets', 'Baldes de fichas ativos (usuário, classe de rota)',
+                          lambda: len(rate_limiter))
+    
+    def register_discord_caches(self):
+        """Caches do discord.py no relatório de memória (medidos só até os próprios objetos)"""
+        cache_registry.register('discord_users', lambda: self.users, depth=2)
+        cache_registry.register('discord_members', lambda: [guild._members for guild in self.guilds], depth=3,
+                                count=lambda: sum(len(guild._members) for guild in self.guilds))
+        cache_registry.register('discord_messages', lambda: self._connection._messages or (), depth=2)
+    
+    async def admit(self, interaction) -> Optional[float]:
+        """Vaga no controle de admissão: devolve a chegada da interação (perf_counter)
         
-        # Sincroniza comandos slash
-        print("🔄 Sincronizando comandos slash...")
-        await self.tree.sync()
-        print("✅ Comandos sincronizados!")
+        Lotado, responde "tente de novo" sem tocar no banco e devolve None.
+        """
+        age = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        if await admission.acquire('interactive', age):
+            return time.perf_counter() - max(age, 0.0)
+        t = self.locales.cached_translator(interaction)
+        try:
+            await interaction.response.send_message(t('common.busy'), ephemeral=True)
+        except discord.HTTPException:
+            log.warning("Não foi possível avisar que o bot está sobrecarregado")
+        return None
+    
+    async def on_app_command_completion(self, interaction, command):
+        """Comando slash concluído sem erro"""
+        record_command(interaction, "ok")
     
     async def on_ready(self):
         """Evento executado quando o bot fica online"""
@@ -42,7 +287,9 @@ class HoopCoreBot(commands.Bot):
         print(f"👤 Logado como: {self.user.name}#{self.user.discriminator}")
         print(f"🆔 ID do Bot: {self.user.id}")
         print(f"📊 Servidores: {len(self.guilds)}")
-        print(f"👥 Usuários: {sum(guild.member_count for guild in self.guilds):,}")
+        print(f"👥 Usuários: {sum(guild.member_count or 0 for guild in self.guilds):,}")
+        print(f"🔌 Perfil do gateway: {GATEWAY['profile']}")
+        print(f"🚀 Pronto em {(datetime.now() - self.start_time).total_seconds():.1f}s ({self.startup_report()})")
         print(f"⏰ Iniciado em: {self.start_time.strftime('%d/%m/%Y %H:%M:%S')}")
         print("=" * 50)
         
@@ -57,47 +304,46 @@ class HoopCoreBot(commands.Bot):
     
     async def on_guild_join(self, guild):
         """Evento executado quando o bot entra em um servidor"""
-        print(f"🎉 Entrei no servidor: {guild.name} ({guild.id})")
+        log.info("Entrei no servidor: %s", guild.name, extra={'guild_id': guild.id})
+        await self.wait_until_bootstrapped()
         
         # Envia mensagem de boas-vindas
         try:
+            t = await self.locales.for_guild(guild)
             system_channel = guild.system_channel or guild.text_channels[0]
             embed = discord.Embed(
-                title="🏀 Bem-vindo ao HoopCore!",
-                description="**HoopCore** é um jogo de basquete da NBA 2025 onde você pode:\n"
-                           "• Criar e gerenciar seu próprio time\n"
-                           "• Colecionar jogadores da NBA\n"
-                           "• Competir em partidas emocionantes\n"
-                           "• Construir o melhor time da liga!",
+                title=t('welcome.title'),
+                description=t('welcome.description'),
                 color=0x1e90ff
             )
             embed.add_field(
-                name="🚀 Como Começar",
-                value="1. Use `/criartime` para criar seu time\n"
-                      "2. Use `/pack` para ganhar jogadores\n"
-                      "3. Use `/loja` para comprar jogadores\n"
-                      "4. Use `/desafiar` para competir",
+                name=t('welcome.start_title'),
+                value=t('welcome.start'),
                 inline=False
             )
-            embed.set_footer(text="HoopCore - Jogo de Basquete da NBA 2025 | Criado por Theus.zk")
+            embed.set_footer(text=t('common.footer'))
             
             await system_channel.send(embed=embed)
-        except Exception as e:
-            print(f"❌ Erro ao enviar mensagem de boas-vindas: {e}")
+        except Exception:
+            log.exception("Erro ao enviar mensagem de boas-vindas")
     
     async def on_guild_remove(self, guild):
         """Evento executado quando o bot sai de um servidor"""
-        print(f"👋 Saí do servidor: {guild.name} ({guild.id})")
+        log.info("Saí do servidor: %s", guild.name, extra={'guild_id': guild.id})
+        await self.wait_until_bootstrapped()
+        await self.guild_leaderboards.remove_guild(guild.id)
     
     async def on_command_error(self, ctx, error):
         """Tratamento de erros de comandos"""
         if isinstance(error, commands.CommandNotFound):
             return  # Ignora comandos não encontrados
         
+        t = await self.locales.for_guild(ctx.guild) if ctx.guild else LanguageManager.translator()
+        
         if isinstance(error, commands.MissingPermissions):
             embed = discord.Embed(
-                title="❌ Permissão Negada",
-                description="Você não tem permissão para usar este comando.",
+                title=t('command_error.missing_permissions_title'),
+                description=t('command_error.missing_permissions'),
                 color=0xff0000
             )
             await ctx.send(embed=embed)
@@ -105,35 +351,71 @@ class HoopCoreBot(commands.Bot):
         
         if isinstance(error, commands.BotMissingPermissions):
             embed = discord.Embed(
-                title="❌ Permissão do Bot Insuficiente",
-                description="Eu não tenho as permissões necessárias para executar este comando.",
+                title=t('command_error.bot_permissions_title'),
+                description=t('command_error.bot_permissions'),
                 color=0xff0000
             )
             await ctx.send(embed=embed)
             return
         
         # Log do erro
-        print(f"❌ Erro no comando {ctx.command}: {error}")
+        log.error("Erro no comando %s", ctx.command, exc_info=error)
         
         # Mensagem genérica de erro
         embed = discord.Embed(
-            title="❌ Erro",
-            description="Ocorreu um erro ao executar o comando. Tente novamente.",
+            title=t('common.error'),
+            description=t('command_error.generic'),
             color=0xff0000
         )
         await ctx.send(embed=embed)
     
     async def on_interaction(self, interaction):
         """Lida com todas as interações"""
+        await self.wait_until_bootstrapped()
+        
+        # Índice de quem joga em cada servidor (rankings do servidor)
+        if interaction.guild_id:
+            try:
+                await self.guild_leaderboards.add_member(interaction.guild_id, interaction.user.id)
+            except Exception:
+                log.exception("Erro ao registrar membro do servidor")
+        
         if interaction.type == discord.InteractionType.component:
-            if interaction.data.get("component_type") == 2:  # Button
-                await self.handle_button_interaction(interaction)
-            elif interaction.data.get("component_type") == 3:  # Select Menu
-                await self.handle_select_interaction(interaction)
+            route = component_route(interaction.data.get("custom_id", ""))
+            bind_interaction(interaction, route)
+            started = time.perf_counter()
+            arrived = None
+            if route not in ADMISSION['exempt_routes']:
+                arrived = await self.admit(interaction)
+                if arrived is None:
+                    components_total.labels(route, "shed").inc()
+                    traffic_recorder.record_component(interaction, "shed", time.perf_counter() - started)
+                    return
+            
+            trace = start_trace(route, "component", interaction_id=interaction.id)
+            status = "ok"
+            try:
+                if interaction.data.get("component_type") == 2:  # Button
+                    await self.handle_button_interaction(interaction)
+                elif interaction.data.get("component_type") == 3:  # Select Menu
+                    await self.handle_select_interaction(interaction)
+            except Exception:
+                status = "error"
+                raise
+            finally:
+                if arrived is not None:
+                    admission.release(seconds=time.perf_counter() - arrived)
+                seconds = time.perf_counter() - started
+                finish_trace(trace, status)
+                components_total.labels(route, status).inc()
+                component_seconds.labels(route).observe(seconds)
+                traffic_recorder.record_component(interaction, status, seconds)
+                log.debug("Interação %s concluída: %s", route, status)
     
     async def handle_select_interaction(self, interaction):
         """Lida com interações de select menu"""
         custom_id = interaction.data.get("custom_id", "")
+        t = await self.locales.translator(interaction)
         
         try:
             if custom_id == "select_starter":
@@ -151,20 +433,21 @@ class HoopCoreBot(commands.Bot):
             else:
                 # Select menu não reconhecido
                 await interaction.response.send_message(
-                    "❌ Select menu não reconhecido.", 
+                    t('common.unknown_select'), 
                     ephemeral=True
                 )
                 
-        except Exception as e:
-            print(f"❌ Erro ao processar interação de select menu: {e}")
+        except Exception:
+            log.exception("Erro ao processar interação de select menu")
             await interaction.response.send_message(
-                "❌ Erro ao processar interação. Tente novamente.",
+                t('common.interaction_error'),
                 ephemeral=True
             )
     
     async def handle_button_interaction(self, interaction):
         """Trata interações de botões"""
         custom_id = interaction.data.get("custom_id", "")
+        t = await self.locales.translator(interaction)
         
         try:
             if custom_id.startswith("accept_challenge_"):
@@ -185,10 +468,14 @@ class HoopCoreBot(commands.Bot):
                 # Comprar pack
                 await self.buy_pack(interaction)
             
+            elif custom_id.startswith("page:"):
+                # Trocar página de uma listagem
+                await self.change_page(interaction, custom_id)
+            
             elif custom_id.startswith("ranking_"):
-                # Mudar ranking
-                category = custom_id.split("_")[-1]
-                await self.change_ranking(interaction, category)
+                # Mudar ranking (ranking_<categoria>[_guild])
+                parts = custom_id.split("_")
+                await self.change_ranking(interaction, parts[1], len(parts) > 2)
             
             elif custom_id.startswith("sell_confirm_"):
                 # Confirmar venda
@@ -225,6 +512,28 @@ class HoopCoreBot(commands.Bot):
             elif custom_id == "admin_server_stats":
                 await self.admin_server_stats(interaction)
             
+            elif custom_id == "admin_rebuild_stats":
+                await self.admin_rebuild_stats(interaction)
+            
+            elif custom_id.startswith("admin_profile_start_"):
+                seconds = int(custom_id.split("_")[-1])
+                await self.admin_profile_start(interaction, seconds)
+            
+            elif custom_id == "admin_profile_stop":
+                await self.admin_profile_stop(interaction)
+            
+            elif custom_id == "admin_memory_snapshot":
+                await self.admin_memory_snapshot(interaction)
+            
+            elif custom_id == "admin_memory_stop":
+                await self.admin_memory_stop(interaction)
+            
+            elif custom_id == "admin_faults_hold":
+                await self.admin_faults_hold(interaction)
+            
+            elif custom_id.startswith("admin_faults_"):
+                await self.admin_faults(interaction, custom_id[len("admin_faults_"):])
+            
             # Botões de posição
             elif custom_id.startswith("position_"):
                 position = custom_id.split("_")[1]
@@ -243,111 +552,159 @@ class HoopCoreBot(commands.Bot):
             else:
                 # Botão não reconhecido
                 await interaction.response.send_message(
-                    "❌ Botão não reconhecido.", 
+                    t('common.unknown_button'), 
                     ephemeral=True
                 )
                 
-        except Exception as e:
-            print(f"❌ Erro ao processar interação de botão: {e}")
+        except Exception:
+            log.exception("Erro ao processar interação de botão")
             await interaction.response.send_message(
-                "❌ Erro ao processar interação. Tente novamente.", 
+                t('common.interaction_error'), 
                 ephemeral=True
             )
     
+    @rate_limited('match')
     async def accept_challenge(self, interaction, challenger_id):
         """Aceita um desafio"""
+        t = await self.locales.translator(interaction)
+        
         try:
             embed = discord.Embed(
-                title="✅ Desafio Aceito!",
-                description="A partida será iniciada em breve...",
+                title=t('challenge.accepted_title'),
+                description=t('challenge.accepted'),
                 color=0x00ff00
             )
             await interaction.response.edit_message(embed=embed, view=None)
-        except Exception as e:
-            print(f"Erro ao aceitar desafio: {e}")
-            await interaction.response.send_message("❌ Erro ao aceitar desafio.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao aceitar desafio")
+            await interaction.response.send_message(t('challenge.accept_error'), ephemeral=True)
     
+    @rate_limited('match')
     async def decline_challenge(self, interaction, challenger_id):
         """Recusa um desafio"""
+        t = await self.locales.translator(interaction)
+        
         try:
             embed = discord.Embed(
-                title="❌ Desafio Recusado",
-                description="O desafio foi recusado.",
+                title=t('challenge.declined_title'),
+                description=t('challenge.declined'),
                 color=0xff0000
             )
             await interaction.response.edit_message(embed=embed, view=None)
-        except Exception as e:
-            print(f"Erro ao recusar desafio: {e}")
-            await interaction.response.send_message("❌ Erro ao recusar desafio.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao recusar desafio")
+            await interaction.response.send_message(t('challenge.decline_error'), ephemeral=True)
     
+    @rate_limited('shop')
     async def refresh_shop(self, interaction):
         """Atualiza a loja"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Atualiza a loja no banco de dados
             self.db.refresh_shop()
             
             embed = discord.Embed(
-                title="🔄 Loja Atualizada",
-                description="A loja foi atualizada! Use `/loja` para ver os novos itens.",
+                title=t('shop.refreshed_title'),
+                description=t('shop.refreshed'),
                 color=0x1e90ff
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            print(f"Erro ao atualizar loja: {e}")
-            await interaction.response.send_message("❌ Erro ao atualizar loja.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao atualizar loja")
+            await interaction.response.send_message(t('shop.refresh_error'), ephemeral=True)
     
     async def buy_pack(self, interaction):
         """Compra um pack"""
+        t = await self.locales.translator(interaction)
+        
         try:
             embed = discord.Embed(
-                title="🛒 Comprar Pack",
-                description="Use `/packpremium` para comprar um pack premium!\n\n"
-                           "**Pack Premium:** $5,000\n"
-                           "**Conteúdo:** 3 jogadores com chances melhoradas de raridade",
+                title=t('shop.pack_info_title'),
+                description=t('shop.pack_info'),
                 color=0x8a2be2
             )
             embed.add_field(
-                name="💡 Alternativa Gratuita",
-                value="Use `/pack` para abrir um pack gratuito a cada 25 minutos!",
+                name=t('shop.pack_free_title'),
+                value=t('shop.pack_free'),
                 inline=False
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            print(f"Erro ao mostrar pack: {e}")
-            await interaction.response.send_message("❌ Erro ao mostrar informações do pack.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao mostrar pack")
+            await interaction.response.send_message(t('shop.pack_info_error'), ephemeral=True)
     
-    async def change_ranking(self, interaction, category):
+    @rate_limited('ranking')
+    async def change_ranking(self, interaction, category, guild_scope=False):
         """Muda o tipo de ranking"""
+        t = await self.locales.translator(interaction)
+        
         try:
-            # Obtém o ranking solicitado
-            rankings = await self.db.get_rankings()
-            
-            if not rankings or not rankings.get(category) or len(rankings[category]) == 0:
-                if category == "overall":
-                    message = "Nenhum time com 5 titulares ainda para calcular overall."
-                elif category == "money":
-                    message = "Nenhum time criado ainda."
-                else:
-                    message = "Nenhuma partida jogada ainda."
+            embed, view = await self.get_cog('MatchesCog').build_ranking_page(
+                interaction.user.id, category, 1, t.language,
+                interaction.guild if guild_scope else None
+            )
+            await interaction.response.edit_message(embed=embed, view=view)
+            
+        except Exception:
+            log.exception("Erro ao mostrar ranking")
+            await interaction.response.send_message(t('ranking.error'), ephemeral=True)
+    
+    @rate_limited('shop')
+    async def change_page(self, interaction, custom_id):
+        """Troca a página do elenco ou da loja a partir do token do botão"""
+        t = await self.locales.translator(interaction)
+        
+        try:
+            token = PageToken.decode(custom_id)
+            cursor = token['cursor']
+            embed, view = None, None
+            
+            if token['view'] == 'roster':
+                # Só o dono navega pelo próprio elenco
+                if interaction.user.id != token['owner_id']:
+                    await interaction.response.send_message(t('roster.other_owner'), ephemeral=True)
+                    return
                 
-                embed = discord.Embed(
-                    title="📊 Ranking",
-                    description=message,
-                    color=0x808080
+                team = await self.db.get_team(token['owner_id'])
+                if team:
+                    rarity, position = token['filters']
+                    embed, view = await self.get_cog('TeamsCog').build_roster_page(
+                        token['owner_id'], team, token['page'],
+                        (int(cursor[0]), int(cursor[1]), int(cursor[2])),
+                        token['backwards'], rarity, position, t.language
+                    )
+            
+            elif token['view'] == 'shop':
+                user = await self.db.get_user(interaction.user.id)
+                if user:
+                    embed, view = await self.get_cog('ShopCog').build_shop_page(
+                        user, token['page'], (cursor[0], int(cursor[1]), int(cursor[2])),
+                        token['backwards'], t.language
+                    )
+            
+            elif token['view'] == 'ranking':
+                # A posição mostrada é sempre a de quem clicou
+                category, scope = token['filters'][:2]
+                embed, view = await self.get_cog('MatchesCog').build_ranking_page(
+                    interaction.user.id, category, token['page'], t.language,
+                    interaction.guild if scope == 'guild' else None
                 )
-            else:
-                # Cria embed do ranking
-                from utils import EmbedBuilder
-                embed = EmbedBuilder.ranking_embed(rankings, category)
             
-            await interaction.response.edit_message(embed=embed)
+            if not embed:
+                await interaction.response.send_message(t('roster.nothing_more'), ephemeral=True)
+                return
+            
+            await interaction.response.edit_message(embed=embed, view=view)
             
-        except Exception as e:
-            print(f"Erro ao mostrar ranking: {e}")
-            await interaction.response.send_message("❌ Erro ao mostrar ranking.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao trocar página")
+            await interaction.response.send_message(t('roster.page_error'), ephemeral=True)
     
     async def confirm_sell(self, interaction, player_id):
         """Confirma a venda de um jogador"""
+        t = await self.locales.translator(interaction)
+        
         try:
             user_id = interaction.user.id
             
@@ -356,90 +713,92 @@ class HoopCoreBot(commands.Bot):
             
             if sell_value is not None:
                 embed = discord.Embed(
-                    title="💰 Venda Confirmada",
-                    description=f"Jogador vendido com sucesso por **${sell_value:,}**!",
+                    title=t('sell.done_title'),
+                    description=t('sell.done', value=sell_value),
                     color=0x00ff00
                 )
                 embed.add_field(
-                    name="💡 Dica",
-                    value="Use o dinheiro para comprar novos jogadores na loja!",
+                    name=t('common.tip'),
+                    value=t('sell.done_tip'),
                     inline=False
                 )
             else:
                 embed = discord.Embed(
-                    title="❌ Erro na Venda",
-                    description="Erro ao vender o jogador. Tente novamente.",
+                    title=t('sell.failed_title'),
+                    description=t('sell.failed'),
                     color=0xff0000
                 )
             
             await interaction.response.edit_message(embed=embed, view=None)
             
-        except Exception as e:
-            print(f"Erro ao confirmar venda: {e}")
-            await interaction.response.send_message("❌ Erro ao confirmar venda.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao confirmar venda")
+            await interaction.response.send_message(t('sell.confirm_error'), ephemeral=True)
     
     async def cancel_sell(self, interaction):
         """Cancela a venda de um jogador"""
+        t = await self.locales.translator(interaction)
+        
         try:
             embed = discord.Embed(
-                title="❌ Venda Cancelada",
-                description="A venda foi cancelada.",
+                title=t('sell.cancelled_title'),
+                description=t('sell.cancelled'),
                 color=0xff0000
             )
             await interaction.response.edit_message(embed=embed, view=None)
-        except Exception as e:
-            print(f"Erro ao cancelar venda: {e}")
-            await interaction.response.send_message("❌ Erro ao cancelar venda.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao cancelar venda")
+            await interaction.response.send_message(t('sell.cancel_error'), ephemeral=True)
     
     async def view_players(self, interaction):
         """Mostra jogadores do time"""
+        t = await self.locales.translator(interaction)
+        
         try:
             embed = discord.Embed(
-                title="👥 Seus Jogadores",
-                description="Use `/jogadores` para ver uma lista completa dos seus jogadores.",
+                title=t('menu.players_title'),
+                description=t('menu.players'),
                 color=0x1e90ff
             )
             embed.add_field(
-                name="💡 Comandos Úteis",
-                value="• `/titular [nome]` - Define jogador como titular\n"
-                      "• `/reserva [nome]` - Define jogador como reserva\n"
-                      "• `/vender` - Vende um jogador",
+                name=t('menu.players_commands_title'),
+                value=t('menu.players_commands'),
                 inline=False
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            print(f"Erro ao mostrar jogadores: {e}")
-            await interaction.response.send_message("❌ Erro ao mostrar jogadores.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao mostrar jogadores")
+            await interaction.response.send_message(t('menu.players_error'), ephemeral=True)
     
     async def manage_team(self, interaction):
         """Gerenciar time"""
+        t = await self.locales.translator(interaction)
+        
         try:
             embed = discord.Embed(
-                title="⚙️ Gerenciar Time",
-                description="Comandos para gerenciar seu time:",
+                title=t('menu.manage_title'),
+                description=t('menu.manage'),
                 color=0x8a2be2
             )
             embed.add_field(
-                name="🏀 Jogadores",
-                value="• `/jogadores` - Ver todos os jogadores\n"
-                      "• `/titular [nome]` - Definir titular\n"
-                      "• `/reserva [nome]` - Definir reserva\n"
-                      "• `/vender` - Vender jogador",
+                name=t('menu.manage_players_title'),
+                value=t('menu.manage_players'),
                 inline=False
             )
             embed.add_field(
-                name="📊 Time",
-                value="• `/time` - Informações do time\n"
-                      "• `/estatisticas` - Suas estatísticas",
+                name=t('menu.manage_team_title'),
+                value=t('menu.manage_team'),
                 inline=False
             )
             await interaction.response.send_message(embed=embed, ephemeral=True)
-        except Exception as e:
-            print(f"Erro ao mostrar gerenciamento: {e}")
-            await interaction.response.send_message("❌ Erro ao mostrar gerenciamento.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao mostrar gerenciamento")
+            await interaction.response.send_message(t('menu.manage_error'), ephemeral=True)
     
     async def select_player_for_sale(self, interaction, player_id):
         """Seleciona jogador para venda"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Obtém informações do jogador
             user_id = interaction.user.id
@@ -454,7 +813,7 @@ class HoopCoreBot(commands.Bot):
                     break
             
             if not target_player:
-                await interaction.response.send_message("❌ Jogador não encontrado.", ephemeral=True)
+                await interaction.response.send_message(t('common.player_not_found'), ephemeral=True)
                 return
             
             # Calcula valor de venda
@@ -462,10 +821,10 @@ class HoopCoreBot(commands.Bot):
             
             # Confirma venda
             embed = discord.Embed(
-                title="💰 Confirmar Venda",
-                description=f"Você está vendendo **{target_player['name']}** por **${sell_value:,}**\n\n"
-                           f"Overall: {target_player['overall']} | Time: {target_player['team']}\n"
-                           f"Raridade: {target_player['rarity']} | Posição: {target_player['position']}",
+                title=t('sell.confirm_title'),
+                description=t('sell.confirm', name=target_player['name'], value=sell_value)
+                + t('common.player_details', overall=target_player['overall'], team=target_player['team'],
+                    rarity=t(f"rarity.{target_player['rarity']}"), position=target_player['position']),
                 color=0xffa500
             )
             
@@ -473,104 +832,106 @@ class HoopCoreBot(commands.Bot):
             view = discord.ui.View()
             view.add_item(discord.ui.Button(
                 style=discord.ButtonStyle.green,
-                label="Confirmar Venda",
+                label=t('sell.confirm_button'),
                 emoji="💰",
                 custom_id=f"sell_confirm_{player_id}"
             ))
             view.add_item(discord.ui.Button(
                 style=discord.ButtonStyle.red,
-                label="Cancelar",
+                label=t('common.cancel'),
                 emoji="❌",
                 custom_id="sell_cancel"
             ))
             
             await interaction.response.edit_message(embed=embed, view=view)
             
-        except Exception as e:
-            print(f"Erro ao selecionar jogador para venda: {e}")
-            await interaction.response.send_message("❌ Erro ao selecionar jogador.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao selecionar jogador para venda")
+            await interaction.response.send_message(t('sell.select_error'), ephemeral=True)
     
     # Métodos Administrativos
     async def admin_add_money(self, interaction):
         """Adiciona dinheiro para um usuário"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
             OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
             
             if interaction.user.id != OWNER_ID:
-                await interaction.response.send_message("❌ Acesso negado.", ephemeral=True)
+                await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
                 return
             
             embed = discord.Embed(
-                title="💰 Adicionar Dinheiro",
-                description="Digite o ID do usuário e o valor a adicionar:\n\n"
-                           "Formato: `ID VALOR`\n"
-                           "Exemplo: `123456789 10000`",
+                title=t('admin.add_money'),
+                description=t('admin.add_money_prompt'),
                 color=0x00ff00
             )
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
-        except Exception as e:
-            print(f"Erro no comando admin: {e}")
-            await interaction.response.send_message("❌ Erro no comando.", ephemeral=True)
+        except Exception:
+            log.exception("Erro no comando admin")
+            await interaction.response.send_message(t('common.command_error'), ephemeral=True)
     
     async def admin_add_player(self, interaction):
         """Adiciona jogador para um usuário"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
             OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
             
             if interaction.user.id != OWNER_ID:
-                await interaction.response.send_message("❌ Acesso negado.", ephemeral=True)
+                await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
                 return
             
             embed = discord.Embed(
-                title="🏀 Adicionar Jogador",
-                description="Digite o ID do usuário e o ID do jogador:\n\n"
-                           "Formato: `ID_USUARIO ID_JOGADOR`\n"
-                           "Exemplo: `123456789 1`",
+                title=t('admin.add_player'),
+                description=t('admin.add_player_prompt'),
                 color=0x00ff00
             )
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
-        except Exception as e:
-            print(f"Erro no comando admin: {e}")
-            await interaction.response.send_message("❌ Erro no comando.", ephemeral=True)
+        except Exception:
+            log.exception("Erro no comando admin")
+            await interaction.response.send_message(t('common.command_error'), ephemeral=True)
     
     async def admin_reset_cooldowns(self, interaction):
         """Reseta cooldowns de um usuário"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
             OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
             
             if interaction.user.id != OWNER_ID:
-                await interaction.response.send_message("❌ Acesso negado.", ephemeral=True)
+                await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
                 return
             
             embed = discord.Embed(
-                title="⏰ Resetar Cooldowns",
-                description="Digite o ID do usuário para resetar cooldowns:\n\n"
-                           "Formato: `ID`\n"
-                           "Exemplo: `123456789`",
+                title=t('admin.reset_cooldowns'),
+                description=t('admin.reset_cooldowns_prompt'),
                 color=0x00ff00
             )
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
-        except Exception as e:
-            print(f"Erro no comando admin: {e}")
-            await interaction.response.send_message("❌ Erro no comando.", ephemeral=True)
+        except Exception:
+            log.exception("Erro no comando admin")
+            await interaction.response.send_message(t('common.command_error'), ephemeral=True)
     
     async def admin_server_stats(self, interaction):
         """Mostra estatísticas do servidor"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
             OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
             
             if interaction.user.id != OWNER_ID:
-                await interaction.response.send_message("❌ Acesso negado.", ephemeral=True)
+                await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
                 return
             
             # Obtém estatísticas do servidor
@@ -578,32 +939,213 @@ class HoopCoreBot(commands.Bot):
             total_teams = len(self.db.get_all_teams())
             
             embed = discord.Embed(
-                title="📊 Estatísticas do Servidor",
+                title=t('admin.server_stats'),
                 color=0x00ff00
             )
-            embed.add_field(name="👥 Total de Usuários", value=str(total_users), inline=True)
-            embed.add_field(name="🏀 Total de Times", value=str(total_teams), inline=True)
-            embed.add_field(name="🤖 Servidores", value=str(len(self.guilds)), inline=True)
+            embed.add_field(name=t('admin.total_users'), value=str(total_users), inline=True)
+            embed.add_field(name=t('admin.total_teams'), value=str(total_teams), inline=True)
+            embed.add_field(name=t('admin.guilds'), value=str(len(self.guilds)), inline=True)
             
             await interaction.response.send_message(embed=embed, ephemeral=True)
             
-        except Exception as e:
-            print(f"Erro no comando admin: {e}")
-            await interaction.response.send_message("❌ Erro no comando.", ephemeral=True)
+        except Exception:
+            log.exception("Erro no comando admin")
+            await interaction.response.send_message(t('common.command_error'), ephemeral=True)
+    
+    async def admin_rebuild_stats(self, interaction):
+        """Reconstrói team_stats e recarrega os rankings"""
+        t = await self.locales.translator(interaction)
+        
+        try:
+            # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
+            OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
+            
+            if interaction.user.id != OWNER_ID:
+                await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
+                return
+            
+            await interaction.response.defer(ephemeral=True)
+            count = await self.db.rebuild_team_stats()
+            leaderboards.load(await self.db.get_standings())
+            
+            embed = discord.Embed(
+                title=t('admin.rebuild_stats'),
+                description=t('admin.rebuild_done', count=count),
+                color=0x00ff00
+            )
+            await interaction.followup.send(embed=embed, ephemeral=True)
+            
+        except Exception:
+            log.exception("Erro no comando admin")
+            await interaction.followup.send(t('common.command_error'), ephemeral=True)
+    
+    async def admin_profile_start(self, interaction, seconds):
+        """Perfila o bot em execução e devolve flame graph e resumo como anexos"""
+        t = await self.locales.translator(interaction)
+        
+        try:
+            # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
+            OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
+            
+            if interaction.user.id != OWNER_ID:
+                await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
+                return
+            
+            if profiler.running:
+                await interaction.response.send_message(t('admin.profile_running'), ephemeral=True)
+                return
+            
+            seconds = min(seconds, PROFILER['max_duration'])
+            await interaction.response.send_message(t('admin.profile_started', seconds=seconds), ephemeral=True)
+            result = await profiler.run(seconds)
+            
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            files = [
+                discord.File(io.BytesIO(result['collapsed'].encode('utf-8')), filename=f"profile-{stamp}.collapsed.txt"),
+                discord.File(io.BytesIO(result['summary'].encode('utf-8')), filename=f"profile-{stamp}-top.txt")
+            ]
+            await interaction.followup.send(
+                t('admin.profile_done', samples=result['samples'], seconds=round(result['seconds'])),
+                files=files,
+                ephemeral=True
+            )
+            
+        except Exception:
+            log.exception("Erro no comando admin")
+            await interaction.followup.send(t('common.command_error'), ephemeral=True)
+    
+    async def admin_profile_stop(self, interaction):
+        """Encerra antes do tempo o perfil em andamento"""
+        t = await self.locales.translator(interaction)
+        
+        # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
+        OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
+        
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
+            return
+        
+        if not profiler.running:
+            await interaction.response.send_message(t('admin.profile_not_running'), ephemeral=True)
+            return
+        
+        profiler.stop()
+        await interaction.response.send_message(t('admin.profile_stopping'), ephemeral=True)
+    
+    async def admin_memory_snapshot(self, interaction):
+        """Tamanho dos caches do bot e snapshot do tracemalloc comparado com o anterior"""
+        t = await self.locales.translator(interaction)
+        
+        try:
+            # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
+            OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
+            
+            if interaction.user.id != OWNER_ID:
+                await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
+                return
+            
+            await interaction.response.defer(ephemeral=True)
+            first = not memory_snapshots.tracing
+            caches = cache_registry.report()
+            snapshot = await asyncio.to_thread(memory_snapshots.take)
+            
+            for cache in caches:
+                cache['entries'] = '?' if cache['entries'] is None else cache['entries']
+                cache['size'] = format_bytes(cache['bytes'])
+            cache_lines = [t('admin.memory_cache', **cache) for cache in caches]
+            embed = discord.Embed(
+                title=t('admin.memory_title'),
+                description=t('admin.memory_rss', rss=format_bytes(current_rss())),
+                color=0x00bfff
+            )
+            embed.add_field(name=t('admin.memory_caches_title'), value="\n".join(cache_lines)[:1024], inline=False)
+            embed.set_footer(text=t('admin.memory_first') if first else t('admin.memory_diff'))
+            
+            report = "\n".join(f"{cache['name']:<24} {cache['entries']:>10} {cache['size']:>12}" for cache in caches)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            content = f"RSS: {format_bytes(current_rss())}\n\nCaches\n{report}\n\ntracemalloc\n{snapshot}"
+            await interaction.followup.send(
+                embed=embed,
+                file=discord.File(io.BytesIO(content.encode('utf-8')), filename=f"memory-{stamp}.txt"),
+                ephemeral=True
+            )
+            
+        except Exception:
+            log.exception("Erro no comando admin")
+            await interaction.followup.send(t('common.command_error'), ephemeral=True)
+    
+    async def admin_memory_stop(self, interaction):
+        """Desliga o tracemalloc (ele deixa as alocações mais lentas)"""
+        t = await self.locales.translator(interaction)
+        
+        # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
+        OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
+        
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
+            return
+        
+        if not memory_snapshots.tracing:
+            await interaction.response.send_message(t('admin.memory_not_tracing'), ephemeral=True)
+            return
+        
+        memory_snapshots.stop()
+        await interaction.response.send_message(t('admin.memory_stopped'), ephemeral=True)
+    
+    async def admin_faults(self, interaction, preset):
+        """Liga um conjunto de falhas do banco (FAULT_INJECTION['presets']) ou desliga todas"""
+        t = await self.locales.translator(interaction)
+        
+        # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
+        OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
+        
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
+            return
+        
+        if preset == "off":
+            fault_injector.clear()
+            await interaction.response.send_message(t('admin.faults_disabled'), ephemeral=True)
+            return
+        
+        if preset not in FAULT_INJECTION['presets']:
+            await interaction.response.send_message(t('common.command_error'), ephemeral=True)
+            return
+        
+        fault_injector.configure(FAULT_INJECTION['presets'][preset])
+        await interaction.response.send_message(
+            t('admin.faults_enabled', rules=fault_injector.describe()), ephemeral=True)
+    
+    async def admin_faults_hold(self, interaction):
+        """Segura a trava exclusiva do banco: as outras conexões esperam ou levam database is locked"""
+        t = await self.locales.translator(interaction)
+        
+        # Verifica se é o dono - SUBSTITUA PELO SEU ID REAL
+        OWNER_ID = 960343374727114752  # ✅ ID do Theus.zk
+        
+        if interaction.user.id != OWNER_ID:
+            await interaction.response.send_message(t('common.access_denied'), ephemeral=True)
+            return
+        
+        seconds = FAULT_INJECTION['hold_seconds']
+        await interaction.response.send_message(t('admin.faults_holding', seconds=seconds), ephemeral=True)
+        await asyncio.to_thread(fault_injector.hold_lock, self.db.db_path, seconds)
     
     async def handle_position_selection(self, interaction, position):
         """Lida com seleção de posição"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Obtém o valor selecionado
             selected_value = interaction.data.get("values", [None])[0]
             if not selected_value:
-                await interaction.response.send_message("❌ Nenhum jogador selecionado.", ephemeral=True)
+                await interaction.response.send_message(t('common.nothing_selected'), ephemeral=True)
                 return
             
             # Formato: POS_ID (ex: PG_123)
             parts = selected_value.split("_")
             if len(parts) != 2:
-                await interaction.response.send_message("❌ Formato inválido.", ephemeral=True)
+                await interaction.response.send_message(t('common.invalid_format'), ephemeral=True)
                 return
             
             pos, player_id = parts[0], int(parts[1])
@@ -619,37 +1161,38 @@ class HoopCoreBot(commands.Bot):
                     break
             
             if not target_player:
-                await interaction.response.send_message("❌ Jogador não encontrado.", ephemeral=True)
+                await interaction.response.send_message(t('common.player_not_found'), ephemeral=True)
                 return
             
             # Verifica se a posição é recomendada
             is_recommended = target_player['position'] == pos
-            recommendation_text = "⭐ Posição recomendada!" if is_recommended else "⚠️ Posição não recomendada"
+            recommendation_text = t('lineup.position_recommended') if is_recommended else t('lineup.position_not_recommended')
             
             # Confirma posição
             embed = discord.Embed(
-                title=f"🏀 Posição Definida: {pos}",
-                description=f"**{target_player['name']}** será o {pos} do seu time!\n\n"
-                           f"Overall: {target_player['overall']} | Time: {target_player['team']}\n"
-                           f"Posição Natural: {target_player['position']}\n\n"
-                           f"{recommendation_text}",
+                title=t('lineup.position_set_title', position=pos),
+                description=t('lineup.position_set', name=target_player['name'], position=pos,
+                              overall=target_player['overall'], team=target_player['team'],
+                              natural=target_player['position'], recommendation=recommendation_text),
                 color=0x00ff00 if is_recommended else 0xffa500
             )
             
             await interaction.response.edit_message(embed=embed, view=None)
             
-        except Exception as e:
-            print(f"Erro ao definir posição: {e}")
-            await interaction.response.send_message("❌ Erro ao definir posição.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao definir posição")
+            await interaction.response.send_message(t('lineup.position_error'), ephemeral=True)
     
     # Métodos de Seleção de Jogadores
     async def handle_starter_selection(self, interaction):
         """Lida com seleção de jogador para titular"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Obtém o valor selecionado
             selected_value = interaction.data.get("values", [None])[0]
             if not selected_value:
-                await interaction.response.send_message("❌ Nenhum jogador selecionado.", ephemeral=True)
+                await interaction.response.send_message(t('common.nothing_selected'), ephemeral=True)
                 return
             
             player_id = int(selected_value)
@@ -665,14 +1208,14 @@ class HoopCoreBot(commands.Bot):
                     break
             
             if not target_player:
-                await interaction.response.send_message("❌ Jogador não encontrado.", ephemeral=True)
+                await interaction.response.send_message(t('common.player_not_found'), ephemeral=True)
                 return
             
             # Verifica se já é titular
             if target_player['is_starter']:
                 embed = discord.Embed(
-                    title="ℹ️ Já é Titular",
-                    description=f"{target_player['name']} já é titular do seu time.",
+                    title=t('lineup.already_starter_title'),
+                    description=t('lineup.already_starter', name=target_player['name']),
                     color=0x808080
                 )
                 await interaction.response.edit_message(embed=embed, view=None)
@@ -683,35 +1226,37 @@ class HoopCoreBot(commands.Bot):
             
             if success:
                 embed = discord.Embed(
-                    title="✅ Titular Definido",
-                    description=f"{target_player['name']} agora é titular do seu time!",
+                    title=t('lineup.starter_set_title'),
+                    description=t('lineup.starter_set', name=target_player['name']),
                     color=0x00ff00
                 )
                 embed.add_field(
-                    name="💡 Dica",
-                    value="Use `/reserva` para remover jogadores do time titular.",
+                    name=t('common.tip'),
+                    value=t('lineup.starter_tip'),
                     inline=False
                 )
             else:
                 embed = discord.Embed(
-                    title="❌ Erro",
-                    description="Você já tem 5 titulares. Remova um titular primeiro com `/reserva`.",
+                    title=t('common.error'),
+                    description=t('lineup.starters_full'),
                     color=0xff0000
                 )
             
             await interaction.response.edit_message(embed=embed, view=None)
             
-        except Exception as e:
-            print(f"Erro ao definir titular: {e}")
-            await interaction.response.send_message("❌ Erro ao definir titular.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao definir titular")
+            await interaction.response.send_message(t('lineup.starter_error'), ephemeral=True)
     
     async def handle_bench_selection(self, interaction):
         """Lida com seleção de jogador para reserva"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Obtém o valor selecionado
             selected_value = interaction.data.get("values", [None])[0]
             if not selected_value:
-                await interaction.response.send_message("❌ Nenhum jogador selecionado.", ephemeral=True)
+                await interaction.response.send_message(t('common.nothing_selected'), ephemeral=True)
                 return
             
             player_id = int(selected_value)
@@ -727,14 +1272,14 @@ class HoopCoreBot(commands.Bot):
                     break
             
             if not target_player:
-                await interaction.response.send_message("❌ Jogador não encontrado.", ephemeral=True)
+                await interaction.response.send_message(t('common.player_not_found'), ephemeral=True)
                 return
             
             # Verifica se já é reserva
             if not target_player['is_starter']:
                 embed = discord.Embed(
-                    title="ℹ️ Já é Reserva",
-                    description=f"{target_player['name']} já é reserva do seu time.",
+                    title=t('lineup.already_bench_title'),
+                    description=t('lineup.already_bench', name=target_player['name']),
                     color=0x808080
                 )
                 await interaction.response.edit_message(embed=embed, view=None)
@@ -745,35 +1290,37 @@ class HoopCoreBot(commands.Bot):
             
             if success:
                 embed = discord.Embed(
-                    title="✅ Reserva Definido",
-                    description=f"{target_player['name']} agora é reserva do seu time!",
+                    title=t('lineup.bench_set_title'),
+                    description=t('lineup.bench_set', name=target_player['name']),
                     color=0x00ff00
                 )
                 embed.add_field(
-                    name="💡 Dica",
-                    value="Use `/titular` para definir jogadores como titular.",
+                    name=t('common.tip'),
+                    value=t('lineup.bench_tip'),
                     inline=False
                 )
             else:
                 embed = discord.Embed(
-                    title="❌ Erro",
-                    description="Erro ao definir jogador como reserva. Tente novamente.",
+                    title=t('common.error'),
+                    description=t('lineup.bench_failed'),
                     color=0xff0000
                 )
             
             await interaction.response.edit_message(embed=embed, view=None)
             
-        except Exception as e:
-            print(f"Erro ao definir reserva: {e}")
-            await interaction.response.send_message("❌ Erro ao definir reserva.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao definir reserva")
+            await interaction.response.send_message(t('lineup.bench_error'), ephemeral=True)
     
     async def handle_sell_selection(self, interaction):
         """Lida com seleção de jogador para venda"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Obtém o valor selecionado
             selected_value = interaction.data.get("values", [None])[0]
             if not selected_value:
-                await interaction.response.send_message("❌ Nenhum jogador selecionado.", ephemeral=True)
+                await interaction.response.send_message(t('common.nothing_selected'), ephemeral=True)
                 return
             
             player_id = int(selected_value)
@@ -789,7 +1336,7 @@ class HoopCoreBot(commands.Bot):
                     break
             
             if not target_player:
-                await interaction.response.send_message("❌ Jogador não encontrado.", ephemeral=True)
+                await interaction.response.send_message(t('common.player_not_found'), ephemeral=True)
                 return
             
             # Calcula valor de venda
@@ -797,10 +1344,10 @@ class HoopCoreBot(commands.Bot):
             
             # Confirma venda
             embed = discord.Embed(
-                title="💰 Confirmar Venda",
-                description=f"Você está vendendo **{target_player['name']}** por **${sell_value:,}**\n\n"
-                           f"Overall: {target_player['overall']} | Time: {target_player['team']}\n"
-                           f"Raridade: {target_player['rarity']} | Posição: {target_player['position']}",
+                title=t('sell.confirm_title'),
+                description=t('sell.confirm', name=target_player['name'], value=sell_value)
+                + t('common.player_details', overall=target_player['overall'], team=target_player['team'],
+                    rarity=t(f"rarity.{target_player['rarity']}"), position=target_player['position']),
                 color=0xffa500
             )
             
@@ -808,26 +1355,29 @@ class HoopCoreBot(commands.Bot):
             view = discord.ui.View()
             view.add_item(discord.ui.Button(
                 style=discord.ButtonStyle.green,
-                label="Confirmar Venda",
+                label=t('sell.confirm_button'),
                 emoji="💰",
                 custom_id=f"sell_confirm_{player_id}"
             ))
             view.add_item(discord.ui.Button(
                 style=discord.ButtonStyle.red,
-                label="Cancelar",
+                label=t('common.cancel'),
                 emoji="❌",
                 custom_id="sell_cancel"
             ))
             
             await interaction.response.edit_message(embed=embed, view=view)
             
-        except Exception as e:
-            print(f"Erro ao selecionar jogador para venda: {e}")
-            await interaction.response.send_message("❌ Erro ao selecionar jogador.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao selecionar jogador para venda")
+            await interaction.response.send_message(t('sell.select_error'), ephemeral=True)
     
     # Métodos de Partida Interativa
+    @rate_limited('match')
     async def start_match_game(self, interaction):
         """Inicia o jogo de partida"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Inicia no primeiro quarto
             quarter = 1
@@ -838,70 +1388,17 @@ class HoopCoreBot(commands.Bot):
             # Cria primeira situação
             await self.create_match_situation(interaction, quarter, time, score_player, score_cpu)
             
-        except Exception as e:
-            print(f"Erro ao iniciar partida: {e}")
-            await interaction.response.send_message("❌ Erro ao iniciar partida.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao iniciar partida")
+            await interaction.response.send_message(t('match.start_error'), ephemeral=True)
     
     async def create_match_situation(self, interaction, quarter, time, score_player, score_cpu):
         """Cria uma nova situação na partida"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Situações variadas baseadas no momento da partida
-            situations = [
-                {
-                    "name": "🏀 Ataque Rápido",
-                    "description": "Seu time tem uma chance de contra-ataque!",
-                    "options": [
-                        {"label": "⚡ Correr para a cesta", "custom_id": "fast_break_run", "success_rate": 0.7},
-                        {"label": "🎯 Passar para o ala", "custom_id": "fast_break_pass", "success_rate": 0.8},
-                        {"label": "🏃‍♂️ Drible e finalização", "custom_id": "fast_break_dribble", "success_rate": 0.6}
-                    ]
-                },
-                {
-                    "name": "🎯 Arremesso de 3 Pontos",
-                    "description": "Chance de arremesso de longa distância!",
-                    "options": [
-                        {"label": "🎯 Arremesso limpo", "custom_id": "three_clean", "success_rate": 0.4},
-                        {"label": "🏃‍♂️ Drible e arremesso", "custom_id": "three_dribble", "success_rate": 0.3},
-                        {"label": "🤝 Passar para melhor posição", "custom_id": "three_pass", "success_rate": 0.9}
-                    ]
-                },
-                {
-                    "name": "💪 Jogo Interior",
-                    "description": "Chance de jogada próxima à cesta!",
-                    "options": [
-                        {"label": "🏀 Hook shot", "custom_id": "inside_hook", "success_rate": 0.6},
-                        {"label": "💪 Post-up", "custom_id": "inside_post", "success_rate": 0.7},
-                        {"label": "🔄 Girar e finalizar", "custom_id": "inside_spin", "success_rate": 0.5}
-                    ]
-                },
-                {
-                    "name": "🛡️ Defesa",
-                    "description": "O adversário está atacando!",
-                    "options": [
-                        {"label": "🛡️ Bloqueio", "custom_id": "defense_block", "success_rate": 0.3},
-                        {"label": "🏃‍♂️ Roubar a bola", "custom_id": "defense_steal", "success_rate": 0.4},
-                        {"label": "📏 Forçar arremesso ruim", "custom_id": "defense_contest", "success_rate": 0.7}
-                    ]
-                },
-                {
-                    "name": "🎭 Jogada Especial",
-                    "description": "Chance de uma jogada espetacular!",
-                    "options": [
-                        {"label": "🔥 Alley-oop", "custom_id": "special_alley", "success_rate": 0.2},
-                        {"label": "💫 Crossover", "custom_id": "special_crossover", "success_rate": 0.4},
-                        {"label": "🚀 Tomahawk dunk", "custom_id": "special_tomahawk", "success_rate": 0.3}
-                    ]
-                },
-                {
-                    "name": "⏰ Final de Quarto",
-                    "description": "Última chance do quarto!",
-                    "options": [
-                        {"label": "🎯 Arremesso de 3", "custom_id": "quarter_three", "success_rate": 0.3},
-                        {"label": "🏃‍♂️ Penetração", "custom_id": "quarter_drive", "success_rate": 0.6},
-                        {"label": "🤝 Passar para finalização", "custom_id": "quarter_pass", "success_rate": 0.8}
-                    ]
-                }
-            ]
+            situations = GameLogic.MATCH_SITUATIONS
             
             # Escolhe situação baseada no momento
             if quarter == 4 and time <= 60:  # Final do jogo
@@ -917,129 +1414,88 @@ class HoopCoreBot(commands.Bot):
             
             # Cria embed da situação
             embed = discord.Embed(
-                title=situation["name"],
-                description=f"{situation['description']}\n\n"
-                           f"**Quarto {quarter}** | **{time}s** restantes\n"
-                           f"**Placar:** {score_player} x {score_cpu}",
+                title=t(f"match.situations.{situation['id']}.name"),
+                description=t('match.situation', description=t(f"match.situations.{situation['id']}.description"),
+                              quarter=quarter, time=time, player=score_player, cpu=score_cpu),
                 color=0x1e90ff
             )
             
             # Cria botões para as opções
             view = discord.ui.View()
-            for option in situation["options"]:
+            for action in situation["actions"]:
                 button = discord.ui.Button(
                     style=discord.ButtonStyle.primary,
-                    label=option["label"],
-                    custom_id=f"match_{option['custom_id']}_{quarter}_{time}_{score_player}_{score_cpu}",
+                    label=t(f"match.actions.{action}.label"),
+                    custom_id=f"match_{action}_{quarter}_{time}_{score_player}_{score_cpu}",
                     emoji="🎯"
                 )
                 view.add_item(button)
             
             await interaction.response.edit_message(embed=embed, view=view)
             
-        except Exception as e:
-            print(f"Erro ao criar situação: {e}")
-            await interaction.response.send_message("❌ Erro ao criar situação.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao criar situação")
+            await interaction.response.send_message(t('match.situation_error'), ephemeral=True)
     
+    @rate_limited('match')
     async def handle_match_action(self, interaction, custom_id):
         """Lida com ação escolhida na partida"""
+        t = await self.locales.translator(interaction)
+        
         try:
-            # Formato: match_ACTION_QUARTER_TIME_SCORE_PLAYER_SCORE_CPU
+            # Formato: match_ACTION_QUARTER_TIME_SCORE_PLAYER_SCORE_CPU (ACTION também tem "_")
             parts = custom_id.split("_")
             if len(parts) < 6:
-                await interaction.response.send_message("❌ Formato inválido.", ephemeral=True)
+                await interaction.response.send_message(t('common.invalid_format'), ephemeral=True)
                 return
             
-            action = parts[1]
-            quarter = int(parts[2])
-            time = int(parts[3])
-            score_player = int(parts[4])
-            score_cpu = int(parts[5])
+            action = "_".join(parts[1:-4])
+            quarter = int(parts[-4])
+            time = int(parts[-3])
+            score_player = int(parts[-2])
+            score_cpu = int(parts[-1])
             
             # Resolve a ação
             await self.resolve_match_action(interaction, action, quarter, time, score_player, score_cpu)
             
-        except Exception as e:
-            print(f"Erro ao processar ação: {e}")
-            await interaction.response.send_message("❌ Erro ao processar ação.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao processar ação")
+            await interaction.response.send_message(t('match.action_error'), ephemeral=True)
     
     async def resolve_match_action(self, interaction, action, quarter, time, score_player, score_cpu):
         """Resolve a ação escolhida na partida"""
+        t = await self.locales.translator(interaction)
+        
         try:
-            # Mapeia ações para resultados
-            action_results = {
-                "fast_break_run": {"success": "🏃‍♂️ **Contra-ataque perfeito!** +2 pontos", "fail": "❌ Defesa interceptou o passe"},
-                "fast_break_pass": {"success": "🤝 **Passe perfeito!** +2 pontos", "fail": "❌ Passe interceptado"},
-                "fast_break_dribble": {"success": "🏀 **Drible e finalização!** +2 pontos", "fail": "❌ Bola roubada"},
-                
-                "three_clean": {"success": "🎯 **Três pontos!** +3 pontos", "fail": "❌ Arremesso errou"},
-                "three_dribble": {"success": "🏃‍♂️ **Três pontos com drible!** +3 pontos", "fail": "❌ Arremesso errou"},
-                "three_pass": {"success": "🤝 **Passe para posição melhor!** +2 pontos", "fail": "❌ Passe interceptado"},
-                
-                "inside_hook": {"success": "🏀 **Hook shot perfeito!** +2 pontos", "fail": "❌ Hook shot errou"},
-                "inside_post": {"success": "💪 **Post-up dominante!** +2 pontos", "fail": "❌ Defesa forçou erro"},
-                "inside_spin": {"success": "🔄 **Giro e finalização!** +2 pontos", "fail": "❌ Giro perdeu o equilíbrio"},
-                
-                "defense_block": {"success": "🛡️ **Bloqueio espetacular!** Bola recuperada", "fail": "❌ Bloqueio falhou, +2 pontos CPU"},
-                "defense_steal": {"success": "🏃‍♂️ **Roubo de bola!** Contra-ataque", "fail": "❌ Roubo falhou, +2 pontos CPU"},
-                "defense_contest": {"success": "📏 **Arremesso contestado!** CPU errou", "fail": "❌ Contestação falhou, +2 pontos CPU"},
-                
-                "special_alley": {"success": "🔥 **ALLEY-OOP ESPETACULAR!** +3 pontos", "fail": "❌ Alley-oop falhou"},
-                "special_crossover": {"success": "💫 **CROSSOVER PERFEITO!** +2 pontos", "fail": "❌ Crossover falhou"},
-                "special_tomahawk": {"success": "🚀 **TOMAHAWK DUNK!** +3 pontos", "fail": "❌ Dunk falhou"},
-                
-                "quarter_three": {"success": "🎯 **TRÊS PONTOS NO FINAL!** +3 pontos", "fail": "❌ Arremesso final errou"},
-                "quarter_drive": {"success": "🏃‍♂️ **Penetração perfeita!** +2 pontos", "fail": "❌ Penetração falhou"},
-                "quarter_pass": {"success": "🤝 **Passe para finalização!** +2 pontos", "fail": "❌ Passe final falhou"}
-            }
-            
-            # Obtém resultado da ação
-            result = action_results.get(action, {"success": "✅ Ação bem-sucedida!", "fail": "❌ Ação falhou"})
+            # Chance de acerto e pontos da ação
+            action_info = GameLogic.MATCH_ACTIONS.get(action, {'success_rate': 0.5, 'points': 0, 'cpu_points': 0})
+            success_rate = action_info['success_rate']
             
             # Simula dados de RPG (1-100)
             roll = random.randint(1, 100)
             
-            # Determina sucesso baseado na taxa de sucesso da ação
-            success_rate = 0.5  # Taxa padrão
-            
-            # Busca taxa de sucesso específica
-            for situation in self.get_match_situations():
-                for option in situation["options"]:
-                    if option["custom_id"] == action:
-                        success_rate = option["success_rate"]
-                        break
-            
             # Calcula sucesso (roll <= success_rate * 100)
             is_success = roll <= (success_rate * 100)
             
             # Atualiza placar
             if is_success:
-                if "pontos" in result["success"]:
-                    if "+3 pontos" in result["success"]:
-                        score_player += 3
-                    elif "+2 pontos" in result["success"]:
-                        score_player += 2
+                score_player += action_info['points']
             else:
-                if "pontos" in result["fail"]:
-                    if "+2 pontos" in result["fail"]:
-                        score_cpu += 2
-                    elif "+3 pontos" in result["fail"]:
-                        score_cpu += 3
+                score_cpu += action_info['cpu_points']
             
             # Cria embed do resultado
+            result = t(f"match.actions.{action}.{'success' if is_success else 'fail'}")
             embed = discord.Embed(
-                title="🎯 Resultado da Jogada",
-                description=f"**Dados:** {roll}/100\n"
-                           f"**Taxa de Sucesso:** {success_rate*100:.0f}%\n\n"
-                           f"**Resultado:** {result['success'] if is_success else result['fail']}\n\n"
-                           f"**Placar Atual:** {score_player} x {score_cpu}",
+                title=t('match.result_title'),
+                description=t('match.result', roll=roll, rate=success_rate * 100, result=result,
+                              player=score_player, cpu=score_cpu),
                 color=0x00ff00 if is_success else 0xff0000
             )
             
             # Adiciona informações do jogo
             embed.add_field(
-                name="⏰ Tempo",
-                value=f"Quarto {quarter} | {time}s restantes",
+                name=t('match.time_title'),
+                value=t('match.time', quarter=quarter, time=time),
                 inline=True
             )
             
@@ -1047,24 +1503,27 @@ class HoopCoreBot(commands.Bot):
             view = discord.ui.View()
             view.add_item(discord.ui.Button(
                 style=discord.ButtonStyle.green,
-                label="▶️ Continuar",
+                label=t('match.continue'),
                 emoji="🏀",
                 custom_id=f"continue_match_{quarter}_{time}_{score_player}_{score_cpu}"
             ))
             
             await interaction.response.edit_message(embed=embed, view=view)
             
-        except Exception as e:
-            print(f"Erro ao resolver ação: {e}")
-            await interaction.response.send_message("❌ Erro ao resolver ação.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao resolver ação")
+            await interaction.response.send_message(t('match.resolve_error'), ephemeral=True)
     
+    @rate_limited('match')
     async def continue_match(self, interaction, custom_id):
         """Continua a partida após uma jogada"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Formato: continue_match_QUARTER_TIME_SCORE_PLAYER_SCORE_CPU
             parts = custom_id.split("_")
             if len(parts) < 5:
-                await interaction.response.send_message("❌ Formato inválido.", ephemeral=True)
+                await interaction.response.send_message(t('common.invalid_format'), ephemeral=True)
                 return
             
             quarter = int(parts[2])
@@ -1088,41 +1547,40 @@ class HoopCoreBot(commands.Bot):
             # Cria nova situação
             await self.create_match_situation(interaction, quarter, time, score_player, score_cpu)
             
-        except Exception as e:
-            print(f"Erro ao continuar partida: {e}")
-            await interaction.response.send_message("❌ Erro ao continuar partida.", ephemeral=True)
+        except Exception:
+            log.exception("Erro ao continuar partida")
+            await interaction.response.send_message(t('match.continue_error'), ephemeral=True)
     
     async def end_match(self, interaction, score_player, score_cpu):
         """Finaliza a partida"""
+        t = await self.locales.translator(interaction)
+        
         try:
             # Determina vencedor
             if score_player > score_cpu:
-                result = "🏆 **VITÓRIA!** 🏆"
+                result = t('match.victory')
                 color = 0x00ff00
                 money_gain = 500
             elif score_cpu > score_player:
-                result = "❌ **DERROTA** ❌"
+                result = t('match.defeat')
                 color = 0xff0000
                 money_gain = -200
             else:
-                result = "🤝 **EMPATE** 🤝"
+                result = t('match.draw')
                 color = 0x808080
                 money_gain = 100
             
             # Cria embed final
             embed = discord.Embed(
-                title="🏀 Fim de Jogo!",
-                description=f"**Placar Final:** {score_player} x {score_cpu}\n\n"
-                           f"**Resultado:** {result}\n"
-                           f"**Dinheiro:** ${money_gain:+d}",
+                title=t('match.end_title'),
+                description=t('match.end', player=score_player, cpu=score_cpu, result=result, money=money_gain),
                 color=color
             )
             
             embed.add_field(
-                name="📊 Estatísticas",
-                value=f"**Seus Pontos:** {score_player}\n"
-                      f"**Pontos CPU:** {score_cpu}\n"
-                      f"**Diferença:** {abs(score_player - score_cpu)}",
+                name=t('common.stats'),
+                value=t('match.end_stats', player=score_player, cpu=score_cpu,
+                        difference=abs(score_player - score_cpu)),
                 inline=True
             )
             
@@ -1130,83 +1588,27 @@ class HoopCoreBot(commands.Bot):
             view = discord.ui.View()
             view.add_item(discord.ui.Button(
                 style=discord.ButtonStyle.green,
-                label="🔄 Jogar Novamente",
+                label=t('match.play_again'),
                 emoji="🏀",
                 custom_id="play_again"
             ))
             
             await interaction.response.edit_message(embed=embed, view=view)
             
-        except Exception as e:
-            print(f"Erro ao finalizar partida: {e}")
-            await interaction.response.send_message("❌ Erro ao finalizar partida.", ephemeral=True)
-    
-    def get_match_situations(self):
-        """Retorna todas as situações possíveis"""
-        return [
-            {
-                "name": "🏀 Ataque Rápido",
-                "description": "Seu time tem uma chance de contra-ataque!",
-                "options": [
-                    {"label": "⚡ Correr para a cesta", "custom_id": "fast_break_run", "success_rate": 0.7},
-                    {"label": "🎯 Passar para o ala", "custom_id": "fast_break_pass", "success_rate": 0.8},
-                    {"label": "🏃‍♂️ Drible e finalização", "custom_id": "fast_break_dribble", "success_rate": 0.6}
-                ]
-            },
-            {
-                "name": "🎯 Arremesso de 3 Pontos",
-                "description": "Chance de arremesso de longa distância!",
-                "options": [
-                    {"label": "🎯 Arremesso limpo", "custom_id": "three_clean", "success_rate": 0.4},
-                    {"label": "🏃‍♂️ Drible e arremesso", "custom_id": "three_dribble", "success_rate": 0.3},
-                    {"label": "🤝 Passar para melhor posição", "custom_id": "three_pass", "success_rate": 0.9}
-                ]
-            },
-            {
-                "name": "💪 Jogo Interior",
-                "description": "Chance de jogada próxima à cesta!",
-                "options": [
-                    {"label": "🏀 Hook shot", "custom_id": "inside_hook", "success_rate": 0.6},
-                    {"label": "💪 Post-up", "custom_id": "inside_post", "success_rate": 0.7},
-                    {"label": "🔄 Girar e finalizar", "custom_id": "inside_spin", "success_rate": 0.5}
-                ]
-            },
-            {
-                "name": "🛡️ Defesa",
-                "description": "O adversário está atacando!",
-                "options": [
-                    {"label": "🛡️ Bloqueio", "custom_id": "defense_block", "success_rate": 0.3},
-                    {"label": "🏃‍♂️ Roubar a bola", "custom_id": "defense_steal", "success_rate": 0.4},
-                    {"label": "📏 Forçar arremesso ruim", "custom_id": "defense_contest", "success_rate": 0.7}
-                ]
-            },
-            {
-                "name": "🎭 Jogada Especial",
-                "description": "Chance de uma jogada espetacular!",
-                "options": [
-                    {"label": "🔥 Alley-oop", "custom_id": "special_alley", "success_rate": 0.2},
-                    {"label": "💫 Crossover", "custom_id": "special_crossover", "success_rate": 0.4},
-                    {"label": "🚀 Tomahawk dunk", "custom_id": "special_tomahawk", "success_rate": 0.3}
-                ]
-            },
-            {
-                "name": "⏰ Final de Quarto",
-                "description": "Última chance do quarto!",
-                "options": [
-                    {"label": "🎯 Arremesso de 3", "custom_id": "quarter_three", "success_rate": 0.3},
-                    {"label": "🏃‍♂️ Penetração", "custom_id": "quarter_drive", "success_rate": 0.6},
-                    {"label": "🤝 Passar para finalização", "custom_id": "quarter_pass", "success_rate": 0.8}
-                ]
-            }
-        ]
+        except Exception:
+            log.exception("Erro ao finalizar partida")
+            await interaction.response.send_message(t('match.end_error'), ephemeral=True)
 
 async def main():
     """Função principal"""
-    print("🏀 Iniciando HoopCore...")
+    # Logs vão para uma fila; arquivo e console são escritos numa thread à parte
+    listener = setup_logging()
+    log.info("Iniciando HoopCore...")
     
     # Verifica se o token está configurado
     if BOT_TOKEN == "SEU_TOKEN_AQUI":
-        print("❌ ERRO: Configure o token do bot no arquivo config.py!")
+        log.error("Configure o token do bot no arquivo config.py!")
+        listener.stop()
         return
     
     # Cria e executa o bot
@@ -1215,11 +1617,12 @@ async def main():
     try:
         await bot.start(BOT_TOKEN)
     except KeyboardInterrupt:
-        print("\n🛑 Bot interrompido pelo usuário")
-    except Exception as e:
-        print(f"❌ Erro ao iniciar o bot: {e}")
+        log.info("Bot interrompido pelo usuário")
+    except Exception:
+        log.exception("Erro ao iniciar o bot")
     finally:
         await bot.close()
+        listener.stop()
 
 if __name__ == "__main__":
     # Executa o bot
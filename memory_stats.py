@@ -0,0 +1,148 @@
+import os
+import sys
+import tracemalloc
+from collections import deque
+from itertools import islice
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Callable, Dict, List, Optional
+from config import MEMORY
+
+# Objetos que nunca pertencem a um cache (compartilhados pelo processo todo)
+_SKIP_TYPES = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+
+def deep_sizeof(obj, depth: int = MEMORY['size_depth'], sample: int = MEMORY['size_sample']) -> int:
+    """Tamanho aproximado do objeto e de tudo que ele referencia (até `depth` níveis)
+    
+    Coleções com mais de `sample` itens são estimadas pelos primeiros `sample` itens,
+    então medir um cache grande não trava o event loop. Objetos compartilhados contam uma vez.
+    """
+    seen = set()
+    
+    def size(value, level: int) -> int:
+        if id(value) in seen or isinstance(value, _SKIP_TYPES):
+            return 0
+        seen.add(id(value))
+        total = sys.getsizeof(value, 0)
+        if level >= depth:
+            return total
+        
+        if isinstance(value, dict):
+            count = len(value)
+            children = (item for pair in islice(value.items(), sample) for item in pair)
+        elif isinstance(value, (list, tuple, set, frozenset, deque)):
+            count = len(value)
+            children = islice(value, sample)
+        else:
+            attributes = getattr(value, '__dict__', None)
+            if attributes is not None:
+                total += size(attributes, level + 1)
+            slots = [slot for cls in type(value).__mro__ for slot in _slots(cls)]
+            count = 0
+            children = (getattr(value, slot, None) for slot in slots if slot not in ('__dict__', '__weakref__'))
+        
+        measured = sum(size(child, level + 1) for child in children)
+        if count > sample:
+            measured = measured * count // sample
+        return total + measured
+    
+    return size(obj, 0)
+
+def _slots(cls) -> tuple:
+    slots = cls.__dict__.get('__slots__', ())
+    return (slots,) if isinstance(slots, str) else tuple(slots)
+
+def format_bytes(size: Optional[int]) -> str:
+    if size is None:
+        return '?'
+    for unit in ('B', 'KB', 'MB'):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == 'B' else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+class CacheRegistry:
+    """Caches do bot se registram aqui para aparecer no relatório de memória"""
+    
+    def __init__(self):
+        self._caches: Dict[str, tuple] = {}
+    
+    def register(self, name: str, source: Callable, depth: int = MEMORY['size_depth'],
+                 count: Optional[Callable] = None):
+        """`source` retorna o objeto do cache na hora do relatório (registrar de novo substitui)
+
+        `count` conta as entradas quando len() do objeto não é o número certo.
+        """
+        self._caches[name] = (source, depth, count)
+    
+    def report(self) -> List[Dict]:
+        """Entradas e bytes aproximados de cada cache, do maior para o menor"""
+        rows = []
+        for name, (source, depth, count) in self._caches.items():
+            cache = source()
+            try:
+                entries = count() if count else len(cache)
+            except TypeError:
+                entries = None
+            rows.append({'name': name, 'entries': entries, 'bytes': deep_sizeof(cache, depth)})
+        rows.sort(key=lambda row: -row['bytes'])
+        return rows
+
+cache_registry = CacheRegistry()
+
+def current_rss() -> Optional[int]:
+    """Memória residente do processo em bytes (só no Linux)"""
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+class MemorySnapshots:
+    """Snapshots do tracemalloc sob demanda, comparados com o snapshot anterior
+    
+    O tracemalloc só começa no primeiro snapshot (ele deixa as alocações mais lentas),
+    então o primeiro relatório mostra o que foi alocado desde então e os próximos, a diferença.
+    """
+    
+    FILTERS = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>')
+    ]
+    
+    def __init__(self, top: int = MEMORY['top_lines']):
+        self.top = top
+        self._previous: Optional[tracemalloc.Snapshot] = None
+    
+    @property
+    def tracing(self) -> bool:
+        return tracemalloc.is_tracing()
+    
+    def take(self) -> str:
+        """Tira um snapshot e retorna o relatório por arquivo e linha"""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(MEMORY['tracemalloc_frames'])
+            self._previous = None
+        snapshot = tracemalloc.take_snapshot().filter_traces(self.FILTERS)
+        current, peak = tracemalloc.get_traced_memory()
+        lines = [f"Rastreado: {current / 1024 / 1024:.1f} MB (pico {peak / 1024 / 1024:.1f} MB)", ""]
+        
+        if self._previous is None:
+            lines.append(f"Maiores alocações desde o início do rastreamento (top {self.top}):")
+            for stat in snapshot.statistics('lineno')[:self.top]:
+                lines.append(f"{stat.size / 1024:10.1f} KiB {stat.count:8} blocos  {stat.traceback}")
+        else:
+            lines.append(f"Diferença para o snapshot anterior (top {self.top}):")
+            for stat in snapshot.compare_to(self._previous, 'lineno')[:self.top]:
+                lines.append(f"{stat.size_diff / 1024:+10.1f} KiB {stat.count_diff:+8} blocos "
+                             f"(total {stat.size / 1024:.1f} KiB)  {stat.traceback}")
+        self._previous = snapshot
+        return '\n'.join(lines) + '\n'
+    
+    def stop(self):
+        """Para o rastreamento e libera os snapshots"""
+        tracemalloc.stop()
+        self._previous = None
+
+memory_snapshots = MemorySnapshots()
@@ -0,0 +1,291 @@
+import bisect
+import functools
+import inspect
+import logging
+import re
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from aiohttp import web
+from config import METRICS
+
+log = logging.getLogger(__name__)
+
+# Limites (em segundos) dos histogramas de latência
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value: str) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _format_labels(names: Iterable[str], values: Iterable[str], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+def _format_value(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class _CounterValue:
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0
+    
+    def inc(self, amount: float = 1):
+        self.value += amount
+
+class _GaugeValue:
+    __slots__ = ('value',)
+    
+    def __init__(self):
+        self.value = 0
+    
+    def set(self, value: float):
+        self.value = value
+    
+    def inc(self, amount: float = 1):
+        self.value += amount
+    
+    def dec(self, amount: float = 1):
+        self.value -= amount
+
+class _HistogramValue:
+    __slots__ = ('bounds', 'counts', 'sum', 'count')
+    
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+class Metric:
+    """Métrica com rótulos; cada combinação de valores vira um filho guardado em dicionário
+    
+    Quem está no caminho quente deve guardar o filho (labels(...)) e só chamar inc/observe.
+    """
+    
+    TYPE = 'untyped'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], object] = {}
+        if not self.labelnames:
+            self._children[()] = self._new_child()
+    
+    def labels(self, *values: str):
+        child = self._children.get(values)
+        if child is None:
+            child = self._children[values] = self._new_child()
+        return child
+    
+    def _new_child(self):
+        # Métrica 'untyped': um valor livre, como o de um gauge
+        return _GaugeValue()
+    
+    def children(self) -> Dict[Tuple[str, ...], object]:
+        """Valores por combinação de rótulos (relatórios fora do /metrics)"""
+        return dict(self._children)
+    
+    def samples(self) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(child.value)}"
+                for values, child in self._children.items()]
+    
+    def expose(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"] + self.samples()
+
+class Counter(Metric):
+    TYPE = 'counter'
+    
+    def _new_child(self):
+        return _CounterValue()
+    
+    def inc(self, amount: float = 1):
+        self._children[()].inc(amount)
+
+class Gauge(Metric):
+    TYPE = 'gauge'
+    
+    def _new_child(self):
+        return _GaugeValue()
+    
+    def set(self, value: float):
+        self._children[()].set(value)
+
+class Histogram(Metric):
+    TYPE = 'histogram'
+    
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        super().__init__(name, documentation, labelnames)
+    
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+    
+    def observe(self, value: float):
+        self._children[()].observe(value)
+    
+    def samples(self) -> List[str]:
+        lines = []
+        for values, child in self._children.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), child.counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, values, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, values)
+            lines.append(f"{self.name}_sum{labels} {_format_value(child.sum)}")
+            lines.append(f"{self.name}_count{labels} {child.count}")
+        return lines
+
+class CallbackMetric(Metric):
+    """Métrica lida só na coleta (tamanho de cache, contadores que já existem em outro objeto)
+    
+    A função retorna um número ou um dicionário {valores dos rótulos: número}.
+    """
+    
+    def __init__(self, name: str, documentation: str, metric_type: str, func: Callable,
+                 labelnames: Iterable[str] = ()):
+        self.TYPE = metric_type
+        self.func = func
+        super().__init__(name, documentation, labelnames)
+    
+    def _new_child(self):
+        return None
+    
+    def samples(self) -> List[str]:
+        result = self.func()
+        if not isinstance(result, dict):
+            result = {(): result}
+        return [f"{self.name}{_format_labels(self.labelnames, values)} {_format_value(value)}"
+                for values, value in result.items()]
+
+class MetricsRegistry:
+    """Registro das métricas do bot, exportadas no formato de texto do Prometheus"""
+    
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+    
+    def _register(self, metric: Metric) -> Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Métrica duplicada: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+    
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+    
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+    
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+    
+    def callback(self, name: str, documentation: str, func: Callable, metric_type: str = 'gauge',
+                 labelnames: Iterable[str] = ()) -> CallbackMetric:
+        """Registra (ou substitui) uma métrica calculada na coleta"""
+        self._metrics.pop(name, None)
+        return self._register(CallbackMetric(name, documentation, metric_type, func, labelnames))
+    
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics.values():
+            try:
+                lines.extend(metric.expose())
+            except Exception:
+                log.exception("Erro ao coletar métrica %s", metric.name)
+        return '\n'.join(lines) + '\n'
+
+registry = MetricsRegistry()
+
+command_seconds = registry.histogram(
+    'hoopcore_command_seconds', 'Duração dos comandos slash', ['command'])
+commands_total = registry.counter(
+    'hoopcore_commands_total', 'Comandos slash executados', ['command', 'status'])
+component_seconds = registry.histogram(
+    'hoopcore_component_seconds', 'Duração das rotas de botões e menus', ['route'])
+components_total = registry.counter(
+    'hoopcore_components_total', 'Interações de botões e menus', ['route', 'status'])
+db_seconds = registry.histogram(
+    'hoopcore_db_seconds', 'Duração dos métodos do Database', ['method'])
+db_errors_total = registry.counter(
+    'hoopcore_db_errors_total', 'Exceções levantadas pelos métodos do Database', ['method'])
+admission_seconds = registry.histogram(
+    'hoopcore_admission_wait_seconds', 'Espera na fila de admissão antes de usar o banco', ['priority'])
+admission_shed_total = registry.counter(
+    'hoopcore_admission_shed_total', 'Interações e tarefas descartadas pelo controle de admissão',
+    ['priority', 'reason'])
+rate_limited_total = registry.counter(
+    'hoopcore_rate_limited_total', 'Interações barradas pelo limite por usuário', ['route_class'])
+db_faults_total = registry.counter(
+    'hoopcore_db_faults_injected_total', 'Latência, travas e falhas injetadas no acesso ao banco', ['method', 'kind'])
+loop_lag_seconds = registry.gauge(
+    'hoopcore_event_loop_lag_seconds', 'Atraso do event loop na última amostra')
+loop_lag_histogram = registry.histogram(
+    'hoopcore_event_loop_lag_histogram_seconds', 'Distribuição do atraso do event loop')
+loop_blocks_total = registry.counter(
+    'hoopcore_event_loop_blocks_total', 'Vezes em que o event loop ficou bloqueado acima do limite')
+
+def component_route(custom_id: str) -> str:
+    """Nome da rota sem os IDs do custom_id (sell_confirm_123 -> sell_confirm, page:shop:... -> page:shop)"""
+    if custom_id.startswith('page:'):
+        return ':'.join(custom_id.split(':')[:2])
+    return re.sub(r'(_-?\d+)+$', '', custom_id) or 'unknown'
+
+def instrument_methods(histogram: Histogram, errors: Counter):
+    """Decorador de classe: mede todos os métodos async públicos"""
+    def decorator(cls):
+        for name, func in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.iscoroutinefunction(func):
+                continue
+            setattr(cls, name, _timed(func, histogram.labels(name), errors.labels(name)))
+        return cls
+    return decorator
+
+def _timed(func, timer, errors):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception:
+            errors.inc()
+            raise
+        finally:
+            timer.observe(time.perf_counter() - start)
+    return wrapper
+
+class MetricsServer:
+    """Servidor HTTP local que expõe /metrics"""
+    
+    def __init__(self, host: str = METRICS['host'], port: int = METRICS['port']):
+        self.host = host
+        self.port = port
+        self._runner: Optional[web.AppRunner] = None
+    
+    async def start(self):
+        app = web.Application()
+        app.router.add_get('/metrics', self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        log.info("Métricas em http://%s:%s/metrics", self.host, self.port)
+    
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+    
+    async def _handle(self, request: web.Request) -> web.Response:
+        return web.Response(body=registry.render().encode('utf-8'),
+                            headers={'Content-Type': 'text/plain; version=0.0.4; charset=utf-8'})
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict
+from config import PROFILER
+
+class SamplingProfiler:
+    """Profiler por amostragem da thread do event loop
+    
+    Uma thread auxiliar lê a pilha da thread do bot a cada `interval` segundos e conta as
+    pilhas iguais. Não instrumenta nada, então o custo é o mesmo com o bot ocioso ou ocupado.
+    """
+    
+    def __init__(self, interval: float = PROFILER['interval']):
+        self.interval = interval
+        self._stop = threading.Event()
+        self._running = False
+    
+    @property
+    def running(self) -> bool:
+        return self._running
+    
+    async def run(self, duration: float) -> Dict:
+        """Amostra a thread atual por `duration` segundos (ou até stop) e retorna o perfil"""
+        if self._running:
+            raise RuntimeError("Já existe um perfil em andamento")
+        self._running = True
+        self._stop.clear()
+        try:
+            start = time.perf_counter()
+            stacks = await asyncio.to_thread(self._sample, threading.get_ident(), duration)
+            elapsed = time.perf_counter() - start
+        finally:
+            self._running = False
+        return {
+            'samples': sum(stacks.values()),
+            'seconds': elapsed,
+            'collapsed': self.collapsed(stacks),
+            'summary': self.summary(stacks, elapsed)
+        }
+    
+    def stop(self):
+        self._stop.set()
+    
+    def _sample(self, thread_id: int, duration: float) -> Counter:
+        stacks = Counter()
+        deadline = time.perf_counter() + duration
+        while not self._stop.wait(self.interval) and time.perf_counter() < deadline:
+            frame = sys._current_frames().get(thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                stacks[tuple(reversed(stack))] += 1
+        return stacks
+    
+    @staticmethod
+    def collapsed(stacks: Counter) -> str:
+        """Formato "pilha;da;raiz;à;folha contagem" (flamegraph.pl, speedscope, inferno)"""
+        return ''.join(f"{';'.join(stack)} {count}\n" for stack, count in stacks.most_common())
+    
+    @staticmethod
+    def summary(stacks: Counter, seconds: float, limit: int = PROFILER['top_functions']) -> str:
+        """Funções com mais amostras: próprias (no topo da pilha) e totais (em qualquer nível)"""
+        total = sum(stacks.values())
+        own: Counter = Counter()
+        inclusive: Counter = Counter()
+        for stack, count in stacks.items():
+            own[stack[-1]] += count
+            for function in set(stack):
+                inclusive[function] += count
+        
+        lines = [f"Amostras: {total} em {seconds:.1f}s", "", f"{'próprio':>8} {'total':>8}  função"]
+        for function in sorted(inclusive, key=lambda function: (-own[function], -inclusive[function]))[:limit]:
+            lines.append(f"{own[function] / total:8.1%} {inclusive[function] / total:8.1%}  {function}")
+        return '\n'.join(lines) + '\n'
+
+profiler = SamplingProfiler()
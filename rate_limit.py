@@ -0,0 +1,92 @@
+import functools
+import math
+import time
+from collections import OrderedDict
+from typing import Dict, Tuple
+from config import RATE_LIMITS
+from memory_stats import cache_registry
+from metrics import rate_limited_total
+
+class TokenBucket:
+    __slots__ = ('tokens', 'updated')
+    
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+
+class RateLimiter:
+    """Balde de fichas por (usuário, classe de rota), em memória
+    
+    Cada classe tem `capacity` fichas (a rajada permitida) que voltam a `per_second`.
+    Os baldes ficam em ordem de uso: a checagem é O(1) e a limpeza periódica só olha o
+    começo da fila. Um balde parado há `idle_after` segundos já estaria cheio de novo,
+    então descartá-lo não muda nenhuma decisão.
+    """
+    
+    def __init__(self, limits: Dict[str, Dict[str, float]] = RATE_LIMITS['classes'],
+                 sweep_interval: float = RATE_LIMITS['sweep_interval'], enabled: bool = RATE_LIMITS['enabled']):
+        self.limits: Dict[str, Tuple[float, float]] = {
+            name: (limit['capacity'], limit['per_second']) for name, limit in limits.items()
+        }
+        self.idle_after = max(capacity / rate for capacity, rate in self.limits.values())
+        self.sweep_interval = sweep_interval
+        self.enabled = enabled
+        self._buckets: 'OrderedDict[Tuple[int, str], TokenBucket]' = OrderedDict()
+        self._next_sweep = time.monotonic() + sweep_interval
+    
+    def __len__(self) -> int:
+        return len(self._buckets)
+    
+    def check(self, user_id: int, route_class: str) -> float:
+        """Gasta uma ficha; devolve 0 se liberado ou os segundos até a próxima ficha"""
+        if not self.enabled:
+            return 0.0
+        capacity, rate = self.limits[route_class]
+        key = (user_id, route_class)
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(capacity, now)
+        else:
+            self._buckets.move_to_end(key)
+            bucket.tokens = min(capacity, bucket.tokens + (now - bucket.updated) * rate)
+            bucket.updated = now
+        if now >= self._next_sweep:
+            self._sweep(now)
+        
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+        rate_limited_total.labels(route_class).inc()
+        return (1 - bucket.tokens) / rate
+    
+    def _sweep(self, now: float):
+        """Descarta os baldes parados (os mais antigos ficam no começo)"""
+        self._next_sweep = now + self.sweep_interval
+        while self._buckets:
+            key, bucket = next(iter(self._buckets.items()))
+            if now - bucket.updated < self.idle_after:
+                break
+            del self._buckets[key]
+
+rate_limiter = RateLimiter()
+cache_registry.register('rate_limit_buckets', lambda: rate_limiter._buckets)
+
+def rate_limited(route_class: str):
+    """Decorador de comandos slash e handlers de botões (self, interaction, ...)
+    
+    Sem ficha, responde "vá com calma" só com o idioma em cache e não chama o handler.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction, *args, **kwargs):
+            retry_after = rate_limiter.check(interaction.user.id, route_class)
+            if retry_after:
+                interaction.extras["rate_limited"] = route_class
+                t = interaction.client.locales.cached_translator(interaction)
+                await interaction.response.send_message(
+                    t('common.rate_limited', seconds=math.ceil(retry_after)), ephemeral=True)
+                return
+            return await func(self, interaction, *args, **kwargs)
+        return wrapper
+    return decorator
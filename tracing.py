@@ -0,0 +1,191 @@
+import contextvars
+import functools
+import inspect
+import itertools
+import json
+import logging
+import os
+import queue
+import random
+import threading
+import time
+from typing import Dict, Optional
+from config import TRACING
+
+log = logging.getLogger(__name__)
+
+class Span:
+    """Trecho medido de uma interação (tempos em ns de perf_counter)"""
+    
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'category', 'args', 'start')
+    
+    def __init__(self, trace_id: int, span_id: int, parent_id: Optional[int], name: str,
+                 category: str, args: Optional[Dict] = None):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = time.perf_counter_ns()
+
+# Span aberto na task atual; _NOT_SAMPLED marca interações fora da amostra
+_current: contextvars.ContextVar = contextvars.ContextVar('span', default=None)
+_NOT_SAMPLED = object()
+_ids = itertools.count(1)
+
+class Tracer:
+    """Grava os spans no formato Trace Event (JSON), aberto pelo Perfetto e chrome://tracing
+    
+    A amostragem é decidida no início da interação: fora da amostra, nenhum span filho é
+    criado. A escrita fica numa thread; o event loop só coloca o evento numa fila.
+    """
+    
+    def __init__(self, path: str = TRACING['file'], sample_rate: float = TRACING['sample_rate'],
+                 max_bytes: int = TRACING['max_bytes']):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='tracer', daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+    
+    def record(self, span: Span, error: Optional[str] = None):
+        end = time.perf_counter_ns()
+        args = {'trace_id': span.trace_id, 'span_id': span.span_id, 'parent_id': span.parent_id}
+        if span.args:
+            args.update(span.args)
+        if error:
+            args['error'] = error
+        self._queue.put({
+            'name': span.name,
+            'cat': span.category,
+            'ph': 'X',
+            'ts': span.start // 1000,
+            'dur': (end - span.start) // 1000,
+            'pid': os.getpid(),
+            'tid': span.trace_id,
+            'args': args
+        })
+    
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        trace_file = open(self.path, 'a', encoding='utf-8')
+        if trace_file.tell() == 0:
+            # Formato em array: o "]" final é opcional, então dá para ir acrescentando
+            trace_file.write('[\n')
+        return trace_file
+    
+    def _run(self):
+        trace_file = self._open()
+        try:
+            while True:
+                event = self._queue.get()
+                if event is None:
+                    break
+                trace_file.write(json.dumps(event, ensure_ascii=False, default=str) + ',\n')
+                if self._queue.empty():
+                    trace_file.flush()
+                if trace_file.tell() >= self.max_bytes:
+                    trace_file.close()
+                    os.replace(self.path, self.path + '.1')
+                    trace_file = self._open()
+        except Exception:
+            log.exception("Erro ao gravar traces")
+        finally:
+            trace_file.close()
+
+tracer = Tracer()
+
+def start_trace(name: str, category: str, **args) -> Optional[Span]:
+    """Abre o span raiz de uma interação, se ela cair na amostra"""
+    if random.random() >= tracer.sample_rate:
+        _current.set(_NOT_SAMPLED)
+        return None
+    span = Span(next(_ids), next(_ids), None, name, category, args)
+    _current.set(span)
+    return span
+
+def finish_trace(span: Optional[Span], status: str = 'ok'):
+    """Fecha o span raiz aberto por start_trace"""
+    if span is not None:
+        tracer.record(span, None if status == 'ok' else status)
+
+class span:
+    """Span filho do span atual; não faz nada fora de uma interação amostrada
+    
+    Uso: with span("nome", "categoria"): ...
+    """
+    
+    __slots__ = ('name', 'category', 'args', '_span', '_token')
+    
+    def __init__(self, name: str, category: str = 'function', **args):
+        self.name = name
+        self.category = category
+        self.args = args
+        self._span = None
+    
+    def __enter__(self) -> Optional[Span]:
+        parent = _current.get()
+        if parent is None or parent is _NOT_SAMPLED:
+            return None
+        self._span = Span(parent.trace_id, next(_ids), parent.span_id, self.name, self.category, self.args)
+        self._token = _current.set(self._span)
+        return self._span
+    
+    def __exit__(self, exc_type, exc, tb):
+        if self._span is not None:
+            _current.reset(self._token)
+            tracer.record(self._span, exc_type.__name__ if exc_type else None)
+            self._span = None
+
+def trace_methods(category: str):
+    """Decorador de classe: abre um span em cada método async público"""
+    def decorator(cls):
+        for name, func in list(vars(cls).items()):
+            if name.startswith('_') or not inspect.iscoroutinefunction(func):
+                continue
+            setattr(cls, name, _traced(func, f"{category}.{name}", category))
+        return cls
+    return decorator
+
+def _traced(func, name: str, category: str):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        parent = _current.get()
+        if parent is None or parent is _NOT_SAMPLED:
+            return await func(*args, **kwargs)
+        with span(name, category):
+            return await func(*args, **kwargs)
+    return wrapper
+
+def instrument_discord_http():
+    """Spans nas chamadas REST do Discord (API do bot e respostas/followups de interação)"""
+    from discord.http import HTTPClient
+    from discord.webhook.async_ import AsyncWebhookAdapter
+    
+    for cls in (HTTPClient, AsyncWebhookAdapter):
+        if getattr(cls.request, '__traced__', False):
+            continue
+        cls.request = _traced_request(cls.request)
+
+def _traced_request(func):
+    @functools.wraps(func)
+    async def wrapper(self, route, *args, **kwargs):
+        parent = _current.get()
+        if parent is None or parent is _NOT_SAMPLED:
+            return await func(self, route, *args, **kwargs)
+        with span(f"discord {route.method} {route.path}", 'discord'):
+            return await func(self, route, *args, **kwargs)
+    wrapper.__traced__ = True
+    return wrapper
@@ -0,0 +1,120 @@
+import hashlib
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+from typing import Dict, Optional
+from config import TRAFFIC_CAPTURE
+
+log = logging.getLogger(__name__)
+
+SNOWFLAKE = re.compile(r"\d{15,}")  # IDs do Discord dentro de custom_ids (ex: dono do PageToken)
+
+class TrafficRecorder:
+    """Grava as interações reais, sanitizadas, para o benchmarks.replay reproduzir
+    
+    Uma linha JSON compacta por interação: t (horário), k (c=comando, b=botão, m=menu),
+    r (comando ou custom_id), a (argumentos), u/g (hash do usuário/servidor), d (ms), s (status).
+    IDs viram hashes com chave (TRAFFIC_SALT) e textos livres viram só o tamanho; opções
+    com choices ficam como estão. A escrita fica numa thread, como a do tracer.
+    """
+    
+    def __init__(self, path: str = TRAFFIC_CAPTURE['file'], sample_rate: float = TRAFFIC_CAPTURE['sample_rate'],
+                 max_bytes: int = TRAFFIC_CAPTURE['max_bytes'], salt: Optional[str] = TRAFFIC_CAPTURE['salt']):
+        self.path = path
+        self.sample_rate = sample_rate
+        self.max_bytes = max_bytes
+        # Sem sal configurado, os hashes mudam a cada processo (não dá para ligar ao usuário)
+        self._salt = (salt or os.urandom(16).hex()).encode('utf-8')[:64]
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+    
+    @property
+    def recording(self) -> bool:
+        return self._thread is not None
+    
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='traffic-capture', daemon=True)
+            self._thread.start()
+    
+    def stop(self):
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+    
+    def hash_id(self, value) -> str:
+        return hashlib.blake2b(str(value).encode('utf-8'), key=self._salt, digest_size=8).hexdigest()
+    
+    def _sanitize(self, value, parameter) -> object:
+        if isinstance(value, (bool, int, float)) or value is None:
+            return value
+        if isinstance(value, str):
+            return value if parameter is not None and parameter.choices else {'len': len(value)}
+        if hasattr(value, 'id'):  # Membro, usuário, canal ou cargo
+            return {'id': self.hash_id(value.id)}
+        return {'type': type(value).__name__}
+    
+    def record_command(self, interaction, status: str, seconds: float):
+        """Comando slash concluído (chamado junto com as métricas)"""
+        if self._thread is None or random.random() >= self.sample_rate:
+            return
+        command = interaction.command
+        args = {}
+        if command is not None:
+            for name, value in interaction.namespace:
+                parameter = command.get_parameter(name) if hasattr(command, 'get_parameter') else None
+                args[name] = self._sanitize(value, parameter)
+        self._put(interaction, 'c', command.qualified_name if command else 'unknown', args, status, seconds)
+    
+    def record_component(self, interaction, status: str, seconds: float):
+        """Clique em botão ou menu concluído"""
+        if self._thread is None or random.random() >= self.sample_rate:
+            return
+        data = interaction.data or {}
+        kind = 'm' if data.get('component_type') == 3 else 'b'
+        args = {'values': [self._scrub(value) for value in data.get('values', [])]} if kind == 'm' else {}
+        self._put(interaction, kind, self._scrub(data.get('custom_id', '')), args, status, seconds)
+    
+    def _scrub(self, text: str) -> str:
+        """Troca os IDs do Discord no texto por ~hash"""
+        return SNOWFLAKE.sub(lambda match: '~' + self.hash_id(match.group()), text)
+    
+    def _put(self, interaction, kind: str, route: str, args: Dict, status: str, seconds: float):
+        event = {'t': round(time.time(), 3), 'k': kind, 'r': route, 'u': self.hash_id(interaction.user.id),
+                 'd': round(seconds * 1000, 2), 's': status}
+        if args:
+            event['a'] = args
+        if interaction.guild_id:
+            event['g'] = self.hash_id(interaction.guild_id)
+        self._queue.put(event)
+    
+    def _open(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        return open(self.path, 'a', encoding='utf-8')
+    
+    def _run(self):
+        capture_file = self._open()
+        try:
+            while True:
+                event = self._queue.get()
+                if event is None:
+                    break
+                capture_file.write(json.dumps(event, ensure_ascii=False, separators=(',', ':')) + '\n')
+                if self._queue.empty():
+                    capture_file.flush()
+                if capture_file.tell() >= self.max_bytes:
+                    capture_file.close()
+                    os.replace(self.path, self.path + '.1')
+                    capture_file = self._open()
+        except Exception:
+            log.exception("Erro ao gravar a captura de tráfego")
+        finally:
+            capture_file.close()
+
+traffic_recorder = TrafficRecorder()
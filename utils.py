@@ -1,11 +1,24 @@
 import discord
 from discord import app_commands
 from discord.ext import commands
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+import json
 import math
-from config import COLORS, RARITIES, EMOJIS
+import os
+import re
+import string
+from config import COLORS, RARITIES, EMOJIS, LANGUAGES, ECONOMY, TIMERS, LOCALIZATION
+from memory_stats import cache_registry
 import random
 
+# Emoji de cada raridade
+RARITY_EMOJIS = {
+    'comum': '⚪',
+    'raro': '🔵',
+    'épico': '🟣',
+    'lendário': '🟡'
+}
+
 class EmbedBuilder:
     """Classe para criar embeds profissionais e consistentes"""
     
@@ -28,10 +41,21 @@ class EmbedBuilder:
         return embed
     
     @staticmethod
-    def player_card(player: Dict, show_details: bool = True) -> discord.Embed:
-        """Cria um card de jogador"""
+    def player_card(player: Dict, show_details: bool = True, language: str = 'pt') -> discord.Embed:
+        """Cria um card de jogador (servido do cache quando possível)"""
+        if 'player_id' in player:
+            return player_card_cache.get(player, show_details, language)
+        return EmbedBuilder.build_player_card(player, show_details, language)
+    
+    @staticmethod
+    def build_player_card(player: Dict, show_details: bool = True, language: str = 'pt') -> discord.Embed:
+        """Monta o card de jogador do zero"""
+        t = LanguageManager.translator(language)
         rarity_info = RARITIES.get(player['rarity'], {})
         color = rarity_info.get('color', COLORS['primary'])
+        rarity_name = t(f"rarity.{player['rarity']}")
+        if rarity_name == f"rarity.{player['rarity']}":
+            rarity_name = rarity_info.get('name', player['rarity'])
         
         embed = discord.Embed(
             title=f"{player['name']} {EMOJIS['basketball']}",
@@ -39,61 +63,55 @@ class EmbedBuilder:
         )
         
         embed.add_field(
-            name="📊 Overall",
+            name=t('card.overall'),
             value=f"**{player['overall']}**",
             inline=True
         )
         
         embed.add_field(
-            name="🏀 Posição",
+            name=t('card.position'),
             value=f"**{player['position']}**",
             inline=True
         )
         
         embed.add_field(
-            name="📏 Altura",
+            name=t('card.height'),
             value=f"**{player['height']}**",
             inline=True
         )
         
         embed.add_field(
-            name="🏆 Time",
+            name=t('card.team'),
             value=f"**{player['team']}**",
             inline=True
         )
         
         embed.add_field(
-            name="⭐ Raridade",
-            value=f"**{rarity_info.get('name', player['rarity'])}**",
+            name=t('card.rarity'),
+            value=f"**{rarity_name}**",
             inline=True
         )
         
         if show_details:
             embed.add_field(
-                name="💰 Valor",
+                name=t('card.value'),
                 value=f"**${player['market_value']:,}**",
                 inline=True
             )
         
-        # Adiciona emoji baseado na raridade
-        rarity_emoji = {
-            'comum': '⚪',
-            'raro': '🔵',
-            'épico': '🟣',
-            'lendário': '🟡'
-        }
-        
-        embed.description = f"{rarity_emoji.get(player['rarity'], '⚪')} **{rarity_info.get('name', player['rarity'])}**"
+        embed.description = f"{RARITY_EMOJIS.get(player['rarity'], '⚪')} **{rarity_name}**"
         
         return embed
     
     @staticmethod
-    def team_overview(team: Dict, players: List[Dict], user_money: int) -> discord.Embed:
-        """Cria overview do time"""
-        starters = [p for p in players if p['is_starter']]
-        bench = [p for p in players if not p['is_starter']]
+    def team_overview(team: Dict, players: List[Dict], user_money: int,
+                      list_starters: bool = True, language: str = 'pt') -> discord.Embed:
+        """Cria overview do time (list_starters=False quando a imagem mostra os titulares)
         
-        avg_overall = sum(p['overall'] for p in starters) / len(starters) if starters else 0
+        Totais e média vêm de team_stats (campos de Database.get_team).
+        """
+        t = LanguageManager.translator(language)
+        starters = [p for p in players if p['is_starter']]
         
         embed = discord.Embed(
             title=f"🏀 {team['team_name']}",
@@ -101,28 +119,29 @@ class EmbedBuilder:
         )
         
         embed.add_field(
-            name="📊 Estatísticas",
-            value=f"**Vitórias:** {team['wins']}\n**Derrotas:** {team['losses']}\n**Overall:** {avg_overall:.1f}",
+            name=t('common.stats'),
+            value=t('team.overview_stats', wins=team['wins'], losses=team['losses'], overall=team['avg_overall']),
             inline=True
         )
         
         embed.add_field(
-            name="💰 Economia",
-            value=f"**Dinheiro:** ${user_money:,}",
+            name=t('common.economy'),
+            value=t('team.overview_money', money=user_money),
             inline=True
         )
         
         embed.add_field(
-            name="👥 Jogadores",
-            value=f"**Titulares:** {len(starters)}/5\n**Reservas:** {len(bench)}",
+            name=t('team.players'),
+            value=t('team.overview_players', starters=team['starters'],
+                    bench=team['roster_size'] - team['starters']),
             inline=True
         )
         
         # Lista titulares
-        if starters:
+        if starters and list_starters:
             starters_text = "\n".join([f"• {p['name']} ({p['overall']})" for p in starters[:5]])
             embed.add_field(
-                name="⭐ Titulares",
+                name=t('team.starters'),
                 value=starters_text,
                 inline=False
             )
@@ -130,83 +149,110 @@ class EmbedBuilder:
         return embed
     
     @staticmethod
-    def shop_embed(items: List[Dict]) -> discord.Embed:
-        """Cria embed da loja"""
+    def shop_embed(items: List[Dict], start: int = 1, page: int = 1, total_pages: int = 1,
+                   language: str = 'pt') -> discord.Embed:
+        """Cria embed da loja (uma página, numerada a partir de start)"""
+        t = LanguageManager.translator(language)
         embed = discord.Embed(
-            title=f"{EMOJIS['shop']} Loja da NBA",
-            description="Jogadores disponíveis para compra!",
+            title=t('shop.title'),
+            description=t('shop.description'),
             color=COLORS['info']
         )
         
-        for i, item in enumerate(items[:10], 1):  # Máximo 10 itens
-            rarity_info = RARITIES.get(item['rarity'], {})
-            rarity_emoji = {
-                'comum': '⚪',
-                'raro': '🔵',
-                'épico': '🟣',
-                'lendário': '🟡'
-            }
-            
+        for i, item in enumerate(items, start):
             embed.add_field(
-                name=f"{i}. {item['name']} {rarity_emoji.get(item['rarity'], '⚪')}",
-                value=f"Overall: **{item['overall']}** | Preço: **${item['price']:,}**\n"
-                      f"Time: {item['team']} | Posição: {item['position']}",
+                name=f"{i}. {item['name']} {RARITY_EMOJIS.get(item['rarity'], '⚪')}",
+                value=t('shop.item', overall=item['overall'], price=item['price'],
+                        team=item['team'], position=item['position']),
                 inline=False
             )
         
-        embed.set_footer(text="Use /comprar <número> para comprar um jogador")
+        footer = t('shop.footer')
+        if total_pages > 1:
+            footer = f"{t('common.page', page=page, total=total_pages)} • {footer}"
+        embed.set_footer(text=footer)
         return embed
     
     @staticmethod
-    def ranking_embed(rankings: Dict, category: str) -> discord.Embed:
-        """Cria embed de ranking"""
-        titles = {
-            'overall': f"{EMOJIS['star']} Ranking por Overall",
-            'money': f"{EMOJIS['money']} Ranking por Dinheiro",
-            'wins': f"{EMOJIS['trophy']} Ranking por Vitórias"
-        }
+    def roster_embed(team: Dict, players: List[Dict], summary: Dict, start: int = 1,
+                     page: int = 1, total_pages: int = 1, language: str = 'pt') -> discord.Embed:
+        """Cria embed de uma página do elenco"""
+        t = LanguageManager.translator(language)
+        embed = EmbedBuilder.create_embed(
+            t('roster.title', team=team['team_name']),
+            t('roster.summary', starters=summary['starters'], bench=summary['bench']),
+            COLORS['primary']
+        )
         
+        starters_text = ""
+        bench_text = ""
+        for i, player in enumerate(players, start):
+            line = f"{i}. {player['name']} ({player['overall']}) {RARITY_EMOJIS.get(player['rarity'], '⚪')}\n"
+            if player['is_starter']:
+                starters_text += line
+            else:
+                bench_text += line
+        
+        if starters_text:
+            embed.add_field(name=t('team.starters'), value=starters_text, inline=False)
+        if bench_text:
+            embed.add_field(name=t('team.bench'), value=bench_text, inline=False)
+        
+        best = summary['best_player']
+        embed.add_field(
+            name=t('common.stats'),
+            value=t('roster.stats', avg=summary['avg_overall'], best=best['name'],
+                    best_overall=best['overall'], total=summary['total']),
+            inline=False
+        )
+        
+        if total_pages > 1:
+            embed.set_footer(text=t('common.page', page=page, total=total_pages))
+        return embed
+    
+    @staticmethod
+    def ranking_embed(entries: List[Dict], category: str, page: int = 1, total_pages: int = 1,
+                      language: str = 'pt') -> discord.Embed:
+        """Cria embed de uma página do ranking"""
+        t = LanguageManager.translator(language)
         embed = discord.Embed(
-            title=titles.get(category, "Ranking"),
+            title=t(f"ranking.title_{category}"),
             color=COLORS['gold']
         )
         
-        ranking_data = rankings.get(category, [])
-        
-        for i, entry in enumerate(ranking_data[:10], 1):
-            if category == 'overall':
-                value = f"**{entry['username']}** - {entry['team_name']}\nOverall: **{entry['value']}**"
-            elif category == 'money':
-                value = f"**{entry['username']}** - {entry['team_name']}\nDinheiro: **${entry['value']:,}**"
-            else:  # wins
-                value = f"**{entry['username']}** - {entry['team_name']}\nVitórias: **{entry['value']}**"
+        for entry in entries:
+            value = t(f"ranking.entry_{category}", username=entry['username'],
+                      team=entry['team_name'], value=entry['value'])
             
             embed.add_field(
-                name=f"{i}. {entry['team_name']}",
+                name=f"{entry['position']}. {entry['team_name']}",
                 value=value,
                 inline=False
             )
         
+        if total_pages > 1:
+            embed.set_footer(text=t('common.page', page=page, total=total_pages))
         return embed
     
     @staticmethod
-    def match_embed(challenger: str, challenged: str, match_id: int) -> discord.Embed:
+    def match_embed(challenger: str, challenged: str, match_id: int, language: str = 'pt') -> discord.Embed:
         """Cria embed de desafio"""
+        t = LanguageManager.translator(language)
         embed = discord.Embed(
-            title=f"{EMOJIS['game']} Desafio de Basquete!",
-            description=f"**{challenger}** desafia **{challenged}** para uma partida!",
+            title=t('challenge.title'),
+            description=t('challenge.description', challenger=challenger, challenged=challenged),
             color=COLORS['warning']
         )
         
         embed.add_field(
-            name="🏆 Prêmio",
-            value=f"Ganhador: +${500}\nPerdedor: -${200}",
+            name=t('challenge.prize_title'),
+            value=t('challenge.prize'),
             inline=True
         )
         
         embed.add_field(
-            name="⏰ Tempo",
-            value="5 minutos de partida",
+            name=t('challenge.time_title'),
+            value=t('challenge.time'),
             inline=True
         )
         
@@ -217,68 +263,159 @@ class ButtonBuilder:
     """Classe para criar botões interativos"""
     
     @staticmethod
-    def accept_decline_buttons() -> List[discord.ui.Button]:
+    def accept_decline_buttons(language: str = 'pt') -> List[discord.ui.Button]:
         """Cria botões de aceitar/recusar"""
+        t = LanguageManager.translator(language)
         return [
             discord.ui.Button(
                 style=discord.ButtonStyle.green,
-                label="Aceitar",
+                label=t('buttons.accept'),
                 emoji=EMOJIS['check'],
                 custom_id="accept_match"
             ),
             discord.ui.Button(
                 style=discord.ButtonStyle.red,
-                label="Recusar",
+                label=t('buttons.decline'),
                 emoji=EMOJIS['cross'],
                 custom_id="decline_match"
             )
         ]
     
     @staticmethod
-    def shop_buttons() -> List[discord.ui.Button]:
+    def shop_buttons(language: str = 'pt') -> List[discord.ui.Button]:
         """Cria botões da loja"""
+        t = LanguageManager.translator(language)
         return [
             discord.ui.Button(
                 style=discord.ButtonStyle.primary,
-                label="Atualizar",
+                label=t('shop.refresh_short'),
                 emoji=EMOJIS['reload'],
                 custom_id="refresh_shop"
             ),
             discord.ui.Button(
                 style=discord.ButtonStyle.success,
-                label="Comprar Pack",
+                label=t('shop.buy_pack'),
                 emoji=EMOJIS['shop'],
                 custom_id="buy_pack"
             )
         ]
     
     @staticmethod
-    def match_buttons() -> List[discord.ui.Button]:
+    def page_buttons(prev_id: Optional[str], next_id: Optional[str],
+                     language: str = 'pt') -> List[discord.ui.Button]:
+        """Cria botões de anterior/próxima (desabilitados quando não há token)"""
+        t = LanguageManager.translator(language)
+        return [
+            discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label=t('common.previous'),
+                emoji="⬅️",
+                custom_id=prev_id or "page:none:prev",
+                disabled=prev_id is None
+            ),
+            discord.ui.Button(
+                style=discord.ButtonStyle.secondary,
+                label=t('common.next'),
+                emoji="➡️",
+                custom_id=next_id or "page:none:next",
+                disabled=next_id is None
+            )
+        ]
+    
+    @staticmethod
+    def match_buttons(language: str = 'pt') -> List[discord.ui.Button]:
         """Cria botões de partida"""
+        t = LanguageManager.translator(language)
         return [
             discord.ui.Button(
                 style=discord.ButtonStyle.primary,
-                label="Ofensiva",
+                label=t('buttons.offensive'),
                 emoji="⚡",
                 custom_id="offensive_play"
             ),
             discord.ui.Button(
                 style=discord.ButtonStyle.secondary,
-                label="Defensiva",
+                label=t('buttons.defensive'),
                 emoji="🛡️",
                 custom_id="defensive_play"
             ),
             discord.ui.Button(
                 style=discord.ButtonStyle.success,
-                label="Contra-ataque",
+                label=t('buttons.fast_break'),
                 emoji="🏃",
                 custom_id="fast_break"
             )
         ]
 
+class PageToken:
+    """Tokens de paginação sem estado, guardados no custom_id dos botões
+    
+    Formato: page:<tela>:<dono>:<página>:<direção>:<cursor>:<filtros...>
+    O cursor é a chave de ordenação do item na borda da página atual.
+    """
+    
+    PREFIX = "page"
+    
+    @staticmethod
+    def encode(view: str, owner_id: int, page: int, backwards: bool,
+               cursor: Tuple, *filters: Optional[str]) -> str:
+        """Gera o custom_id de um botão de paginação"""
+        parts = [
+            PageToken.PREFIX, view, str(owner_id), str(page),
+            'p' if backwards else 'n',
+            '.'.join(str(value) for value in cursor)
+        ]
+        parts.extend(value or '-' for value in filters)
+        return ':'.join(parts)
+    
+    @staticmethod
+    def decode(custom_id: str) -> Dict:
+        """Lê um custom_id gerado por encode"""
+        parts = custom_id.split(':')
+        return {
+            'view': parts[1],
+            'owner_id': int(parts[2]),
+            'page': int(parts[3]),
+            'backwards': parts[4] == 'p',
+            'cursor': parts[5].split('.'),
+            'filters': [None if value == '-' else value for value in parts[6:]]
+        }
+
 class GameLogic:
     """Classe com lógica do jogo"""
     
+    # Situações da partida interativa (textos em match.situations.* e match.actions.*)
+    MATCH_SITUATIONS = [
+        {'id': 'fast_break', 'actions': ['fast_break_run', 'fast_break_pass', 'fast_break_dribble']},
+        {'id': 'three', 'actions': ['three_clean', 'three_dribble', 'three_pass']},
+        {'id': 'inside', 'actions': ['inside_hook', 'inside_post', 'inside_spin']},
+        {'id': 'defense', 'actions': ['defense_block', 'defense_steal', 'defense_contest']},
+        {'id': 'special', 'actions': ['special_alley', 'special_crossover', 'special_tomahawk']},
+        {'id': 'quarter_end', 'actions': ['quarter_three', 'quarter_drive', 'quarter_pass']}
+    ]
+    
+    # Chance de acerto de cada ação, pontos do jogador no acerto e da CPU no erro
+    MATCH_ACTIONS = {
+        'fast_break_run': {'success_rate': 0.7, 'points': 2, 'cpu_points': 0},
+        'fast_break_pass': {'success_rate': 0.8, 'points': 2, 'cpu_points': 0},
+        'fast_break_dribble': {'success_rate': 0.6, 'points': 2, 'cpu_points': 0},
+        'three_clean': {'success_rate': 0.4, 'points': 3, 'cpu_points': 0},
+        'three_dribble': {'success_rate': 0.3, 'points': 3, 'cpu_points': 0},
+        'three_pass': {'success_rate': 0.9, 'points': 2, 'cpu_points': 0},
+        'inside_hook': {'success_rate': 0.6, 'points': 2, 'cpu_points': 0},
+        'inside_post': {'success_rate': 0.7, 'points': 2, 'cpu_points': 0},
+        'inside_spin': {'success_rate': 0.5, 'points': 2, 'cpu_points': 0},
+        'defense_block': {'success_rate': 0.3, 'points': 0, 'cpu_points': 2},
+        'defense_steal': {'success_rate': 0.4, 'points': 0, 'cpu_points': 2},
+        'defense_contest': {'success_rate': 0.7, 'points': 0, 'cpu_points': 2},
+        'special_alley': {'success_rate': 0.2, 'points': 3, 'cpu_points': 0},
+        'special_crossover': {'success_rate': 0.4, 'points': 2, 'cpu_points': 0},
+        'special_tomahawk': {'success_rate': 0.3, 'points': 3, 'cpu_points': 0},
+        'quarter_three': {'success_rate': 0.3, 'points': 3, 'cpu_points': 0},
+        'quarter_drive': {'success_rate': 0.6, 'points': 2, 'cpu_points': 0},
+        'quarter_pass': {'success_rate': 0.8, 'points': 2, 'cpu_points': 0}
+    }
+    
     @staticmethod
     def calculate_team_overall(players: List[Dict]) -> float:
         """Calcula o overall médio do time"""
@@ -323,55 +460,254 @@ class GameLogic:
         """Obtém cor baseada na raridade"""
         return RARITIES.get(rarity, {}).get('color', COLORS['primary'])
 
+class Translator:
+    """Tabela de textos já compilada de um idioma
+    
+    Textos sem campos dinâmicos ficam prontos em _texts; os demais guardam o
+    str.format do template já com os valores fixos (economia, emojis) aplicados.
+    """
+    
+    __slots__ = ('language', '_texts', '_templates')
+    
+    def __init__(self, language: str, texts: Dict[str, str], templates: Dict[str, Callable[..., str]]):
+        self.language = language
+        self._texts = texts
+        self._templates = templates
+    
+    def __call__(self, key: str, **values) -> str:
+        """Obtém o texto da chave (a própria chave quando não existe no catálogo)"""
+        text = self._texts.get(key)
+        if text is not None:
+            return text
+        template = self._templates.get(key)
+        if template is None:
+            return key
+        return template(**values)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._texts or key in self._templates
+
 class LanguageManager:
-    """Gerenciador de idiomas"""
-    
-    TRANSLATIONS = {
-        'pt': {
-            'welcome': 'Bem-vindo ao HoopCore!',
-            'team_created': 'Time criado com sucesso!',
-            'player_acquired': 'Jogador adquirido!',
-            'insufficient_money': 'Dinheiro insuficiente!',
-            'match_challenge': 'Desafio enviado!',
-            'match_accepted': 'Partida aceita!',
-            'match_declined': 'Partida recusada!',
-            'victory': 'Vitória!',
-            'defeat': 'Derrota!',
-            'shop_refreshed': 'Loja atualizada!',
-            'daily_reward': 'Recompensa diária coletada!',
-            'free_pack': 'Pack gratuito aberto!'
-        },
-        'en': {
-            'welcome': 'Welcome to HoopCore!',
-            'team_created': 'Team created successfully!',
-            'player_acquired': 'Player acquired!',
-            'insufficient_money': 'Insufficient money!',
-            'match_challenge': 'Challenge sent!',
-            'match_accepted': 'Match accepted!',
-            'match_declined': 'Match declined!',
-            'victory': 'Victory!',
-            'defeat': 'Defeat!',
-            'shop_refreshed': 'Shop refreshed!',
-            'daily_reward': 'Daily reward collected!',
-            'free_pack': 'Free pack opened!'
-        },
-        'es': {
-            'welcome': '¡Bienvenido a HoopCore!',
-            'team_created': '¡Equipo creado exitosamente!',
-            'player_acquired': '¡Jugador adquirido!',
-            'insufficient_money': '¡Dinero insuficiente!',
-            'match_challenge': '¡Desafío enviado!',
-            'match_accepted': '¡Partido aceptado!',
-            'match_declined': '¡Partido rechazado!',
-            'victory': '¡Victoria!',
-            'defeat': '¡Derrota!',
-            'shop_refreshed': '¡Tienda actualizada!',
-            'daily_reward': '¡Recompensa diaria recolectada!',
-            'free_pack': '¡Pack gratuito abierto!'
-        }
+    """Gerenciador de idiomas: compila os catálogos de locales/ em tabelas planas"""
+    
+    CATALOG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'locales')
+    DEFAULT_LANGUAGE = LOCALIZATION['default_language']
+    
+    # Valores fixos aplicados já na compilação ({economy[pack_cost]}, {emojis[shop]}, {minutes[free_pack]})
+    STATIC_VALUES = {
+        'economy': ECONOMY,
+        'emojis': EMOJIS,
+        'minutes': {name: seconds // 60 for name, seconds in TIMERS.items()}
     }
     
+    _translators: Dict[str, Translator] = {}
+    
+    @staticmethod
+    def compile(catalog_dir: str = None) -> Dict[str, Translator]:
+        """Carrega os catálogos e monta um Translator por idioma
+        
+        Chaves ausentes em um idioma caem para o texto do idioma padrão.
+        """
+        catalog_dir = catalog_dir or LanguageManager.CATALOG_DIR
+        catalogs = {}
+        for language in LANGUAGES:
+            with open(os.path.join(catalog_dir, f"{language}.json"), encoding='utf-8') as f:
+                catalogs[language] = LanguageManager._flatten(json.load(f))
+        
+        default = catalogs[LanguageManager.DEFAULT_LANGUAGE]
+        translators = {}
+        for language, catalog in catalogs.items():
+            texts = {}
+            templates = {}
+            for key, template in {**default, **catalog}.items():
+                text, dynamic = LanguageManager._prepare(template)
+                if dynamic:
+                    templates[key] = text.format
+                else:
+                    texts[key] = text
+            translators[language] = Translator(language, texts, templates)
+        
+        LanguageManager._translators = translators
+        return translators
+    
     @staticmethod
-    def get_text(key: str, language: str = 'pt') -> str:
+    def _flatten(catalog: Dict, prefix: str = '') -> Dict[str, str]:
+        """Transforma o catálogo aninhado em chaves com ponto (match.actions.three_clean.label)"""
+        flat = {}
+        for key, value in catalog.items():
+            if isinstance(value, dict):
+                flat.update(LanguageManager._flatten(value, f"{prefix}{key}."))
+            else:
+                flat[f"{prefix}{key}"] = value
+        return flat
+    
+    @staticmethod
+    def _prepare(template: str) -> Tuple[str, bool]:
+        """Aplica os valores fixos do template
+        
+        Retorna (texto, dinâmico): se sobrar algum campo, o texto volta como
+        template de str.format; senão volta como texto final.
+        """
+        formatter = string.Formatter()
+        parts = []
+        dynamic = False
+        for literal, field, spec, conversion in formatter.parse(template):
+            parts.append((literal, None))
+            if field is None:
+                continue
+            
+            root = re.match(r'[^.\[]*', field).group(0)
+            if root in LanguageManager.STATIC_VALUES:
+                value, _ = formatter.get_field(field, (), LanguageManager.STATIC_VALUES)
+                value = formatter.convert_field(value, conversion)
+                parts.append((formatter.format_field(value, spec), None))
+            else:
+                dynamic = True
+                parts.append((None, '{' + field + (f"!{conversion}" if conversion else '')
+                              + (f":{spec}" if spec else '') + '}'))
+        
+        if not dynamic:
+            return ''.join(text for text, _ in parts), False
+        
+        # Texto literal precisa de chaves escapadas para continuar sendo um template válido
+        return ''.join(
+            field if text is None else text.replace('{', '{{').replace('}', '}}')
+            for text, field in parts
+        ), True
+    
+    @staticmethod
+    def translator(language: str = 'pt') -> Translator:
+        """Obtém o Translator do idioma (o padrão quando o idioma não existe)"""
+        translators = LanguageManager._translators or LanguageManager.compile()
+        return translators.get(language) or translators[LanguageManager.DEFAULT_LANGUAGE]
+    
+    @staticmethod
+    def get_text(key: str, language: str = 'pt', **values) -> str:
         """Obtém texto traduzido"""
-        return LanguageManager.TRANSLATIONS.get(language, LanguageManager.TRANSLATIONS['pt']).get(key, key)
+        return LanguageManager.translator(language)(key, **values)
+    
+    @staticmethod
+    def from_discord_locale(locale) -> str:
+        """Converte o locale do Discord (pt-BR, en-US, es-ES...) para um idioma do bot"""
+        language = str(locale or '').split('-')[0]
+        return language if language in LANGUAGES else LanguageManager.DEFAULT_LANGUAGE
+
+class LocaleResolver:
+    """Resolve o idioma de cada interação
+    
+    Ordem: idioma do usuário > idioma do servidor > idioma do cliente do Discord.
+    As preferências salvas ficam em cache para não consultar o banco a cada interação.
+    """
+    
+    _MISSING = object()
+    
+    def __init__(self, db, max_entries: int = LOCALIZATION['cache_size']):
+        self.db = db
+        self.max_entries = max_entries
+        self._users: Dict[int, Optional[str]] = {}
+        self._guilds: Dict[int, Optional[str]] = {}
+        cache_registry.register('locale_users', lambda: self._users)
+        cache_registry.register('locale_guilds', lambda: self._guilds)
+    
+    async def resolve(self, interaction: discord.Interaction) -> str:
+        """Retorna o idioma da interação"""
+        user_id = interaction.user.id
+        guild_id = interaction.guild_id
+        
+        language = self._users.get(user_id, self._MISSING)
+        if language is self._MISSING or (not language and guild_id and guild_id not in self._guilds):
+            language, guild_language = await self.db.get_language_settings(user_id, guild_id)
+            self._remember(self._users, user_id, language)
+            if guild_id:
+                self._remember(self._guilds, guild_id, guild_language)
+        
+        if not language and guild_id:
+            language = self._guilds.get(guild_id)
+        return language or LanguageManager.from_discord_locale(interaction.locale)
+    
+    def cached_translator(self, interaction: discord.Interaction) -> Translator:
+        """Translator só com o que já está em cache (sem consultar o banco, ex: banco sobrecarregado)"""
+        language = self._users.get(interaction.user.id) or self._guilds.get(interaction.guild_id)
+        return LanguageManager.translator(language or LanguageManager.from_discord_locale(interaction.locale))
+    
+    async def translator(self, interaction: discord.Interaction) -> Translator:
+        """Translator da interação (resolvido uma vez e guardado em interaction.extras)"""
+        translator = interaction.extras.get('translator')
+        if translator is None:
+            translator = LanguageManager.translator(await self.resolve(interaction))
+            interaction.extras['translator'] = translator
+        return translator
+    
+    async def for_guild(self, guild: discord.Guild) -> Translator:
+        """Translator para mensagens do servidor sem interação (ex: boas-vindas)"""
+        language = self._guilds.get(guild.id, self._MISSING)
+        if language is self._MISSING:
+            _, language = await self.db.get_language_settings(None, guild.id)
+            self._remember(self._guilds, guild.id, language)
+        return LanguageManager.translator(language or LanguageManager.from_discord_locale(guild.preferred_locale))
+    
+    async def set_user_language(self, user_id: int, language: Optional[str]) -> bool:
+        """Salva o idioma do usuário (None volta a seguir o servidor)"""
+        success = await self.db.set_user_language(user_id, language)
+        if success:
+            self._remember(self._users, user_id, language)
+        return success
+    
+    async def set_guild_language(self, guild_id: int, language: str) -> bool:
+        """Salva o idioma padrão do servidor"""
+        success = await self.db.set_server_language(guild_id, language)
+        if success:
+            self._remember(self._guilds, guild_id, language)
+        return success
+    
+    def _remember(self, cache: Dict, key: int, language: Optional[str]):
+        if key not in cache and len(cache) >= self.max_entries:
+            # Descarta a entrada mais antiga
+            del cache[next(iter(cache))]
+        cache[key] = language
+
+class PlayerCardCache:
+    """Cache dos cards do catálogo, por jogador, idioma e show_details"""
+    
+    def __init__(self):
+        self._payloads: Dict[Tuple[int, str, bool], Dict] = {}
+        self.hits = 0
+        self.misses = 0
+        cache_registry.register('player_cards', lambda: self._payloads)
+    
+    def warm(self, players: List[Dict]):
+        """Pré-calcula os cards de todo o catálogo em todos os idiomas"""
+        self.invalidate()
+        for player in players:
+            for language in LANGUAGES:
+                for show_details in (True, False):
+                    self._store(player, show_details, language)
+    
+    def invalidate(self):
+        """Descarta todos os cards (chamado quando o catálogo recarrega)"""
+        self._payloads.clear()
+    
+    def get(self, player: Dict, show_details: bool = True, language: str = 'pt') -> discord.Embed:
+        """Retorna uma cópia do card, montando-o na primeira vez"""
+        payload = self._payloads.get((player['player_id'], language, show_details))
+        if payload is None:
+            self.misses += 1
+            payload = self._store(player, show_details, language)
+        else:
+            self.hits += 1
+        
+        # Copia a lista de campos para que quem chamou possa editar o embed à vontade
+        data = dict(payload)
+        data['fields'] = [dict(field) for field in payload['fields']]
+        return discord.Embed.from_dict(data)
+    
+    def _store(self, player: Dict, show_details: bool, language: str) -> Dict:
+        payload = EmbedBuilder.build_player_card(player, show_details, language).to_dict()
+        payload['fields'] = [dict(field) for field in payload['fields']]
+        self._payloads[(player['player_id'], language, show_details)] = payload
+        return payload
+    
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+player_card_cache = PlayerCardCache()